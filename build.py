@@ -12,6 +12,7 @@ VENV_PYTHON = VENV_DIR / "bin" / "python"
 REQUIREMENTS_FILE = PERIODICA_DIR / "requirements.txt"
 PYPROJECT_FILE = PERIODICA_DIR / "pyproject.toml"
 PERIODICA_SCRIPT = PERIODICA_DIR / "periodica.sh"
+VERSION_MODULE = PERIODICA_DIR / "src" / "lib" / "version.py"
 BIN_PATH = pathlib.Path.home() / ".local" / "bin"
 SYMLINK_TARGET = BIN_PATH / "periodica"
 OS = platform.system()
@@ -38,6 +39,15 @@ else:
     print("Neither requirements.txt nor pyproject.toml found. Aborting...")
     sys.exit(0)
 
+# Embed the version so frozen builds, which ship without pyproject.toml, can still report it
+if PYPROJECT_FILE.exists():
+    import tomllib
+    with open(PYPROJECT_FILE, "rb") as file:
+        project_version = tomllib.load(file).get("project", {}).get("version")
+    if project_version:
+        VERSION_MODULE.write_text(f'VERSION = "{project_version}"\n', encoding="utf-8")
+        print(f"Embedded version {project_version} into {VERSION_MODULE.relative_to(PERIODICA_DIR)}.")
+
 source_display = str(PERIODICA_SCRIPT).replace(str(pathlib.Path.home()), "~")
 print(f"Would you like this script to make a symlink from {source_display} -> ~/.local/bin/periodica?")
 print("THIS STEP IS MANDATORY FOR STANDARD INSTALLATIONS TO MAKE IT WORK. If you do not want a symlink at all, type the N key and hit Enter. (Y/n)")
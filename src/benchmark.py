@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+import sys, os, io, json, time, statistics, subprocess, platform, contextlib, datetime, argparse
+from typing import Any, Callable
+from pathlib import Path
+
+import lib.directories
+from lib.terminal import bold, dim, fore, RED, GREEN, YELLOW
+from lib.directories import MAIN_SCRIPT, BENCHMARK_DIR
+from lib.loader import configure_logging
+
+# Usage: python3 src/benchmark.py [--quick] [--data <dir>] [--compare <previous result JSON>] [--threshold <ratio>]
+#        python3 src/benchmark.py --memory [--data <dir>]
+# Everything runs offline against the local data files (or the dataset in --data, e.g. one made by src/generate.py).
+# Results are saved to ~/.periodica/benchmarks.
+# --memory compares the raw dict tree against periodica's record types; without --data it measures a full
+# synthetic dataset (118 elements, 3000 nuclides).
+
+DEFAULT_REPEAT = 7
+QUICK_REPEAT = 3
+COLD_START_RUNS = 5
+DEFAULT_THRESHOLD = 0.20
+
+ISOTOPE_NOTATIONS = ["6Li", "li-6", "Li6", "10Li-m2", "3H", "14 C", "be-9m", "999Xx"]
+COMPARE_FACTORS = ["atomic_mass", "melting_point", "isotopes", "covalent_radius"]
+
+def load_namespace() -> dict[str, Any]:
+    # main.py only runs its command dispatcher as __main__, so executing it under another name
+    # just defines everything; the data is then loaded the same way an element lookup would.
+    namespace: dict[str, Any] = {"__name__": "__benchmark__", "__file__": str(MAIN_SCRIPT)}
+    code = compile(MAIN_SCRIPT.read_text(encoding="utf-8"), str(MAIN_SCRIPT), "exec")
+    exec(code, namespace)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        namespace["load_data"]()
+
+    return namespace
+
+MEMORY_PROBE = """
+import sys, gc, json
+sys.path.insert(0, sys.argv[1])
+mode, data_dir, metric = sys.argv[2], sys.argv[3], sys.argv[4]
+
+if metric == "heap":
+    import tracemalloc
+    tracemalloc.start()
+
+from periodica.records import build_records
+
+def resident_kib():
+    try:
+        with open("/proc/self/status", encoding="utf-8") as file:
+            return next(int(line.split()[1]) for line in file if line.startswith("VmRSS:"))
+    except (OSError, StopIteration):
+        import resource
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage // 1024 if sys.platform == "darwin" else usage
+
+def release():
+    gc.collect()
+    try:
+        import ctypes
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+kept = None
+if mode != "empty":
+    with open(data_dir + "/elements.json", "rb") as file:
+        elements = json.load(file)
+    with open(data_dir + "/isotopes.json", "rb") as file:
+        isotopes = json.load(file)
+    kept = (elements, isotopes) if mode == "dicts" else build_records(elements, isotopes, consume=True)
+    del elements, isotopes
+release()
+
+print(tracemalloc.get_traced_memory()[0] if metric == "heap" else resident_kib() * 1024)
+"""
+
+def memory_usage(mode: str, data_dir: Path, metric: str) -> int:
+    completed = subprocess.run(
+        [sys.executable, "-c", MEMORY_PROBE, str(MAIN_SCRIPT.parent), mode, str(data_dir), metric],
+        capture_output=True, text=True, check=True
+    )
+    return int(completed.stdout.strip())
+
+def memory_main(data_dir: Path | None) -> int:
+    import tempfile
+    from generate import generate_dataset, DEFAULT_ELEMENTS, DEFAULT_NUCLIDES, DEFAULT_METASTABLE_RATIO
+
+    with tempfile.TemporaryDirectory() as temporary:
+        if data_dir is None:
+            data_dir = Path(temporary)
+            elements, isotopes = generate_dataset(DEFAULT_ELEMENTS, DEFAULT_NUCLIDES, DEFAULT_METASTABLE_RATIO, 0)
+            for file_name, data in (("elements.json", elements), ("isotopes.json", isotopes)):
+                with open(data_dir / file_name, "w", encoding="utf-8") as file:
+                    json.dump(data, file, ensure_ascii=False)
+
+        with open(data_dir / "isotopes.json", "rb") as file:
+            nuclides = sum(len(element_isotopes) for element_isotopes in json.load(file).values())
+
+        usage = {
+            metric: {mode: memory_usage(mode, data_dir, metric) for mode in ("empty", "dicts", "records")}
+            for metric in ("rss", "heap")
+        }
+
+    print(bold(f"Memory held by a {nuclides}-nuclide dataset from {data_dir}"))
+    print(bold(f"{'Representation':<24} {'resident set':>14} {'live heap':>14}"))
+    for mode, label in (("dicts", "dict tree"), ("records", "__slots__ records")):
+        rss = (usage["rss"][mode] - usage["rss"]["empty"]) / 2 ** 20
+        heap = (usage["heap"][mode] - usage["heap"]["empty"]) / 2 ** 20
+        print(f"{label:<24} {rss:>11.2f}MiB {heap:>11.2f}MiB")
+
+    dict_heap = usage["heap"]["dicts"] - usage["heap"]["empty"]
+    record_heap = usage["heap"]["records"] - usage["heap"]["empty"]
+    if dict_heap > 0:
+        print(f"\nThe records use {record_heap / dict_heap:.0%} of the dict tree's live heap.")
+    print(dim("The resident set still includes memory freed after parsing that the allocator kept for reuse."))
+    return 0
+
+def measure(function: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    # Calibrate the number of calls per sample so that each sample takes at least ~20ms
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= 0.02 or number >= 100_000:
+            break
+        number *= 10
+
+    samples: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        samples.append((time.perf_counter() - start) / number)
+
+    return {
+        "number": number,
+        "repeat": repeat,
+        "best_us": round(min(samples) * 1_000_000, 3),
+        "median_us": round(statistics.median(samples) * 1_000_000, 3),
+    }
+
+def silenced(function: Callable[[], Any]) -> Callable[[], Any]:
+    sink = open(os.devnull, "w", encoding="utf-8")
+
+    def wrapper() -> Any:
+        with contextlib.redirect_stdout(sink):
+            try:
+                return function()
+            except SystemExit:
+                return None
+
+    return wrapper
+
+def cold_start(arguments: list[str], runs: int) -> dict[str, Any]:
+    samples: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, str(MAIN_SCRIPT), *arguments], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL, check=False)
+        samples.append(time.perf_counter() - start)
+
+    return {
+        "number": 1,
+        "repeat": runs,
+        "best_us": round(min(samples) * 1_000_000, 3),
+        "median_us": round(statistics.median(samples) * 1_000_000, 3),
+    }
+
+def build_cases(namespace: dict[str, Any]) -> dict[str, Callable[[], Any]]:
+    elements: dict[str, Any] = namespace["full_element_data"]
+    isotopes: dict[str, Any] = namespace["full_isotope_data"]
+
+    find_element = namespace["find_element"]
+    find_isotope = namespace["find_isotope"]
+    parse_isotope = namespace["parse_isotope"]
+    calculate_ionization_series = namespace["calculate_ionization_series"]
+    print_isotope = namespace["print_isotope"]
+    show_decay = namespace["show_decay"]
+
+    queries: list[str] = []
+    for element in elements.values():
+        queries.extend([element["general"]["fullname"].lower(), element["general"]["symbol"].lower(), str(element["general"]["atomic_number"])])
+
+    def find_element_exact():
+        for query in queries:
+            find_element(query)
+
+    def find_element_fuzzy():
+        find_element("hydrogne")
+        find_element("zzzz")
+
+    def find_isotope_notations():
+        # Export mode makes recognize_isotope return the record instead of printing it
+        namespace["export_enabled"] = True
+        for notation in ISOTOPE_NOTATIONS:
+            find_isotope(notation)
+        namespace["export_enabled"] = False
+
+    def parse_notations():
+        for notation in ISOTOPE_NOTATIONS:
+            parse_isotope(notation)
+
+    def ionization_series():
+        for element in elements.values():
+            calculate_ionization_series(element["electronic"]["subshells"], element["general"]["atomic_number"], element["electronic"]["ionization_energy"])
+
+    def render_isotopes():
+        for element_name, element_isotopes in isotopes.items():
+            for isotope, information in element_isotopes.items():
+                print_isotope(isotope, information, element_name)
+
+    decay_lists = [
+        (information["decay"], f"{element_name}-{isotope}")
+        for element_name, element_isotopes in isotopes.items()
+        for isotope, information in element_isotopes.items()
+        if isinstance(information.get("decay"), list)
+    ]
+
+    def render_decays():
+        for decays, display_name in decay_lists:
+            show_decay(decays, display_name)
+
+    cases: dict[str, Callable[[], Any]] = {
+        "find_element.exact": find_element_exact,
+        "find_element.fuzzy": find_element_fuzzy,
+        "find_isotope.notations": silenced(find_isotope_notations),
+        "parse_isotope": parse_notations,
+        "calculate_ionization_series": silenced(ionization_series),
+        "print_isotope.all": silenced(render_isotopes),
+        "show_decay.all": silenced(render_decays),
+    }
+
+    for factor in COMPARE_FACTORS:
+        def compare(factor: str = factor):
+            namespace["positional_arguments"] = [factor]
+            namespace["f_compare"]()
+
+        cases[f"f_compare.{factor}"] = silenced(compare)
+
+    return cases
+
+def compare_results(current: dict[str, Any], previous: dict[str, Any], threshold: float) -> bool:
+    regressed = False
+
+    print()
+    print(bold(f"Compared against {previous.get('version', '?')} ({previous.get('timestamp', '?')}):"))
+    for name, result in current["results"].items():
+        if name not in previous.get("results", {}):
+            print(f"  {name:<36} {dim('(new)')}")
+            continue
+
+        before = previous["results"][name]["median_us"]
+        after = result["median_us"]
+        ratio = after / before if before else 1.0
+
+        if ratio > 1 + threshold:
+            regressed = True
+            verdict = fore(f"{ratio:.2f}x slower", RED)
+        elif ratio < 1 - threshold:
+            verdict = fore(f"{1 / ratio:.2f}x faster", GREEN)
+        else:
+            verdict = dim("unchanged")
+
+        print(f"  {name:<36} {before:>14.3f}us -> {after:>14.3f}us  {verdict}")
+
+    return regressed
+
+def parse_arguments(arguments: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="benchmark.py",
+        description="Runs the offline benchmark suite and saves the results to ~/.periodica/benchmarks.",
+    )
+    parser.add_argument("--quick", action="store_true", help=f"repeat each case {QUICK_REPEAT} times instead of {DEFAULT_REPEAT}")
+    parser.add_argument("--data", type=lambda value: Path(value).expanduser().resolve(), metavar="DIR", help="benchmark the dataset in DIR")
+    parser.add_argument("--compare", metavar="FILE", help="compare against a previous result JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, metavar="RATIO",
+        help=f"slowdown ratio counted as a regression with --compare (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--memory", action="store_true", help="compare the memory use of the dict tree and the record types")
+    return parser.parse_args(arguments)
+
+def benchmark_main(arguments: list[str]) -> int:
+    options = parse_arguments(arguments)
+    configure_logging()
+    repeat = QUICK_REPEAT if options.quick else DEFAULT_REPEAT
+    previous_file = options.compare
+    threshold = options.threshold
+
+    if options.memory:
+        return memory_main(options.data)
+
+    if options.data is not None:
+        data_dir = options.data
+        # The environment variable covers the cold start subprocesses, the patch covers the in-process namespace
+        os.environ["PERIODICA_DATA_DIR"] = str(data_dir)
+        lib.directories.ELEMENT_DATA_FILE = data_dir / "elements.json"
+        lib.directories.ISOTOPE_DATA_FILE = data_dir / "isotopes.json"
+
+    from update import fetch_toml
+    namespace = load_namespace()
+    cases = build_cases(namespace)
+
+    results: dict[str, Any] = {}
+    print(bold(f"{'Benchmark':<36} {'best':>14} {'median':>14}"))
+    for name, function in cases.items():
+        results[name] = measure(function, repeat)
+        print(f"{name:<36} {results[name]['best_us']:>12.3f}us {results[name]['median_us']:>12.3f}us")
+
+    cold_runs = QUICK_REPEAT if options.quick else COLD_START_RUNS
+    for name, command in {"cold_start.version": ["--version"], "cold_start.element": ["--raw", "lithium"]}.items():
+        results[name] = cold_start(command, cold_runs)
+        print(f"{name:<36} {results[name]['best_us']:>12.3f}us {results[name]['median_us']:>12.3f}us")
+
+    report = {
+        "version": fetch_toml(),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "dataset": {
+            "path": str(lib.directories.ELEMENT_DATA_FILE.parent),
+            "elements": len(namespace["full_element_data"]),
+            "nuclides": sum(len(isotopes) for isotopes in namespace["full_isotope_data"].values()),
+        },
+        "results": results,
+    }
+
+    BENCHMARK_DIR.mkdir(exist_ok=True)
+    output_file = BENCHMARK_DIR / f"{report['version']}_{report['timestamp'].replace(':', '-')}.json"
+    with open(output_file, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=4)
+    print(f"\nResults saved to {output_file}")
+
+    if previous_file:
+        try:
+            with open(Path(previous_file).expanduser(), "r", encoding="utf-8") as file:
+                previous = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError) as error:
+            print(fore(f"Could not read the previous results: {error}", YELLOW))
+            return 1
+
+        if compare_results(report, previous, threshold):
+            print(fore(f"\nRegressions beyond {threshold:.0%} detected.", RED))
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(benchmark_main(sys.argv[1:]))
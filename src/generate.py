@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+import sys, json, random, argparse
+from typing import Any
+from pathlib import Path
+
+from lib.terminal import bold
+from lib.directories import SYNTHETIC_DATA_DIR
+
+# Usage: python3 src/generate.py [--elements N] [--nuclides N] [--metastable RATIO] [--seed N] [--output DIR]
+# Writes schema-compatible elements.json / isotopes.json files for scale testing.
+# Point the program (or src/benchmark.py --data) at them with PERIODICA_DATA_DIR=DIR.
+
+DEFAULT_ELEMENTS = 118
+DEFAULT_NUCLIDES = 3000
+DEFAULT_METASTABLE_RATIO = 0.15
+
+ELEMENT_NAMES = [
+    ("H", "Hydrogen"), ("He", "Helium"), ("Li", "Lithium"), ("Be", "Beryllium"), ("B", "Boron"), ("C", "Carbon"),
+    ("N", "Nitrogen"), ("O", "Oxygen"), ("F", "Fluorine"), ("Ne", "Neon"), ("Na", "Sodium"), ("Mg", "Magnesium"),
+    ("Al", "Aluminium"), ("Si", "Silicon"), ("P", "Phosphorus"), ("S", "Sulfur"), ("Cl", "Chlorine"), ("Ar", "Argon"),
+    ("K", "Potassium"), ("Ca", "Calcium"), ("Sc", "Scandium"), ("Ti", "Titanium"), ("V", "Vanadium"), ("Cr", "Chromium"),
+    ("Mn", "Manganese"), ("Fe", "Iron"), ("Co", "Cobalt"), ("Ni", "Nickel"), ("Cu", "Copper"), ("Zn", "Zinc"),
+    ("Ga", "Gallium"), ("Ge", "Germanium"), ("As", "Arsenic"), ("Se", "Selenium"), ("Br", "Bromine"), ("Kr", "Krypton"),
+    ("Rb", "Rubidium"), ("Sr", "Strontium"), ("Y", "Yttrium"), ("Zr", "Zirconium"), ("Nb", "Niobium"), ("Mo", "Molybdenum"),
+    ("Tc", "Technetium"), ("Ru", "Ruthenium"), ("Rh", "Rhodium"), ("Pd", "Palladium"), ("Ag", "Silver"), ("Cd", "Cadmium"),
+    ("In", "Indium"), ("Sn", "Tin"), ("Sb", "Antimony"), ("Te", "Tellurium"), ("I", "Iodine"), ("Xe", "Xenon"),
+    ("Cs", "Caesium"), ("Ba", "Barium"), ("La", "Lanthanum"), ("Ce", "Cerium"), ("Pr", "Praseodymium"), ("Nd", "Neodymium"),
+    ("Pm", "Promethium"), ("Sm", "Samarium"), ("Eu", "Europium"), ("Gd", "Gadolinium"), ("Tb", "Terbium"), ("Dy", "Dysprosium"),
+    ("Ho", "Holmium"), ("Er", "Erbium"), ("Tm", "Thulium"), ("Yb", "Ytterbium"), ("Lu", "Lutetium"), ("Hf", "Hafnium"),
+    ("Ta", "Tantalum"), ("W", "Tungsten"), ("Re", "Rhenium"), ("Os", "Osmium"), ("Ir", "Iridium"), ("Pt", "Platinum"),
+    ("Au", "Gold"), ("Hg", "Mercury"), ("Tl", "Thallium"), ("Pb", "Lead"), ("Bi", "Bismuth"), ("Po", "Polonium"),
+    ("At", "Astatine"), ("Rn", "Radon"), ("Fr", "Francium"), ("Ra", "Radium"), ("Ac", "Actinium"), ("Th", "Thorium"),
+    ("Pa", "Protactinium"), ("U", "Uranium"), ("Np", "Neptunium"), ("Pu", "Plutonium"), ("Am", "Americium"), ("Cm", "Curium"),
+    ("Bk", "Berkelium"), ("Cf", "Californium"), ("Es", "Einsteinium"), ("Fm", "Fermium"), ("Md", "Mendelevium"), ("No", "Nobelium"),
+    ("Lr", "Lawrencium"), ("Rf", "Rutherfordium"), ("Db", "Dubnium"), ("Sg", "Seaborgium"), ("Bh", "Bohrium"), ("Hs", "Hassium"),
+    ("Mt", "Meitnerium"), ("Ds", "Darmstadtium"), ("Rg", "Roentgenium"), ("Cn", "Copernicium"), ("Nh", "Nihonium"), ("Fl", "Flerovium"),
+    ("Mc", "Moscovium"), ("Lv", "Livermorium"), ("Ts", "Tennessine"), ("Og", "Oganesson"),
+]
+
+# Subshells in Madelung (aufbau) filling order
+FILLING_ORDER = ["1s", "2s", "2p", "3s", "3p", "4s", "3d", "4p", "5s", "4d", "5p", "6s", "4f", "5d", "6p", "7s", "5f", "6d", "7p"]
+SUBSHELL_CAPACITIES = {"s": 2, "p": 6, "d": 10, "f": 14}
+
+ELEMENT_TYPES = {
+    "Alkali metal": {3, 11, 19, 37, 55, 87},
+    "Alkali earth metal": {4, 12, 20, 38, 56, 88},
+    "Noble gas": {2, 10, 18, 36, 54, 86, 118},
+    "Metalloid": {5, 14, 32, 33, 51, 52},
+    "Reactive nonmetal": {1, 6, 7, 8, 9, 15, 16, 17, 34, 35, 53},
+    "Lanthanide": set(range(57, 72)),
+    "Actinide": set(range(89, 104)),
+    "Post-transition metal": {13, 31, 49, 50, 81, 82, 83, 84, 85, 113, 114, 115, 116, 117},
+}
+
+HALF_LIFE_UNITS = ["yoctoseconds", "zeptoseconds", "attoseconds", "nanoseconds", "microseconds", "milliseconds", "seconds", "minutes", "hours", "days", "years"]
+CONDUCTIVITY_TYPES = ["Conductor", "Semiconductor", "Insulator", "Superconductor", "Unsure"]
+STRUCTURES = [
+    ("Metallic", "body-centered cubic", ["a"]),
+    ("Metallic", "face-centered cubic", ["a"]),
+    ("Metallic", "hexagonal close-packed", ["a", "c"]),
+    ("Covalent network", "diamond cubic", ["a"]),
+    ("Solid molecular", "low temp, cubic", ["a"]),
+]
+
+def electron_configuration(atomic_number: int) -> list[str]:
+    subshells: list[str] = []
+    remaining = atomic_number
+    for subshell in FILLING_ORDER:
+        if remaining <= 0:
+            break
+        count = min(remaining, SUBSHELL_CAPACITIES[subshell[1]])
+        subshells.append(f"{subshell}{count}")
+        remaining -= count
+    return subshells
+
+def shell_counts(subshells: list[str]) -> list[int]:
+    shells: dict[int, int] = {}
+    for subshell in subshells:
+        principal, count = int(subshell[0]), int(subshell[2:])
+        shells[principal] = shells.get(principal, 0) + count
+    return [shells.get(principal, 0) for principal in range(1, max(shells) + 1)]
+
+def coordinates(atomic_number: int, subshells: list[str]) -> tuple[int, int, str]:
+    period = max(int(subshell[0]) for subshell in subshells)
+    last = subshells[-1]
+    block = last[1]
+    outer_s = next((int(subshell[2:]) for subshell in subshells if subshell.startswith(f"{period}s")), 0)
+
+    if atomic_number == 2:
+        return period, 18, "s"
+    if block == "s":
+        return period, outer_s, block
+    if block == "p":
+        return period, 12 + int(last[2:]), block
+    if block == "d":
+        return period, 2 + int(last[2:]), block
+    return period, 3, block
+
+def element_type(atomic_number: int, block: str) -> str:
+    for name, numbers in ELEMENT_TYPES.items():
+        if atomic_number in numbers:
+            return name
+    return "Transition metal" if block == "d" else "Unknown"
+
+def maybe(rng: random.Random, value: Any, chance: float = 0.8) -> Any:
+    return value if rng.random() < chance else None
+
+def half_life(rng: random.Random) -> list[Any] | str:
+    if rng.random() < 0.05:
+        return "unknown"
+    return [round(rng.uniform(0.1, 999), 3), rng.choice(HALF_LIFE_UNITS)]
+
+def generate_element(rng: random.Random, atomic_number: int) -> dict[str, Any]:
+    symbol, name = ELEMENT_NAMES[atomic_number - 1]
+    subshells = electron_configuration(atomic_number)
+    period, group, block = coordinates(atomic_number, subshells)
+    atomic_mass = 1.008 if atomic_number == 1 else round(atomic_number * (2 + 0.0045 * atomic_number) + rng.uniform(-0.5, 0.5), 6)
+    mass_number = round(atomic_mass)
+    type_name = element_type(atomic_number, block)
+    gas = type_name == "Noble gas" or atomic_number in {1, 7, 8, 9, 17}
+    melt = round(rng.uniform(-270, -50) if gas else rng.uniform(-40, 3500), 3)
+    radioactive = atomic_number in {43, 61} or atomic_number > 83
+    structure_type, structure_description, axes = rng.choice(STRUCTURES)
+
+    return {
+        "general": {
+            "fullname": name,
+            "symbol": symbol,
+            "atomic_number": atomic_number,
+            "description": f"{name} is a synthetic element entry generated for scale testing.\n{name} has no real-world meaning; its values are randomized within plausible ranges.",
+            "appearance": {
+                "description": "synthetic placeholder",
+                "phase": "gas" if gas else ("liquid" if atomic_number in {35, 80} else "solid"),
+            },
+            "coordinates": {"period": period, "group": group},
+            "type": type_name,
+            "block": block,
+            "cas_number": f"CAS{7400000 + atomic_number * 37}-{atomic_number % 100:02d}-{atomic_number % 10}",
+            "radioactive": radioactive,
+            "half_life": half_life(rng) if radioactive else None,
+        },
+        "historical": {
+            "date": f"{rng.randint(1650, 2010)} AD",
+            "discoverers": {f"Synthetic Discoverer {atomic_number}": rng.choice(["male", "female"])},
+        },
+        "nuclear": {
+            "protons": atomic_number,
+            "neutrons": mass_number - atomic_number,
+            "electrons": atomic_number,
+        },
+        "electronic": {
+            "shells": shell_counts(subshells),
+            "subshells": subshells,
+            "electronegativity": None if type_name == "Noble gas" else round(rng.uniform(0.7, 3.98), 2),
+            "electron_affinity": maybe(rng, round(rng.uniform(-0.5, 3.6), 3)),
+            "ionization_energy": round(rng.uniform(3.8, 24.6), 3),
+            "oxidation_states": sorted(rng.sample([-4, -3, -2, -1, 1, 2, 3, 4, 5, 6, 7, 8], rng.randint(1, 4))),
+            "conductivity_type": rng.choice(CONDUCTIVITY_TYPES),
+        },
+        "physical": {
+            "melt": melt,
+            "boil": round(melt + rng.uniform(5, 2500), 3),
+            "atomic_mass": atomic_mass,
+            "structure": {
+                "type": structure_type,
+                "description": structure_description,
+                "constants": {axis: f"{rng.uniform(2, 12):.2f}" for axis in axes},
+            },
+        },
+        "measurements": {
+            "radius": {
+                "calculated": maybe(rng, rng.randint(30, 300)),
+                "empirical": maybe(rng, rng.randint(25, 260)),
+                "covalent": maybe(rng, rng.randint(30, 240)),
+                "van_der_waals": maybe(rng, rng.randint(120, 350)),
+            },
+            "hardness": {
+                "brinell": maybe(rng, rng.randint(1, 3000), 0.5),
+                "mohs": maybe(rng, round(rng.uniform(0.2, 10), 1), 0.5),
+                "vickers": maybe(rng, rng.randint(1, 3500), 0.5),
+            },
+            "moduli": {
+                "bulk": maybe(rng, rng.randint(1, 450), 0.6),
+                "young": maybe(rng, rng.randint(1, 500), 0.6),
+                "shear": maybe(rng, rng.randint(1, 250), 0.6),
+                "poissons_ratio": maybe(rng, round(rng.uniform(0.1, 0.45), 2), 0.6),
+            },
+            "density": {
+                "STP": round(rng.uniform(0.08, 22_600), 4),
+                "liquid": maybe(rng, round(rng.uniform(70, 20_000), 1), 0.5),
+            },
+            "sound_transmission_speed": rng.randint(200, 18_000),
+        },
+    }
+
+def decay_product(mass_number: int, atomic_number: int, unsure: bool) -> str | None:
+    if not 1 <= atomic_number <= len(ELEMENT_NAMES) or mass_number < atomic_number:
+        return None
+    return f"{mass_number}{ELEMENT_NAMES[atomic_number - 1][0]}" + ("?" if unsure else "")
+
+def generate_decays(rng: random.Random, mass_number: int, atomic_number: int, center: int) -> list[dict[str, Any]]:
+    if mass_number < center:
+        candidates = [("β+", 0, -1), ("p", -1, -1), ("2p", -2, -2)]
+    else:
+        candidates = [("β-", 0, 1), ("n", -1, 0), ("β-n", -1, 1)]
+    if atomic_number > 82:
+        candidates.append(("α", -4, -2))
+
+    branches: list[dict[str, Any]] = []
+    remaining = 100.0
+    for index, (mode, mass_change, charge_change) in enumerate(rng.sample(candidates, rng.randint(1, len(candidates)))):
+        unsure = rng.random() < 0.05
+        product = decay_product(mass_number + mass_change, atomic_number + charge_change, unsure)
+        branch: dict[str, Any] = {"mode": mode + ("?" if unsure else "")}
+        if product:
+            branch["product"] = [product]
+
+        if index == 0:
+            chance = round(remaining * rng.uniform(0.6, 1), 4)
+        else:
+            chance = round(remaining * rng.uniform(0, 1), 4)
+        remaining -= chance
+
+        # Some branches in the real data are unmeasured and lack a chance
+        if rng.random() > 0.05:
+            branch["chance"] = 100 if chance == 100.0 else chance
+        branches.append(branch)
+
+    return branches
+
+def generate_nuclides(rng: random.Random, element: dict[str, Any], count: int, metastable_ratio: float) -> dict[str, Any]:
+    atomic_number = element["general"]["atomic_number"]
+    symbol = element["general"]["symbol"]
+    center = atomic_number + element["nuclear"]["neutrons"]
+    first = max(atomic_number, center - count // 2)
+
+    nuclides: dict[str, Any] = {}
+    for mass_number in range(first, first + count):
+        stable = abs(mass_number - center) <= 1 and atomic_number < 83
+        nuclide: dict[str, Any] = {
+            "protons": atomic_number,
+            "neutrons": mass_number - atomic_number,
+            "half_life": None if stable else half_life(rng),
+            "isotope_weight": round(mass_number + rng.uniform(-0.09, 0.09), 8),
+        }
+
+        if not stable:
+            nuclide["decay"] = generate_decays(rng, mass_number, atomic_number, center)
+
+        if rng.random() < metastable_ratio:
+            states = ["m"] if rng.random() < 0.7 else ["m1", "m2"]
+            metastable: dict[str, Any] = {}
+            for state in states:
+                state_data: dict[str, Any] = {"energy": round(rng.uniform(50, 20_000), 2)}
+                if rng.random() < 0.8:
+                    state_data["half_life"] = half_life(rng)
+                    state_data["decay"] = [{"mode": "IT", "product": [f"{mass_number}{symbol}"], "chance": 100}]
+                metastable[state] = state_data
+            nuclide["metastable"] = metastable
+
+        nuclides[f"{mass_number}{symbol}"] = nuclide
+
+    return nuclides
+
+def generate_dataset(element_count: int, nuclide_count: int, metastable_ratio: float, seed: int) -> tuple[dict[str, Any], dict[str, Any]]:
+    rng = random.Random(seed)
+    elements: dict[str, Any] = {}
+    isotopes: dict[str, Any] = {}
+
+    # Heavier elements get proportionally more nuclides, just like the real chart of nuclides
+    weights = [atomic_number ** 0.5 for atomic_number in range(1, element_count + 1)]
+    total_weight = sum(weights)
+    counts = [max(1, int(nuclide_count * weight / total_weight)) for weight in weights]
+    for index in range(nuclide_count - sum(counts)):
+        counts[-1 - index % element_count] += 1
+
+    for atomic_number in range(1, element_count + 1):
+        element = generate_element(rng, atomic_number)
+        name = element["general"]["fullname"]
+        elements[name] = element
+        isotopes[name] = generate_nuclides(rng, element, counts[atomic_number - 1], metastable_ratio)
+
+    return elements, isotopes
+
+def parse_arguments(arguments: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="generate.py",
+        description="Writes schema-compatible elements.json / isotopes.json files for scale testing.",
+    )
+    parser.add_argument("--elements", type=int, default=DEFAULT_ELEMENTS, metavar="N", help=f"number of elements (default: {DEFAULT_ELEMENTS})")
+    parser.add_argument("--nuclides", type=int, default=DEFAULT_NUCLIDES, metavar="N", help=f"total number of nuclides (default: {DEFAULT_NUCLIDES})")
+    parser.add_argument(
+        "--metastable", type=float, default=DEFAULT_METASTABLE_RATIO, metavar="RATIO",
+        help=f"share of nuclides with metastable states (default: {DEFAULT_METASTABLE_RATIO})",
+    )
+    parser.add_argument("--seed", type=int, default=0, metavar="N", help="random seed (default: 0)")
+    parser.add_argument(
+        "--output", type=lambda value: Path(value).expanduser(), default=SYNTHETIC_DATA_DIR, metavar="DIR",
+        help=f"directory to write the files to (default: {SYNTHETIC_DATA_DIR})",
+    )
+    return parser.parse_args(arguments)
+
+def generate_main(arguments: list[str]) -> None:
+    options = parse_arguments(arguments)
+    element_count, nuclide_count = options.elements, options.nuclides
+    metastable_ratio, seed, output_dir = options.metastable, options.seed, options.output
+
+    if not 1 <= element_count <= len(ELEMENT_NAMES):
+        print(f"The number of elements must be between 1 and {len(ELEMENT_NAMES)}.")
+        sys.exit(0)
+    nuclide_count = max(nuclide_count, element_count)
+
+    elements, isotopes = generate_dataset(element_count, nuclide_count, metastable_ratio, seed)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for file_name, data in (("elements.json", elements), ("isotopes.json", isotopes)):
+        with open(output_dir / file_name, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=4, ensure_ascii=False)
+
+    nuclides = sum(len(element_isotopes) for element_isotopes in isotopes.values())
+    metastables = sum(1 for element_isotopes in isotopes.values() for nuclide in element_isotopes.values() if "metastable" in nuclide)
+    print(f"Generated {bold(str(len(elements)))} elements and {bold(str(nuclides))} nuclides ({metastables} with metastable states) in {output_dir}")
+    print(f"Run the program against it with: PERIODICA_DATA_DIR={output_dir} periodica")
+
+if __name__ == "__main__":
+    generate_main(sys.argv[1:])
@@ -0,0 +1,115 @@
+import os, shlex, tempfile
+from typing import Iterable
+from pathlib import Path
+
+# Shell completion reads plain word lists from a cache directory, so pressing tab never starts Python.
+# Each list is one word per line; the files are rewritten by --completions and after --refresh.
+COMPLETION_LISTS = ("flags", "lookups", "factors")
+COMPLETION_SHELLS = ("bash", "zsh", "fish")
+
+BASH_TEMPLATE = """# periodica completion for bash, generated by `periodica --completions bash`
+_periodica() {
+    local cache=@CACHE@ current="${COMP_WORDS[COMP_CWORD]}" previous="${COMP_WORDS[COMP_CWORD-1]}" list=lookups
+    if [[ $current == -* ]]; then
+        list=flags
+    else
+        case $previous in
+            --compare|-C|--heatmap|-T) list=factors ;;
+            --completions) COMPREPLY=($(compgen -W "bash zsh fish" -- "$current")); return ;;
+        esac
+    fi
+    [[ -r $cache/$list ]] || return
+    COMPREPLY=($(compgen -W "$(<"$cache/$list")" -- "$current"))
+}
+complete -o default -F _periodica periodica
+"""
+
+ZSH_TEMPLATE = """#compdef periodica
+# periodica completion for zsh, generated by `periodica --completions zsh`
+_periodica() {
+    local cache=@CACHE@ list=lookups
+    local -a candidates
+    if [[ $PREFIX == -* ]]; then
+        list=flags
+    else
+        case ${words[CURRENT-1]} in
+            --compare|-C|--heatmap|-T) list=factors ;;
+            --completions) compadd bash zsh fish; return ;;
+        esac
+    fi
+    [[ -r $cache/$list ]] || return 1
+    candidates=(${(f)"$(<$cache/$list)"})
+    compadd -a candidates
+}
+compdef _periodica periodica
+"""
+
+FISH_TEMPLATE = """# periodica completion for fish, generated by `periodica --completions fish`
+complete -c periodica -f
+complete -c periodica -n 'string match -q -- "-*" (commandline -ct)' -a '(cat "@CACHE@/flags" 2>/dev/null)'
+complete -c periodica -n '__fish_seen_subcommand_from --completions' -a 'bash zsh fish'
+complete -c periodica -n '__fish_seen_subcommand_from --compare -C --heatmap -T' -a '(cat "@CACHE@/factors" 2>/dev/null)'
+complete -c periodica -n 'not string match -q -- "-*" (commandline -ct); and not __fish_seen_subcommand_from --compare -C --heatmap -T --completions' -a '(cat "@CACHE@/lookups" 2>/dev/null)'
+"""
+
+class PrefixTrie():
+    # Case-insensitive prefix lookups that return the words as they were inserted
+    def __init__(self, words: Iterable[str] = ()):
+        self.root: dict[str, dict] = {}
+        self.size = 0
+        for word in words:
+            self.insert(word)
+
+    def insert(self, word: str) -> None:
+        node = self.root
+        for character in word.lower():
+            node = node.setdefault(character, {})
+        terminal = node.setdefault("", {})
+        if word not in terminal:
+            terminal[word] = {}
+            self.size += 1
+
+    def complete(self, prefix: str, limit: int | None = None) -> list[str]:
+        node = self.root
+        for character in prefix.lower():
+            if character not in node:
+                return []
+            node = node[character]
+
+        matches: list[str] = []
+        stack = [node]
+        while stack and (limit is None or len(matches) < limit):
+            current = stack.pop()
+            matches.extend(current.get("", ()))
+            # Reversed so that the stack pops children in alphabetical order
+            stack.extend(current[key] for key in sorted(current, reverse=True) if key)
+
+        return matches if limit is None else matches[:limit]
+
+    def __contains__(self, word: str) -> bool:
+        node = self.root
+        for character in word.lower():
+            if character not in node:
+                return False
+            node = node[character]
+        return word in node.get("", ())
+
+    def __len__(self) -> int:
+        return self.size
+
+def write_completion_cache(directory: Path, candidates: dict[str, Iterable[str]]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in COMPLETION_LISTS:
+        descriptor, temporary = tempfile.mkstemp(prefix=f".{name}.", suffix=".part", dir=directory)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            file.write("".join(f"{word}\n" for word in candidates.get(name, ())))
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, directory / name)
+
+def completion_script(shell: str, directory: Path) -> str:
+    if shell == "fish":
+        # The fish template already puts the path in double quotes
+        escaped = str(directory).replace("\\", "\\\\").replace('"', '\\"').replace("$", "\\$")
+        return FISH_TEMPLATE.replace("@CACHE@", escaped)
+    template = {"bash": BASH_TEMPLATE, "zsh": ZSH_TEMPLATE}[shell]
+    return template.replace("@CACHE@", shlex.quote(str(directory)))
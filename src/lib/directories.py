@@ -1,4 +1,4 @@
-import pathlib, sys
+import pathlib, sys, os
 
 if getattr(sys, "frozen", False):
     # PyInstaller support
@@ -16,10 +16,29 @@ PERIODICA_SCRIPT = PERIODICA_DIR / "periodica.sh"
 MAIN_SCRIPT = PERIODICA_DIR / "src" / "main.py"
 UPDATE_SCRIPT = PERIODICA_DIR / "src" / "update.py"
 
-ELEMENT_DATA_FILE = PERIODICA_DIR / "src" / "elements.json"
-ISOTOPE_DATA_FILE = PERIODICA_DIR / "src" / "isotopes.json"
+# PERIODICA_DATA_DIR points the program at another dataset (for example, a synthetic one from src/generate.py)
+DATA_DIR = pathlib.Path(os.environ["PERIODICA_DATA_DIR"]).expanduser() if os.environ.get("PERIODICA_DATA_DIR") else PERIODICA_DIR / "src"
+ELEMENT_DATA_FILE = DATA_DIR / "elements.json"
+ISOTOPE_DATA_FILE = DATA_DIR / "isotopes.json"
 
 RUNTIME_DIR = pathlib.Path.home() / ".periodica"
-RUNTIME_DIR.mkdir(exist_ok=True)
 OUTPUT_FILE = RUNTIME_DIR / "output.json"
+EXPORT_DIR = RUNTIME_DIR / "exports"
 LOGGING_FILE = RUNTIME_DIR / "execution.log"
+PROFILE_FILE = RUNTIME_DIR / "profile.prof"
+ALLOCATIONS_FILE = RUNTIME_DIR / "allocations.txt"
+BENCHMARK_DIR = RUNTIME_DIR / "benchmarks"
+SYNTHETIC_DATA_DIR = RUNTIME_DIR / "synthetic"
+VALIDATION_CACHE_FILE = RUNTIME_DIR / "validation.json"
+ISOTOPE_INDEX_FILE = RUNTIME_DIR / "isotope_index.json"
+DATABASE_FILE = RUNTIME_DIR / "periodica.db"
+REFRESH_STATE_FILE = RUNTIME_DIR / "refresh.json"
+HTTP_CACHE_DIR = RUNTIME_DIR / "http_cache"
+VERSION_CHECK_FILE = RUNTIME_DIR / "version_check.json"
+REPL_HISTORY_FILE = RUNTIME_DIR / "repl_history"
+COMPLETIONS_DIR = RUNTIME_DIR / "completions"
+
+def ensure_runtime_dir() -> pathlib.Path:
+    # Created by the entry points instead of on import, so importing the library never touches the home directory
+    RUNTIME_DIR.mkdir(exist_ok=True)
+    return RUNTIME_DIR
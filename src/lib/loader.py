@@ -1,16 +1,29 @@
-import logging, sys, subprocess
-from lib.directories import LOGGING_FILE, VENV_DIR, BUILD_SCRIPT
+import logging, sys, subprocess, pathlib, hashlib, json, os, importlib.util
+from typing import Any
+from lib.directories import LOGGING_FILE, VENV_DIR, BUILD_SCRIPT, HTTP_CACHE_DIR, ensure_runtime_dir
 
-with open(LOGGING_FILE, 'w', encoding="utf-8"):
-    pass
+# Network settings shared by every HTTP request the program makes
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 30
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+RETRY_JITTER = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
 
-logging.basicConfig(
-    filename=LOGGING_FILE,
-    filemode='w',
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    force=True
-)
+http_session: Any = None
+
+def configure_logging() -> None:
+    ensure_runtime_dir()
+    with open(LOGGING_FILE, 'w', encoding="utf-8"):
+        pass
+
+    logging.basicConfig(
+        filename=LOGGING_FILE,
+        filemode='w',
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        force=True
+    )
 
 class Logger():
     def __init__(self, *, enable_debugging: bool = False):
@@ -53,21 +66,103 @@ class Logger():
 
 log = Logger(enable_debugging=False)
 
-def get_response(url: str):
-    try:
-        import requests
-    except ImportError:
+def get_session():
+    global http_session
+
+    if http_session is not None:
+        return http_session
+
+    if importlib.util.find_spec("requests") is None:
         import_failsafe()
 
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry_options = {
+        "total": MAX_RETRIES,
+        "backoff_factor": RETRY_BACKOFF,
+        "status_forcelist": RETRY_STATUSES,
+        "allowed_methods": frozenset({"GET", "HEAD"}),
+        "raise_on_status": False,
+    }
+    try:
+        # Jitter keeps several clients from retrying a struggling mirror in lockstep (urllib3 2.0+)
+        retry = Retry(**retry_options, backoff_jitter=RETRY_JITTER)
+    except TypeError:
+        retry = Retry(**retry_options)
+
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    http_session = requests.Session()
+    http_session.mount("https://", adapter)
+    http_session.mount("http://", adapter)
+    http_session.headers["User-Agent"] = "periodica"
+    return http_session
+
+def cache_entry_path(url: str) -> pathlib.Path:
+    return HTTP_CACHE_DIR / (hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+def load_cache_entry(url: str) -> dict[str, Any] | None:
+    try:
+        with open(cache_entry_path(url), "r", encoding="utf-8") as file:
+            entry = json.load(file)
+            return entry if isinstance(entry, dict) and entry.get("url") == url else None
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def store_cache_entry(url: str, response: Any) -> None:
+    ensure_runtime_dir()
+    HTTP_CACHE_DIR.mkdir(exist_ok=True)
+    entry = {
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "encoding": response.encoding or "utf-8",
+        "body": response.content.decode(response.encoding or "utf-8", errors="replace"),
+    }
+    temporary = cache_entry_path(url).with_suffix(".part")
+    with open(temporary, "w", encoding="utf-8") as file:
+        json.dump(entry, file)
+    os.replace(temporary, cache_entry_path(url))
+
+def get_response(url: str, *, cache: bool = False, timeout: tuple[float, float] | None = None):
+    import requests
+
+    session = get_session()
+    headers: dict[str, str] = {}
+    entry = load_cache_entry(url) if cache else None
+
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
     try:
-        response = requests.get(url)
+        response = session.get(url, headers=headers, timeout=timeout or (CONNECT_TIMEOUT, READ_TIMEOUT))
+
+        if response.status_code == 304 and entry:
+            # Serve the cached body through the same Response object, so callers can keep using response.text
+            response._content = entry["body"].encode(entry.get("encoding", "utf-8"))
+            response.encoding = entry.get("encoding", "utf-8")
+            print(f"HTTP status code: {response.status_code} (cached)")
+            log.info(f"Served {url} from the response cache.")
+            return response
+
+        if response.status_code == 304:
+            # Nothing was cached to revalidate, so a 304 has no body to fall back on
+            print("Failed to download data! The server answered 304 Not Modified, but there is no cached copy.")
+            log.abort(f"Got 304 Not Modified for {url} without a cache entry.")
+
         response.raise_for_status()
         print(f"HTTP status code: {response.status_code} (pass)")
+
+        if cache:
+            store_cache_entry(url, response)
         return response
-    except requests.exceptions.ConnectionError:
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
         print("Whoops! There was a network connection error. Please check your network connection, and try again later.")
-        log.abort("Couldn't proceed; failed to connect to page.")
+        log.abort(f"Couldn't proceed; failed to connect to page after {MAX_RETRIES} retries.")
     except requests.exceptions.HTTPError:
         print(f"Failed to download data! HTTP status code: {response.status_code}") # type: ignore
         log.abort(f"Failed to fetch data. Status code: {response.status_code}.") # type: ignore
@@ -0,0 +1,109 @@
+import sys, time, atexit, contextlib
+from typing import Any, Iterator
+from lib.directories import PROFILE_FILE, ALLOCATIONS_FILE
+
+TOP_ALLOCATIONS = 25
+
+class Profiler():
+    def __init__(self):
+        self.enabled = False
+        self.dump = False
+        # Set by --raw, since the report is printed outside of main.py's patched formatters
+        self.plain = False
+        self.origin = time.perf_counter()
+        self.spans: list[tuple[str, int, float, float]] = []
+        self.open_spans: list[tuple[str, float]] = []
+        self.cpu_profile: Any = None
+
+    def begin(self, name: str) -> None:
+        self.open_spans.append((name, time.perf_counter()))
+
+    def end(self, name: str | None = None) -> None:
+        if not self.open_spans:
+            return
+
+        # Close everything nested inside the requested span as well
+        while self.open_spans:
+            open_name, start = self.open_spans.pop()
+            self.record(open_name, start, time.perf_counter(), depth=len(self.open_spans))
+            if name is None or open_name == name:
+                break
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def record(self, name: str, start: float, end: float, *, depth: int = 0) -> None:
+        self.spans.append((name, depth, start, end))
+
+    def enable(self, *, dump: bool = False) -> None:
+        if self.enabled:
+            self.dump = self.dump or dump
+            if dump and self.cpu_profile is None:
+                self.start_dumps()
+            return
+
+        self.enabled = True
+        self.dump = dump
+        if dump:
+            self.start_dumps()
+
+        atexit.register(self.report)
+
+    def start_dumps(self) -> None:
+        import cProfile, tracemalloc
+        tracemalloc.start()
+        self.cpu_profile = cProfile.Profile()
+        self.cpu_profile.enable()
+
+    def write_dumps(self) -> None:
+        import tracemalloc
+
+        if self.cpu_profile is not None:
+            self.cpu_profile.disable()
+            self.cpu_profile.dump_stats(PROFILE_FILE)
+            print(f"cProfile data written to {PROFILE_FILE} (inspect it with: python3 -m pstats {PROFILE_FILE})", file=sys.stderr)
+
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            statistics = snapshot.statistics("lineno")[:TOP_ALLOCATIONS]
+            with open(ALLOCATIONS_FILE, "w", encoding="utf-8") as file:
+                file.write(f"Traced memory: {current / 1024:.1f} KiB current, {peak / 1024:.1f} KiB peak\n")
+                file.write(f"Top {len(statistics)} allocation sites:\n\n")
+                for index, statistic in enumerate(statistics, start=1):
+                    file.write(f"{index:>3}. {statistic}\n")
+            print(f"Top {len(statistics)} allocation sites written to {ALLOCATIONS_FILE}", file=sys.stderr)
+
+    def report(self) -> None:
+        from lib.terminal import bold, dim
+
+        # sys.exit() may fire in the middle of a phase, so close whatever is still running. The report goes to stderr,
+        # so it never mixes into output meant for other programs (like --json documents).
+        self.end()
+        sys.stdout.flush()
+        origin = min([self.origin] + [start for _, _, start, _ in self.spans])
+        total = time.perf_counter() - origin
+
+        print(file=sys.stderr)
+        print(bold(f"{'Phase':<40} {'Time (ms)':>12} {'Share':>8}", disable=self.plain), file=sys.stderr)
+        for name, depth, start, end in sorted(self.spans, key=lambda span: (span[2], span[1])):
+            elapsed = end - start
+            label = "  " * depth + name
+            print(f"{label:<40} {elapsed * 1000:>12.3f} {elapsed / total * 100 if total else 0:>7.1f}%", file=sys.stderr)
+
+        accounted = sum(end - start for _, depth, start, end in self.spans if depth == 0)
+        print(dim(f"{'(untracked)':<40} {(total - accounted) * 1000:>12.3f} {(total - accounted) / total * 100 if total else 0:>7.1f}%", disable=self.plain), file=sys.stderr)
+        print(bold(f"{'Total':<40} {total * 1000:>12.3f} {100:>7.1f}%", disable=self.plain), file=sys.stderr)
+
+        if self.dump:
+            print(file=sys.stderr)
+            self.write_dumps()
+
+profiler = Profiler()
@@ -0,0 +1,138 @@
+import json, os, tempfile, concurrent.futures
+from typing import Any
+from pathlib import Path
+from lib.loader import Logger, get_session, CONNECT_TIMEOUT, READ_TIMEOUT
+from lib.directories import ELEMENT_DATA_FILE, ISOTOPE_DATA_FILE, REFRESH_STATE_FILE
+from lib.schema import validate_dataset, hash_data, remember_valid
+
+DATA_BASE_URL = "https://raw.githubusercontent.com/Lanzoor/periodica/main/src"
+CHUNK_SIZE = 64 * 1024
+
+logger = Logger(enable_debugging=False)
+
+class RefreshError(Exception):
+    pass
+
+def data_targets() -> dict[str, Path]:
+    return {"elements.json": ELEMENT_DATA_FILE, "isotopes.json": ISOTOPE_DATA_FILE}
+
+def load_refresh_state() -> dict[str, Any]:
+    try:
+        with open(REFRESH_STATE_FILE, "r", encoding="utf-8") as file:
+            state = json.load(file)
+            return state if isinstance(state, dict) else {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_refresh_state(state: dict[str, Any]) -> None:
+    with open(REFRESH_STATE_FILE, "w", encoding="utf-8") as file:
+        json.dump(state, file, indent=4)
+
+def download(session: Any, url: str, target: Path, validators: dict[str, str]) -> dict[str, Any]:
+    import requests
+
+    # Conditional headers are only worth sending if there is a local copy to fall back on
+    headers: dict[str, str] = {}
+    if target.is_file():
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    temporary: Path | None = None
+    try:
+        with session.get(url, headers=headers, stream=True, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)) as response:
+            if response.status_code == 304:
+                logger.info(f"{url} is unchanged (304 Not Modified).")
+                return {"status": "unchanged", "temporary": None, "validators": validators}
+
+            response.raise_for_status()
+
+            # The body is streamed into a temporary file next to the target so the final swap is an atomic rename
+            descriptor, name = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".part", dir=target.parent)
+            temporary = Path(name)
+            with os.fdopen(descriptor, "wb") as file:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    file.write(chunk)
+
+            logger.info(f"Downloaded {url} ({response.status_code}).")
+            return {
+                "status": "updated",
+                "temporary": temporary,
+                "validators": {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                },
+            }
+    except (requests.exceptions.RequestException, OSError) as error:
+        # A download that fails halfway (a dropped stream, a full disk) must not leave its partial file behind
+        if temporary is not None:
+            temporary.unlink(missing_ok=True)
+
+        if isinstance(error, requests.exceptions.Timeout):
+            raise RefreshError(f"Timed out while downloading {url}.")
+        if isinstance(error, requests.exceptions.ConnectionError):
+            raise RefreshError(f"Failed to connect while downloading {url}.")
+        if isinstance(error, requests.exceptions.HTTPError):
+            raise RefreshError(f"Failed to download {url}: HTTP status code {error.response.status_code}.")
+        raise RefreshError(f"Failed to download {url}: {error}")
+
+def discard(results: dict[str, dict[str, Any]]) -> None:
+    for result in results.values():
+        if result.get("temporary") is not None:
+            result["temporary"].unlink(missing_ok=True)
+
+def refresh_data(base_url: str = DATA_BASE_URL, *, force: bool = False) -> tuple[dict[str, Any], dict[str, Any], dict[str, str]]:
+    targets = data_targets()
+    state = {} if force else load_refresh_state()
+    session = get_session()
+    results: dict[str, dict[str, Any]] = {}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        futures = {
+            executor.submit(download, session, f"{base_url.rstrip('/')}/{name}", target, state.get(name, {})): name
+            for name, target in targets.items()
+        }
+        errors: list[str] = []
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except RefreshError as error:
+                errors.append(str(error))
+
+    if errors:
+        discard(results)
+        raise RefreshError(" ".join(errors))
+
+    # Both files are validated together, since the schema has cross-file checks
+    contents: dict[str, bytes] = {}
+    for name, target in targets.items():
+        source = results[name]["temporary"] or target
+        with open(source, "rb") as file:
+            contents[name] = file.read()
+
+    try:
+        element_data = json.loads(contents["elements.json"])
+        isotope_data = json.loads(contents["isotopes.json"])
+    except (json.JSONDecodeError, UnicodeDecodeError) as error:
+        discard(results)
+        raise RefreshError(f"The downloaded data is not valid JSON: {error}")
+
+    problems = validate_dataset(element_data, isotope_data)
+    if problems:
+        discard(results)
+        for problem in problems:
+            logger.warn(f"Schema problem in downloaded data: {problem}")
+        raise RefreshError(f"The downloaded data failed validation with {len(problems)} problem(s), so the local files were kept.")
+
+    for name, target in targets.items():
+        if results[name]["temporary"] is not None:
+            os.replace(results[name]["temporary"], target)
+            results[name]["temporary"] = None
+        state[name] = results[name]["validators"]
+
+    save_refresh_state(state)
+    remember_valid(hash_data(contents["elements.json"], contents["isotopes.json"]))
+
+    statuses = {name: results[name]["status"] for name in targets}
+    return element_data, isotope_data, statuses
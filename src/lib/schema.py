@@ -0,0 +1,309 @@
+import hashlib, json, re
+from typing import Any, Callable
+from lib.directories import VALIDATION_CACHE_FILE
+
+# Problems found in a dataset are collected as "file: path: message" strings instead of raising on the first one
+Validator = Callable[[Any, str, list[str]], None]
+
+MAX_REMEMBERED_HASHES = 8
+
+ELEMENT_TYPES = (
+    "Reactive nonmetal", "Noble gas", "Alkali metal", "Alkali earth metal", "Metalloid",
+    "Transition metal", "Post-transition metal", "Lanthanide", "Actinide", "Unknown",
+)
+PHASES = ("solid", "liquid", "gas")
+CONDUCTIVITY_TYPES = ("Superconductor", "Semiconductor", "Insulator", "Conductor", "Unsure")
+BLOCKS = ("s", "p", "d", "f")
+
+class Optional():
+    # A key that may be missing from its parent mapping
+    def __init__(self, spec: Any):
+        self.spec = spec
+
+class Nullable():
+    def __init__(self, spec: Any):
+        self.spec = spec
+
+class OneOf():
+    def __init__(self, *values: Any):
+        self.values = values
+
+class Pattern():
+    def __init__(self, pattern: str):
+        self.pattern = re.compile(pattern)
+
+class ListOf():
+    def __init__(self, spec: Any):
+        self.spec = spec
+
+class DictOf():
+    # A mapping with arbitrary keys whose values all share the same spec
+    def __init__(self, spec: Any):
+        self.spec = spec
+
+class AnyOf():
+    def __init__(self, *specs: Any):
+        self.specs = specs
+
+NUMBER = (int, float)
+HALF_LIFE = AnyOf(None, OneOf("unknown"), ListOf(AnyOf(NUMBER, str)))
+
+ELEMENT_SCHEMA = {
+    "general": {
+        "fullname": str,
+        "symbol": Pattern(r"[A-Z][a-z]{0,2}"),
+        "atomic_number": int,
+        "description": str,
+        "appearance": {
+            "description": str,
+            "phase": OneOf(*PHASES),
+        },
+        "coordinates": {
+            "period": int,
+            "group": int,
+        },
+        "type": OneOf(*ELEMENT_TYPES),
+        "block": OneOf(*BLOCKS),
+        "cas_number": str,
+        "radioactive": bool,
+        "half_life": HALF_LIFE,
+    },
+    "historical": {
+        "date": str,
+        "discoverers": DictOf(str),
+    },
+    "nuclear": {
+        "protons": int,
+        "neutrons": int,
+        "electrons": int,
+    },
+    "electronic": {
+        "shells": ListOf(int),
+        "subshells": ListOf(Pattern(r"\d[spdf]\d+")),
+        "electronegativity": Nullable(NUMBER),
+        "electron_affinity": Nullable(NUMBER),
+        "ionization_energy": Nullable(NUMBER),
+        "oxidation_states": ListOf(int),
+        "conductivity_type": OneOf(*CONDUCTIVITY_TYPES),
+    },
+    "physical": {
+        "melt": Nullable(NUMBER),
+        "boil": Nullable(NUMBER),
+        "atomic_mass": NUMBER,
+        "structure": Optional(Nullable({
+            "type": str,
+            "description": str,
+            "constants": DictOf(Pattern(r"-?\d+(\.\d+)?")),
+        })),
+    },
+    "measurements": {
+        "radius": {key: Nullable(NUMBER) for key in ("calculated", "empirical", "covalent", "van_der_waals")},
+        "hardness": {key: Nullable(NUMBER) for key in ("brinell", "mohs", "vickers")},
+        "moduli": {key: Nullable(NUMBER) for key in ("bulk", "young", "shear", "poissons_ratio")},
+        "density": {key: Nullable(NUMBER) for key in ("STP", "liquid")},
+        "sound_transmission_speed": Nullable(NUMBER),
+    },
+}
+
+DECAY_SCHEMA = ListOf({
+    "mode": str,
+    "product": Optional(ListOf(str)),
+    "chance": Optional(NUMBER),
+})
+
+NUCLIDE_SCHEMA = {
+    "name": Optional(str),
+    "protons": int,
+    "neutrons": int,
+    "half_life": HALF_LIFE,
+    "isotope_weight": NUMBER,
+    "decay": Optional(Nullable(DECAY_SCHEMA)),
+    "metastable": Optional(DictOf({
+        "energy": NUMBER,
+        "half_life": Optional(HALF_LIFE),
+        "decay": Optional(DECAY_SCHEMA),
+    })),
+}
+
+def describe(spec: Any) -> str:
+    if spec is None:
+        return "null"
+    if isinstance(spec, type):
+        return spec.__name__
+    if isinstance(spec, tuple):
+        return " or ".join(describe(item) for item in spec)
+    if isinstance(spec, OneOf):
+        return "one of " + ", ".join(repr(value) for value in spec.values)
+    if isinstance(spec, Pattern):
+        return f"a string matching {spec.pattern.pattern}"
+    if isinstance(spec, ListOf):
+        return "a list"
+    if isinstance(spec, (DictOf, dict)):
+        return "an object"
+    if isinstance(spec, AnyOf):
+        return " or ".join(describe(item) for item in spec.specs)
+    if isinstance(spec, Nullable):
+        return describe(spec.spec) + " or null"
+    return str(spec)
+
+def compile_schema(spec: Any) -> Validator:
+    # Turns a declarative spec into a tree of closures once, so validating thousands of records is just function calls
+    if spec is None:
+        def check_null(value: Any, path: str, problems: list[str]) -> None:
+            if value is not None:
+                problems.append(f"{path}: expected null, got {value!r}")
+        return check_null
+
+    if isinstance(spec, (type, tuple)):
+        expected = spec if isinstance(spec, tuple) else (spec,)
+        allow_bool = bool in expected
+        description = describe(spec)
+
+        def check_type(value: Any, path: str, problems: list[str]) -> None:
+            if not isinstance(value, expected) or (isinstance(value, bool) and not allow_bool):
+                problems.append(f"{path}: expected {description}, got {value!r}")
+        return check_type
+
+    if isinstance(spec, Nullable):
+        inner = compile_schema(spec.spec)
+
+        def check_nullable(value: Any, path: str, problems: list[str]) -> None:
+            if value is not None:
+                inner(value, path, problems)
+        return check_nullable
+
+    if isinstance(spec, OneOf):
+        values = spec.values
+        description = describe(spec)
+
+        def check_one_of(value: Any, path: str, problems: list[str]) -> None:
+            if value not in values:
+                problems.append(f"{path}: expected {description}, got {value!r}")
+        return check_one_of
+
+    if isinstance(spec, Pattern):
+        pattern = spec.pattern
+        description = describe(spec)
+
+        def check_pattern(value: Any, path: str, problems: list[str]) -> None:
+            if not isinstance(value, str) or not pattern.fullmatch(value):
+                problems.append(f"{path}: expected {description}, got {value!r}")
+        return check_pattern
+
+    if isinstance(spec, AnyOf):
+        options = [compile_schema(option) for option in spec.specs]
+        description = describe(spec)
+
+        def check_any_of(value: Any, path: str, problems: list[str]) -> None:
+            for option in options:
+                attempt: list[str] = []
+                option(value, path, attempt)
+                if not attempt:
+                    return
+            problems.append(f"{path}: expected {description}, got {value!r}")
+        return check_any_of
+
+    if isinstance(spec, ListOf):
+        item = compile_schema(spec.spec)
+
+        def check_list(value: Any, path: str, problems: list[str]) -> None:
+            if not isinstance(value, list):
+                problems.append(f"{path}: expected a list, got {value!r}")
+                return
+            for index, entry in enumerate(value):
+                item(entry, f"{path}[{index}]", problems)
+        return check_list
+
+    if isinstance(spec, DictOf):
+        item = compile_schema(spec.spec)
+
+        def check_mapping(value: Any, path: str, problems: list[str]) -> None:
+            if not isinstance(value, dict):
+                problems.append(f"{path}: expected an object, got {value!r}")
+                return
+            for key, entry in value.items():
+                item(entry, f"{path}.{key}", problems)
+        return check_mapping
+
+    if isinstance(spec, dict):
+        fields = [
+            (key, isinstance(field, Optional), compile_schema(field.spec if isinstance(field, Optional) else field))
+            for key, field in spec.items()
+        ]
+
+        def check_object(value: Any, path: str, problems: list[str]) -> None:
+            if not isinstance(value, dict):
+                problems.append(f"{path}: expected an object, got {value!r}")
+                return
+            for key, optional, validator in fields:
+                if key in value:
+                    validator(value[key], f"{path}.{key}", problems)
+                elif not optional:
+                    problems.append(f"{path}: missing key \"{key}\"")
+        return check_object
+
+    raise TypeError(f"Unsupported schema spec: {spec!r}")
+
+validate_element = compile_schema(ELEMENT_SCHEMA)
+validate_nuclide = compile_schema(NUCLIDE_SCHEMA)
+
+def validate_dataset(element_data: Any, isotope_data: Any) -> list[str]:
+    problems: list[str] = []
+
+    if not isinstance(element_data, dict):
+        return ["elements.json: expected an object at the top level"]
+    if not isinstance(isotope_data, dict):
+        return ["isotopes.json: expected an object at the top level"]
+
+    for name, element in element_data.items():
+        element_problems: list[str] = []
+        validate_element(element, f"elements.json: {name}", element_problems)
+        problems.extend(element_problems)
+        if element_problems:
+            continue
+
+        # Cross-file checks that the renderer relies on
+        if element["general"]["fullname"].capitalize() != name:
+            problems.append(f"elements.json: {name}.general.fullname: does not match its key ({element['general']['fullname']!r})")
+        if element["nuclear"]["protons"] != element["general"]["atomic_number"]:
+            problems.append(f"elements.json: {name}.nuclear.protons: does not match the atomic number")
+        if name not in isotope_data:
+            problems.append(f"isotopes.json: missing an entry for {name}")
+
+    for name, nuclides in isotope_data.items():
+        if name not in element_data:
+            problems.append(f"isotopes.json: {name}: no matching element in elements.json")
+        if not isinstance(nuclides, dict):
+            problems.append(f"isotopes.json: {name}: expected an object, got {nuclides!r}")
+            continue
+        for key, nuclide in nuclides.items():
+            validate_nuclide(nuclide, f"isotopes.json: {name}.{key}", problems)
+
+    return problems
+
+def hash_data(*contents: bytes) -> str:
+    digest = hashlib.sha256()
+    for content in contents:
+        digest.update(len(content).to_bytes(8, "little"))
+        digest.update(content)
+    return digest.hexdigest()
+
+def load_validated_hashes() -> list[str]:
+    try:
+        with open(VALIDATION_CACHE_FILE, "r", encoding="utf-8") as file:
+            hashes = json.load(file).get("validated", [])
+            return [entry for entry in hashes if isinstance(entry, str)]
+    except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+        return []
+
+def is_known_valid(data_hash: str) -> bool:
+    return data_hash in load_validated_hashes()
+
+def remember_valid(data_hash: str) -> None:
+    hashes = [entry for entry in load_validated_hashes() if entry != data_hash]
+    hashes = (hashes + [data_hash])[-MAX_REMEMBERED_HASHES:]
+    try:
+        with open(VALIDATION_CACHE_FILE, "w", encoding="utf-8") as file:
+            json.dump({"validated": hashes}, file)
+    except OSError:
+        pass
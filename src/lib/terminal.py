@@ -1,5 +1,5 @@
 from lib.loader import logging
-import colorsys
+import colorsys, functools, textwrap
 
 # Default supported terminal colors
 BRIGHT = 60
@@ -22,6 +22,8 @@ BRIGHT_MAGENTA = BRIGHT + MAGENTA
 BRIGHT_CYAN = BRIGHT + CYAN
 BRIGHT_WHITE = BRIGHT + WHITE
 
+WRAP_CACHE_SIZE = 256
+
 def fore(message: str, color: int | list[int] | tuple[int, int, int], *, disable: bool = False) -> str:
     if disable: return message
 
@@ -70,9 +72,9 @@ def inverse(string: str, *, disable: bool = False) -> str:
     if disable: return string
     return f"\033[7m{string}\033[27m"
 
-def gradient(string: str, start_rgb: list[int] | tuple[int, int, int], end_rgb: list[int] | tuple[int, int, int], *, disable: bool = False) -> str:
-    if disable: return string
-
+@functools.cache
+def color_ramp(start_rgb: tuple[int, int, int], end_rgb: tuple[int, int, int], steps: int) -> tuple[tuple[int, int, int], ...]:
+    # Colors evenly spaced from start to end, interpolated in HLS so the hue sweeps instead of fading through gray
     start_hue, start_lightness, start_saturation = colorsys.rgb_to_hls(
         start_rgb[0] / 255, start_rgb[1] / 255, start_rgb[2] / 255
     )
@@ -80,14 +82,9 @@ def gradient(string: str, start_rgb: list[int] | tuple[int, int, int], end_rgb:
         end_rgb[0] / 255, end_rgb[1] / 255, end_rgb[2] / 255
     )
 
-    string_length = len(string)
-    if string_length == 0:
-        return ""
-
-    result_characters = list(string)
-
-    for index, character in enumerate(result_characters):
-        interpolation_factor = index / (string_length - 1) if string_length > 1 else 0
+    colors: list[tuple[int, int, int]] = []
+    for index in range(steps):
+        interpolation_factor = index / (steps - 1) if steps > 1 else 0
         interpolated_hue = start_hue + (end_hue - start_hue) * interpolation_factor
         interpolated_lightness = start_lightness + (end_lightness - start_lightness) * interpolation_factor
         interpolated_saturation = start_saturation + (end_saturation - start_saturation) * interpolation_factor
@@ -96,7 +93,24 @@ def gradient(string: str, start_rgb: list[int] | tuple[int, int, int], end_rgb:
             int(value * 255)
             for value in colorsys.hls_to_rgb(interpolated_hue, interpolated_lightness, interpolated_saturation)
         ]
+        colors.append((red, green, blue))
 
-        result_characters[index] = fore(character, (red, green, blue))
+    return tuple(colors)
 
-    return "".join(result_characters)
+def gradient(string: str, start_rgb: list[int] | tuple[int, int, int], end_rgb: list[int] | tuple[int, int, int], *, disable: bool = False) -> str:
+    if disable: return string
+
+    if len(string) == 0:
+        return ""
+
+    colors = color_ramp(tuple(start_rgb), tuple(end_rgb), len(string)) # type: ignore
+    return "".join(fore(character, color) for character, color in zip(string, colors))
+
+# The same descriptions get wrapped at the same widths over and over (--render-all, the REPL, the API), so wrapped
+# blocks are kept by text and width. Styled text is cached as is, so raw and colored output never share an entry.
+@functools.lru_cache(maxsize=WRAP_CACHE_SIZE)
+def wrap_paragraphs(text: str, width: int, indent: str = "    ") -> str:
+    return "\n\n".join(
+        textwrap.fill(paragraph.strip(), width=width, initial_indent=indent, subsequent_indent="")
+        for paragraph in text.strip().split("\n\n")
+    )
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+import sys, asyncio, socket, subprocess, statistics, time, argparse
+from typing import Any
+from urllib.parse import urlsplit
+
+from lib.terminal import bold, dim, fore, RED, GREEN
+from lib.directories import MAIN_SCRIPT
+
+# Usage: python3 src/loadtest.py [--url http://host:port] [--connections <n>] [--requests <n>]
+# Without --url, a server is started on a free localhost port for the duration of the test.
+# Every connection is kept alive and sends its requests one after another, cycling through REQUEST_PATHS.
+
+DEFAULT_CONNECTIONS = 50
+DEFAULT_REQUESTS = 20000
+STARTUP_TIMEOUT = 10.0
+PERCENTILES = (50, 90, 99)
+
+REQUEST_PATHS = [
+    "/elements/lithium",
+    "/elements/6",
+    "/isotopes/6Li",
+    "/isotopes/10Li-m2",
+    "/compare/atomic_mass?order=descending",
+    "/bond/H/N",
+    "/decay/14C",
+]
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+def start_server(port: int) -> subprocess.Popen[bytes]:
+    process = subprocess.Popen(
+        [sys.executable, str(MAIN_SCRIPT), "--serve", f"127.0.0.1:{port}"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL,
+    )
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("The server exited before accepting connections.")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+
+    process.kill()
+    raise RuntimeError(f"The server did not accept connections within {STARTUP_TIMEOUT:.0f}s.")
+
+async def fetch(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, host: str, path: str) -> int:
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1"))
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+async def client(host: str, port: int, budget: list[int], latencies: list[float], statuses: dict[int, int], offset: int) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    index = offset
+    try:
+        while budget[0] > 0:
+            budget[0] -= 1
+            path = REQUEST_PATHS[index % len(REQUEST_PATHS)]
+            index += 1
+
+            start = time.perf_counter()
+            status = await fetch(reader, writer, host, path)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+async def run(host: str, port: int, connections: int, total: int) -> dict[str, Any]:
+    budget = [total]
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(client(host, port, budget, latencies, statuses, offset) for offset in range(connections)),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    return {
+        "elapsed": elapsed,
+        "latencies": latencies,
+        "statuses": statuses,
+        "errors": [result for result in results if isinstance(result, BaseException)],
+    }
+
+def percentile(sorted_values: list[float], percent: int) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * percent / 100))]
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def parse_arguments(arguments: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="loadtest.py",
+        description="Load tests the HTTP JSON API over keep-alive connections.",
+    )
+    parser.add_argument("--url", metavar="URL", help="test a running server at http://host:port instead of starting one")
+    parser.add_argument(
+        "--connections", type=positive_int, default=DEFAULT_CONNECTIONS, metavar="N",
+        help=f"number of keep-alive connections (default: {DEFAULT_CONNECTIONS})",
+    )
+    parser.add_argument(
+        "--requests", type=positive_int, default=DEFAULT_REQUESTS, metavar="N",
+        help=f"total number of requests (default: {DEFAULT_REQUESTS})",
+    )
+    return parser.parse_args(arguments)
+
+def loadtest_main(arguments: list[str]) -> int:
+    options = parse_arguments(arguments)
+    connections, total = options.connections, options.requests
+
+    process = None
+    if options.url is not None:
+        url = urlsplit(options.url)
+        host, port = url.hostname or "127.0.0.1", url.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        try:
+            process = start_server(port)
+        except RuntimeError as error:
+            print(fore(str(error), RED))
+            return 1
+
+    print(f"Sending {bold(total)} requests over {bold(connections)} keep-alive connections to {host}:{port}...")
+    try:
+        result = asyncio.run(run(host, port, connections, total))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    latencies = sorted(result["latencies"])
+    if not latencies:
+        print(fore(f"No requests completed: {result['errors'][0] if result['errors'] else 'unknown error'}", RED))
+        return 1
+
+    print()
+    print(f"{'requests':<16} {len(latencies)}")
+    print(f"{'elapsed':<16} {result['elapsed']:.3f}s")
+    print(f"{'throughput':<16} {fore(f'{len(latencies) / result['elapsed']:.0f} requests/s', GREEN)}")
+    print(f"{'latency mean':<16} {statistics.fmean(latencies) * 1000:.3f}ms")
+    for percent in PERCENTILES:
+        print(f"{f'latency p{percent}':<16} {percentile(latencies, percent) * 1000:.3f}ms")
+    print(f"{'latency max':<16} {latencies[-1] * 1000:.3f}ms")
+    print(f"{'statuses':<16} {', '.join(f'{status}: {count}' for status, count in sorted(result['statuses'].items()))}")
+
+    if result["errors"]:
+        print(fore(f"{len(result['errors'])} connection(s) failed, e.g. {result['errors'][0]!r}", RED))
+        return 1
+
+    print(dim("\nPaths: " + " ".join(REQUEST_PATHS)))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(loadtest_main(sys.argv[1:]))
@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
+import time
+program_start = time.perf_counter()
 
 try:
-    import platform, sys, json, os, re, difflib, random, typing, textwrap, copy, functools, pprint, pathlib # type: ignore
+    import platform, sys, json, os, re, difflib, random, typing, functools, pprint, pathlib # type: ignore
 except ImportError as e:
     print("It seems like some of the standard libraries are missing. Please make sure you have the right version of the Python interpreter installed.")
     sys.exit(0)
 
-import platform, sys, json, os, re, difflib, random, textwrap, copy, functools, math
+import platform, sys, json, os, re, difflib, random, functools, math, io, contextlib, itertools
 from pprint import pprint
-from typing import Any, Tuple, Callable
-from pathlib import Path
+from typing import Any, Tuple, Callable, Iterable, Iterator
 
 try:
     import lib, lib.loader, lib.terminal, lib.directories # type: ignore
@@ -17,20 +18,31 @@ except ImportError:
     print("The utils helper library or its scripts was not found. Please ensure all required files are present.")
     sys.exit(0)
 
-from lib.loader import get_response, Logger, import_failsafe
+from lib.loader import Logger, configure_logging
 from lib.terminal import RED, GREEN, YELLOW, BLUE, MAGENTA, CYAN, DEFAULT_COLOR, BRIGHT_BLACK, BRIGHT_GREEN, BRIGHT_RED
-from lib.terminal import fore, back, inverse, bold, dim, italic, gradient
-from lib.directories import ELEMENT_DATA_FILE, ISOTOPE_DATA_FILE, OUTPUT_FILE, UPDATE_SCRIPT
+from lib.terminal import fore, back, inverse, bold, dim, italic, gradient, wrap_paragraphs, color_ramp
+from lib.directories import ELEMENT_DATA_FILE, ISOTOPE_DATA_FILE, ISOTOPE_INDEX_FILE, DATABASE_FILE, OUTPUT_FILE, EXPORT_DIR, REPL_HISTORY_FILE, COMPLETIONS_DIR, UPDATE_SCRIPT
+from lib.profiler import profiler
+from lib.schema import validate_dataset, hash_data, is_known_valid, remember_valid
+from lib.refresh import refresh_data, RefreshError, DATA_BASE_URL
+from lib.completion import PrefixTrie, COMPLETION_SHELLS, write_completion_cache, completion_script
+
+from periodica.dataset import Dataset
+from periodica.isotope_index import LazyIsotopes, get_isotope_index
+from periodica.lookup import ElementNotFound, IsotopeNotFound, parse_isotope
+from periodica.compare import COMPARE_FACTORS, SORTING_METHODS, compare
+from periodica.layout import TableLayout
+from periodica.summary import CARD_SECTIONS, element_summary, isotope_summary, comparison_summary
+from periodica.bonds import NONPOLAR_LIMIT, POLAR_LIMIT, BondMatrix, bond_type as classify_elements, bond_matrix
+from periodica.formula import FormulaError, MolarMass, molar_mass
+from periodica.balance import BalanceError, Balanced, balance
+from periodica.electrons import calculate_ionization_series as ionization_steps, shielding_constant as calculate_shielding_constant
+import periodica.lookup
 
 import builtins
 print = builtins.print # if this gets fixed remove this
 
-try:
-    import matplotlib # TODO: in fact, do use this # type: ignore
-except ImportError:
-    import_failsafe()
-
-import matplotlib.pyplot as plt # type: ignore
+profiler.record("imports", program_start, time.perf_counter())
 
 # Flags for logic altering
 export_enabled = False
@@ -38,18 +50,38 @@ debug_mode = False
 isotope_logic = False
 verbose_output = True
 hide_isotopes = False
+json_output = False
+use_pager = True
+matrix_output = False
+isotopes_limit: int | None = None
+isotopes_page = 1
+card_sections: tuple[str, ...] = CARD_SECTIONS
 
 recognized_flag = False
-data_malformed = False
+
+MAX_SHOWN_PROBLEMS = 20
+MAX_CELL_WIDTH = 40
+ISOTOPES_PAGE_SIZE = 10
+REPL_HISTORY_LENGTH = 1000
+RENDER_WIDTH = 80
+HEATMAP_STEPS = 10
+HEATMAP_COLD = (70, 110, 255)
+HEATMAP_HOT = (255, 70, 70)
 
 # This is where elements and suggestions will go
 full_element_data: dict[str, Any] = {}
 full_isotope_data: dict[str, Any] = {}
+dataset = Dataset({}, {})
+data_hash = ""
 
 current_element_data = None
 current_element_suggestion = ""
 current_isotope_data = None
 
+# Overwritten by probe_terminal() for the commands that print to the terminal
+terminal_width = 80
+terminal_height = 40
+
 logger = Logger(enable_debugging=debug_mode)
 
 # Defining unicode symbols
@@ -128,7 +160,12 @@ def update_color_configs(allow: bool = verbose_output):
         "Noble gas": YELLOW,
         "Alkali metal": (215, 215, 215) if allow else BRIGHT_BLACK,
         "Alkali earth metal": ORANGE,
-        "Metalloid": CYAN
+        "Metalloid": CYAN,
+        "Transition metal": (255, 153, 153) if allow else RED,
+        "Post-transition metal": (153, 204, 204) if allow else BRIGHT_BLACK,
+        "Lanthanide": (255, 191, 255) if allow else MAGENTA,
+        "Actinide": (255, 153, 204) if allow else MAGENTA,
+        "Unknown": (204, 204, 204) if allow else DEFAULT_COLOR
     }
 
     phase_colors = {
@@ -154,14 +191,6 @@ def update_color_configs(allow: bool = verbose_output):
 
 update_color_configs()
 
-# For ionization calculations
-SUBSHELL_AZIMUTHALS = {
-    's': 0,
-    'p': 1,
-    'd': 2,
-    'f': 3
-}
-
 # Selecting random tips
 def pick_tip(tips: list[str]) -> str:
     tips_copy = tips[:]
@@ -189,6 +218,14 @@ modifier_flags = {
     "--debug", "-d",
     "--raw", "-r",
     "--hide-isotopes", "-H",
+    "--json", "-J",
+    "--no-pager",
+    "--isotopes-limit",
+    "--isotopes-page",
+    "--section",
+    "--matrix",
+    "--profile", "-P",
+    "--profile-dump",
 }
 
 positionarg_req_flags = {
@@ -196,6 +233,14 @@ positionarg_req_flags = {
     "--compare", "-C",
     "--bond-type", "-B",
     "--ionization", "-O",
+    "--refresh", "-F",
+    "--sql", "-Q",
+    "--render-all", "-W",
+    "--serve", "-S",
+    "--completions",
+    "--molar-mass", "-M",
+    "--balance", "-E",
+    "--heatmap", "-T",
 }
 
 positionarg_nreq_flags = {
@@ -203,18 +248,40 @@ positionarg_nreq_flags = {
     "--random", "-R",
     "--version", "-v",
     "--update", "-u",
+    "--repl", "-L",
 }
 
 valid_flags = modifier_flags | positionarg_req_flags | positionarg_nreq_flags
 
+# Flags that take a value, given either as --flag=value or as the argument right after the flag
+valued_flags = {"--isotopes-limit", "--isotopes-page", "--section"}
+
 def get_positional_args() -> list[str]:
-    return [arg for arg in sys.argv[1:] if not arg.startswith("-")]
+    arguments = sys.argv[1:]
+    return [
+        arg for index, arg in enumerate(arguments)
+        if not arg.startswith("-") and not (index > 0 and arguments[index - 1] in valued_flags)
+    ]
 
 def get_flags() -> list[str]:
-    return [arg for arg in sys.argv[1:] if arg.startswith("-")]
+    return [arg.split("=", 1)[0] if arg.startswith("--") else arg for arg in sys.argv[1:] if arg.startswith("-")]
+
+def get_flag_values() -> dict[str, str]:
+    arguments = sys.argv[1:]
+    values: dict[str, str] = {}
+    for index, arg in enumerate(arguments):
+        name, separator, value = arg.partition("=")
+        if name not in valued_flags:
+            continue
+        if separator:
+            values[name] = value
+        elif index + 1 < len(arguments) and not arguments[index + 1].startswith("-"):
+            values[name] = arguments[index + 1]
+    return values
 
 positional_arguments = [arg.strip() for arg in get_positional_args()]
 flag_arguments = [arg.strip() for arg in get_flags()]
+flag_values = get_flag_values()
 
 # Expand combined short flags
 separated_flags: list[str] = []
@@ -270,116 +337,28 @@ def ordinal(number: int):
         suffix = {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
     return f"{number}{suffix}"
 
-def extract_subshell_factors(subshells: list[str]) -> list[tuple[int, str, int]]:
-    config: list[tuple[int, str, int]] = []
-    pattern = re.compile(r"(\d+)([spdf])(\d+)")
-    for subshell in subshells:
-        match = pattern.fullmatch(subshell)
-        if match:
-            quantum_no, azimuthal_no, count = match.groups()
-            config.append((int(quantum_no), azimuthal_no, int(count)))
-        else:
-            logger.warn(f"Malformed subshell detected: {subshell}")
-    return config
-
-def calculate_shielding_constant(subshell_list: list[str], target_subshell: str) -> float:
-    if len(target_subshell) < 2:
-        logger.error(f"Invalid target subshell: {target_subshell}")
-        return 0.0
-
-    try:
-        target_principal_quantum_number, target_subshell_type = int(target_subshell[0]), target_subshell[1]
-        target_azimuthal_quantum_number = {"s": 0, "p": 1, "d": 2, "f": 3}[target_subshell_type]
-    except (IndexError, KeyError, ValueError):
-        logger.warn(f"Invalid target subshell format: {target_subshell}")
-        return 0.0
-
-    configuration = extract_subshell_factors(subshell_list)
-    if not configuration:
-        logger.warn(f"No valid configuration for subshell list: {subshell_list}")
-        return 0.0
-
-    shielding_constant = 0.0
-    for principal_quantum_number, subshell_type, electron_count in configuration:
-        if principal_quantum_number == target_principal_quantum_number:
-            contribution = 0.30 if subshell_type == "s" and principal_quantum_number == 1 else 0.35
-            if subshell_type == target_subshell_type:
-                shielding_constant += contribution * (electron_count - 1)
-            else:
-                shielding_constant += contribution * electron_count
-        elif principal_quantum_number == target_principal_quantum_number - 1:
-            shielding_constant += 0.85 * electron_count if target_azimuthal_quantum_number in (0, 1) else 1.00 * electron_count
-        elif principal_quantum_number < target_principal_quantum_number - 1:
-            shielding_constant += 1.00 * electron_count
-
-    return shielding_constant
-
 def calculate_ionization_series(subshells: list[str], atomic_number: int, ionization_energy: float | None) -> str:
-    lines: list[str] = []
-    config = extract_subshell_factors(subshells)
-    if not config:
+    steps = ionization_steps(subshells, atomic_number, ionization_energy)
+    if not steps:
         return fore("No valid subshell data for ionization series.", YELLOW)
 
-    RYDBERG_CONSTANT = 13.605693009
-    uncertainty = ""
-
-    current_config = copy.deepcopy(config)
-    for index in range(atomic_number):
-        last_filled = None
-        last_idx = None
-        for j in range(len(current_config) - 1, -1, -1):
-            quantum_no, azimuthal_no, count = current_config[j]
-            if count > 0:
-                last_filled = (quantum_no, azimuthal_no)
-                last_idx = j
-                break
-
-        if last_filled is None:
-            break
-
-        subshell_str = f"{last_filled[0]}{last_filled[1]}"
-        quantum_target = last_filled[0]
-        current_subshells = [f"{q}{a}{c}" for q, a, c in current_config if c > 0]
-        shielding_constant = calculate_shielding_constant(current_subshells, subshell_str)
-        Z_eff = atomic_number - shielding_constant
-
-        if index == 0 and ionization_energy is not None:
-            current_IE = ionization_energy
-        else:
-            current_IE = RYDBERG_CONSTANT * (Z_eff ** 2) / (quantum_target ** 2)
-
-        if index == 0:
-            uncertainty = "eV"
-        elif index == 1:
-            # The first breakdown always has a lot of inaccuracy
-            uncertainty = f"{pm}75eV"
-        elif index < atomic_number // 2:
-            # Then it settles in the next half
-            uncertainty = f"{pm}50eV"
-        elif index > atomic_number // 2:
-            # The last half and especially the last one is actually pretty accurate
-            current_IE = RYDBERG_CONSTANT * (Z_eff ** 2) / (quantum_target ** 2)
-            uncertainty = f"{pm}25eV"
-
-        formatted_subshell = f"{subshell_str}1"
+    lines: list[str] = []
+    for step in steps:
+        formatted_subshell = f"{step.subshell}1"
         formatted_subshell = formatted_subshell[:-1] + convert_superscripts(formatted_subshell[-1]) if verbose_output else formatted_subshell
+        uncertainty = f"{pm}{step.uncertainty}eV" if step.uncertainty is not None else "eV"
 
-        # Appending to the output
-        formatted_IE = bold(str(round(current_IE, 3)))
+        formatted_IE = bold(str(round(step.energy, 3)))
         lines.append(
             f"""
-  - {bold(ordinal(index + 1))} Ionization:
+  - {bold(ordinal(step.order))} Ionization:
     {fore('Removed Subshell', RED)}: {formatted_subshell}
-    {sigma} - {fore('Shielding Constant', PERIWINKLE)}: {shielding_constant:.2f}
-    Z_eff - {fore('Effective Nuclear Charge', GOLD)}: {Z_eff:.2f}
+    {sigma} - {fore('Shielding Constant', PERIWINKLE)}: {step.shielding_constant:.2f}
+    Z_eff - {fore('Effective Nuclear Charge', GOLD)}: {step.effective_nuclear_charge:.2f}
     {fore('Ionization Energy', PINK)}: {formatted_IE}{uncertainty}
             """
         )
 
-        if last_idx is not None:
-            quantum_no, azimuthal_no, count = current_config[last_idx]
-            current_config[last_idx] = (quantum_no, azimuthal_no, count - 1)
-
     return "".join(lines)
 
 def format_half_life(half_life: None | str | list[float | str | int]) -> Tuple[str, str | None, str | None]:
@@ -449,11 +428,17 @@ def resolve_element(
             logger.info(f"Resolved {label} element from args: {initial_input}")
             return element
 
+        if json_output:
+            json_fail(f"Could not resolve the {label} element {initial_input!r}.", suggestion=suggestion)
+
         print(fore(
             f"Could not resolve {label} element from arguments.",
             YELLOW
         ))
 
+    if json_output:
+        json_fail(f"No {label} element was given.")
+
     print(
         f"Search for the {label} element "
         f"{italic('to compare the bond type')} by name, symbol, or atomic number."
@@ -488,6 +473,9 @@ def resolve_element_or_isotope(
             logger.info(f"Resolved {label} from args: {initial_input}")
             return element
 
+        if json_output:
+            json_fail(f"Could not find the element or isotope {initial_input!r}.", suggestion=suggestion)
+
         if suggestion:
             print(fore(
                 f"Could not find that element or isotope. Did you mean {suggestion}?",
@@ -499,6 +487,9 @@ def resolve_element_or_isotope(
                 RED
             ))
 
+    if json_output:
+        json_fail("No element or isotope was given.")
+
     print(
         f"Search for an element {italic(f'to {label}')} "
         f"by name, symbol, or atomic number."
@@ -533,7 +524,7 @@ def f_info():
     f_redirect("--info", "information")
 
     print_separator()
-    print(program_information)
+    print(build_program_information())
     print_separator()
     sys.exit(0)
 
@@ -548,12 +539,73 @@ def f_update():
         print(fore("Looks like the update script is missing. Please check for any missing files.", RED))
         logger.abort("Failed to find the update script.")
 
+def export_bulk(arguments: list[str]):
+    from periodica.export import EXPORT_FORMATS, FILTER_PATTERN, ExportError, export_records, detect_format
+
+    # Everything after the subject is told apart by its shape: a format or compression name, a filter, or the destination
+    subject = "nuclides" if arguments[0] == "nuclides" else "elements"
+    if arguments[0] in ("all", "elements", "nuclides"):
+        arguments = arguments[1:]
+
+    export_format = None
+    compression = None
+    filters: list[str] = []
+    destination = None
+
+    for argument in arguments:
+        lowered = argument.lower()
+        if lowered in EXPORT_FORMATS:
+            export_format = lowered
+        elif lowered in ("gzip", "gz"):
+            compression = "gzip"
+        elif lowered in ("lzma", "xz"):
+            compression = "lzma"
+        elif FILTER_PATTERN.fullmatch(argument):
+            filters.append(argument)
+        elif destination is None:
+            destination = pathlib.Path(argument).expanduser()
+        else:
+            print(fore(f"Unexpected export argument \"{argument}\"; the destination is already {destination}.", RED))
+            logger.abort(f"Unexpected export argument: {argument}")
+
+    if destination is None:
+        export_format = export_format or "ndjson"
+        suffix = {"gzip": ".gz", "lzma": ".xz"}.get(compression or "", "")
+        destination = EXPORT_DIR / f"{subject}.{export_format}{suffix}"
+    elif export_format is None and detect_format(destination)[0] is None:
+        export_format = "ndjson"
+
+    description = f"{subject} matching {', '.join(filters)}" if filters else f"all {subject}"
+    print(f"Exporting {bold(description)} to {destination}...")
+
+    try:
+        count = export_records(subject, destination, export_format=export_format, compression=compression, filters=filters, dataset=dataset)
+    except ExportError as error:
+        print(fore(str(error), RED))
+        logger.abort(f"Export failed: {error}")
+    except OSError as error:
+        print(fore(f"Could not write {destination}: {error.strerror}", RED))
+        logger.abort(f"Export failed: {error}")
+
+    logger.info(f"Exported {count} {subject} to {destination}.")
+    print(f"Successfully saved {count} record(s) to {destination}.")
+    sys.exit(0)
+
 def f_export():
     global export_enabled, positional_arguments
 
     f_redirect("--export", "export")
     export_enabled = True
 
+    from periodica.export import FILTER_PATTERN
+
+    if positional_arguments and (positional_arguments[0] in ("all", "elements", "nuclides") or FILTER_PATTERN.fullmatch(positional_arguments[0])):
+        export_bulk(positional_arguments)
+
+    if len(positional_arguments) > 1:
+        print(fore("Too many positional arguments. Refer to --info.", RED))
+        logger.abort("Too many positional arguments.")
+
     arg = positional_arguments[0] if positional_arguments else None
     element = resolve_element_or_isotope("export", arg)
 
@@ -596,71 +648,34 @@ def f_export():
     print(f"Successfully saved to {OUTPUT_FILE}.")
     sys.exit(0)
 
-def sort_results(results: Any, method: str) -> Any:
-    match method:
-        case "ascending":
-            return sorted(results.items(), key=lambda x: (x[1] is None, x[1]))
-        case "descending":
-            return sorted(results.items(), key=lambda x: (x[1] is None, x[1]), reverse=True)
-        case "name":
-            return results.items()
-        case _:
-            logger.warn(f"Invalid sorting method {method}")
-            return results.items()
+def format_unit(unit: str) -> str:
+    return unit.replace("mm2", mm2).replace("m3", m3)
 
 def f_compare():
-    global full_element_data, positional_arguments, compare_tip, valid_sorting_methods
+    global positional_arguments
     f_redirect("--compare", "compare")
 
-    factors = [
-        "protons",
-        "electrons",
-        "neutrons",
-        "mass_number",
-        "up_quarks",
-        "down_quarks",
-        "isotopes",
-        "melting_point",
-        "boiling_point",
-        "atomic_mass",
-        "electronegativity",
-        "electron_affinity",
-        "ionization_energy",
-        "calculated_radius",
-        "empirical_radius",
-        "covalent_radius",
-        "van_der_waals_radius",
-        "brinell_hardness",
-        "mohs_hardness",
-        "vickers_hardness",
-        "bulk_modulus",
-        "young_modulus",
-        "shear_modulus",
-        "poissons_ratio",
-        "stp_density",
-        "liquid_density",
-        "sound_transmission_speed"
-    ]
-
-    valid_sorting_methods = [
-        "ascending",
-        "descending",
-        "name"
-    ]
-
-    determiner = ""
+    factors = list(COMPARE_FACTORS)
     sorting_method = "ascending"
 
     for index, argument in enumerate(positional_arguments):
-        if argument in valid_sorting_methods:
+        if argument in SORTING_METHODS:
             sorting_method = argument
-            print(f"Using the sorting method {bold(argument)} for sorting...")
+            if not json_output:
+                print(f"Using the sorting method {bold(argument)} for sorting...")
             logger.info(f"Using {argument} sorting for sorting.")
             del positional_arguments[index]
             break
 
     factor_candidate = positional_arguments[0] if positional_arguments else None
 
+    if json_output:
+        if factor_candidate not in factors:
+            suggestion = difflib.get_close_matches(factor_candidate or "", factors, n=1, cutoff=0.6)
+            json_fail(f"Not a valid factor: {factor_candidate!r}.", suggestion=suggestion[0] if suggestion else None, factors=factors)
+        emit_json(comparison_summary(compare(factor_candidate, order=sorting_method, dataset=dataset)))
+        sys.exit(0)
+
     if factor_candidate and factor_candidate not in factors:
         suggestion = difflib.get_close_matches(factor_candidate, factors, n=1, cutoff=0.6)
         if suggestion:
@@ -672,88 +687,13 @@ def f_compare():
             logger.warn(f"No direct match found for '{factor_candidate}'.")
             factor_candidate = None
 
-    def get_key_by_input(
-        element_data: dict[str, Any],
-        isotope_data: dict[str, Any],
-        factor: str
-    ) -> Any | None:
-        nonlocal determiner
-        result = None
-        try:
-            match factor:
-                case "protons":
-                    result = element_data["nuclear"]["protons"]
-                case "electrons":
-                    result = element_data["nuclear"]["electrons"]
-                case "neutrons":
-                    result = element_data["nuclear"]["neutrons"]
-                case "mass_number":
-                    result = element_data["nuclear"]["protons"] + element_data["nuclear"]["neutrons"]
-                case "up_quarks":
-                    result = (element_data["nuclear"]["protons"] * 2) + element_data["nuclear"]["neutrons"]
-                case "down_quarks":
-                    result = element_data["nuclear"]["protons"] + (element_data["nuclear"]["neutrons"] * 2)
-                case "isotopes":
-                    result = len(list(isotope_data.keys()))
-                case "melting_point":
-                    determiner = "°C"
-                    result = element_data["physical"]["melt"]
-                case "boiling_point":
-                    determiner = "°C"
-                    result = element_data["physical"]["boil"]
-                case "atomic_mass":
-                    determiner = "g/mol"
-                    result = element_data["physical"]["atomic_mass"]
-                case "electronegativity":
-                    result = element_data["electronic"]["electronegativity"]
-                case "electron_affinity":
-                    determiner = "eV"
-                    result = element_data["electronic"]["electronegativity"]
-                case "ionization_energy":
-                    determiner = "eV"
-                    result = element_data["electronic"]["ionization_energy"]
-                case "calculated_radius" | "empirical_radius" | "covalent_radius" | "van_der_waals_radius":
-                    determiner = "pm"
-                    result = element_data["measurements"]["radius"][factor.replace("_radius", "")]
-                case "brinell_hardness" | "mohs_hardness" | "vickers_hardness":
-                    determiner = f"kgf/{mm2}" if determiner != "mohs_hardness" else ""
-                    result = element_data["measurements"]["hardness"][factor.replace("_hardness", "")]
-                case "bulk_modulus" | "young_modulus" | "shear_modulus":
-                    determiner = "GPa"
-                    result = element_data["measurements"]["moduli"][factor.replace("_modulus", "")]
-                case "poissons_ratio":
-                    result = element_data["measurements"]["moduli"]["poissons_ratio"]
-                case "stp_density":
-                    determiner = f"kg/{m3}"
-                    result = element_data["measurements"]["density"]["STP"]
-                case "liquid_density":
-                    determiner = f"kg/{m3}"
-                    result = element_data["measurements"]["density"]["liquid"]
-                case "sound_transmission_speed":
-                    determiner = "m/s"
-                    result = element_data["measurements"]["sound_transmission_speed"]
-                case _:
-                    return None
-        except (KeyError, ValueError) as error:
-            logger.warn(f"Missing or invalid {factor} for {element_data['general']['fullname']}: {error}")
-            return None
-
-        try:
-            return float(result) if result is not None else None
-        except (ValueError, TypeError) as error:
-            logger.warn(f"Couldn't convert data {result} from anything else to float: {error}")
-            return None
-
-    compare_tip = "\n" + compare_tip if compare_tip else ""
+    tip = "\n" + compare_tip if compare_tip else ""
 
     formatted_factors = ', '.join(map(lambda element: bold(element), factors))
-    formatted_factors = "\n" + "\n\n".join(
-        textwrap.fill(paragraph.strip(), width=round(terminal_width * 1.25), initial_indent="    ", subsequent_indent="")
-        for paragraph in formatted_factors.strip().split("\n\n")
-    ) + "\n"
+    formatted_factors = "\n" + wrap_paragraphs(formatted_factors, round(terminal_width * 1.25)) + "\n"
 
     if factor_candidate not in factors:
-        print(f"Please enter a factor to compare all the elements with. The valid factors are:\n  {formatted_factors}{dim(compare_tip)}")
+        print(f"Please enter a factor to compare all the elements with. The valid factors are:\n  {formatted_factors}{dim(tip)}")
 
     while True:
         if factor_candidate and factor_candidate in factors:
@@ -776,25 +716,20 @@ def f_compare():
     print(f"\nComparing all elements by factor {bold(factor)} in a(n) {bold(sorting_method)} order... {dim('(Please note that some elements may be missing, and the data is trimmed up to 4 digits of float numbers.)')}\n")
     logger.info(f"Comparing all elements by factor {factor}...")
 
-    result: dict[str, float | int | None] = {}
+    comparison = compare(factor, order=sorting_method, dataset=dataset)
+    determiner = format_unit(comparison.unit)
 
-    for element_name, element_value in full_element_data.items():
-        isotope_value = full_isotope_data.get(element_name, {})
-        result[element_name] = get_key_by_input(element_value, isotope_value, factor)
-
-    valid_results = [(name, value) for name, value in result.items() if value is not None]
+    valid_results = [(name, value) for name, value in comparison.values if value is not None]
     if not valid_results:
         print(fore(f"No valid data for {factor}", RED))
         logger.error(f"No elements have valid {factor} data")
         sys.exit(0)
 
-    sorted_results = sort_results(result, sorting_method)
-
     max_value = max(value for _, value in valid_results) or 1
     none_counter = 0
     none_list: list[str] = []
 
-    for name, value in sorted_results:
+    for name, value in comparison.values:
         if value is not None:
             padding = 30 + len(determiner)
             bar_space = max(terminal_width - padding, 10)
@@ -823,8 +758,60 @@ def f_compare():
         print(fore(f"{none_counter} element(s) do not have a value in {bold(factor)}, and they are;\n  {formatted_nones}", NULL))
     sys.exit(0)
 
+def print_bond_matrix(matrix: BondMatrix) -> None:
+    # Every cell is looked up from a ramp built once, and the whole grid goes out in a single write
+    cell = "██" if verbose_output else None
+    ramp = {
+        "nonpolar covalent": fore(cell or "n ", BLUE),
+        "polar covalent": fore(cell or "p ", YELLOW),
+        "ionic": fore(cell or "i ", RED),
+        None: dim("··" if verbose_output else ". "),
+    }
+
+    lines = ["    " + " ".join(f"{symbol:<2}" for symbol in matrix.symbols)]
+    for symbol, row in zip(matrix.symbols, matrix.kinds()):
+        lines.append(f" {bold(f'{symbol:<2}')} " + " ".join(ramp[kind] for kind in row))
+
+    legend = ", ".join([
+        f"{ramp['nonpolar covalent'].rstrip()} nonpolar covalent (< {NONPOLAR_LIMIT})",
+        f"{ramp['polar covalent'].rstrip()} polar covalent (< {POLAR_LIMIT})",
+        f"{ramp['ionic'].rstrip()} ionic",
+        f"{ramp[None].rstrip()} no electronegativity",
+    ])
+    masked = sum(1 for value in matrix.electronegativities if value is None)
+
+    sys.stdout.write("\n" + "\n".join(lines) + f"\n\n {legend}\n")
+    sys.stdout.write(dim(f" ({len(matrix.symbols) - masked} of {len(matrix.symbols)} elements have an electronegativity; Pauling scale)") + "\n\n")
+
+def f_bond_matrix():
+    from periodica.export import export_bond_matrix
+
+    f_redirect("--bond-type --matrix", "bond type matrix")
+    matrix = bond_matrix(dataset=dataset)
+
+    if json_output:
+        emit_json({**matrix._asdict(), "kinds": matrix.kinds()})
+        sys.exit(0)
+
+    if positional_arguments:
+        destination = pathlib.Path(positional_arguments[0]).expanduser()
+        try:
+            count = export_bond_matrix(destination, dataset=dataset)
+        except OSError as error:
+            print(fore(f"Could not write {destination}: {error.strerror}", RED))
+            logger.abort(f"Bond matrix export failed: {error}")
+        print(f"Successfully saved the {count}x{count} electronegativity difference matrix to {destination}.")
+        sys.exit(0)
+
+    with paged_output():
+        print_bond_matrix(matrix)
+    sys.exit(0)
+
 def f_bond_type():
-    global full_element_data, positional_arguments
+    global positional_arguments
+
+    if matrix_output:
+        f_bond_matrix()
 
     f_redirect("--bond-type", "bond type")
 
@@ -834,13 +821,15 @@ def f_bond_type():
     primary_element = resolve_element("primary", arg1)
     secondary_element = resolve_element("secondary", arg2)
 
-    p_name = primary_element["general"]["fullname"]
-    s_name = secondary_element["general"]["fullname"]
+    bond = classify_elements(primary_element, secondary_element, dataset=dataset)
 
-    p_en = primary_element["electronic"]["electronegativity"]
-    s_en = secondary_element["electronic"]["electronegativity"]
+    if json_output:
+        if bond is None:
+            json_fail("One or both elements lack electronegativity values, so the bond type is unknown.")
+        emit_json(bond._asdict())
+        sys.exit(0)
 
-    if p_en is None or s_en is None:
+    if bond is None:
         print(fore(
             "Failed to fetch bond type; one or both elements lack "
             "electronegativity values (likely inert).",
@@ -848,19 +837,18 @@ def f_bond_type():
         ))
         sys.exit(0)
 
-    diff = abs(p_en - s_en)
-
-    if diff < 0.4:
-        bond_type = fore("Nonpolar Covalent", BLUE) + " -"
-    elif diff < 1.7:
-        bond_type = fore("Polar Covalent", YELLOW) + (" δ" if verbose_output else " d")
-    else:
-        bond_type = fore("Ionic", RED) + (" →" if verbose_output else " >")
+    match bond.kind:
+        case "nonpolar covalent":
+            bond_type = fore("Nonpolar Covalent", BLUE) + " -"
+        case "polar covalent":
+            bond_type = fore("Polar Covalent", YELLOW) + (" δ" if verbose_output else " d")
+        case _:
+            bond_type = fore("Ionic", RED) + (" →" if verbose_output else " >")
 
     print()
-    print(f"Primary element ({p_name}) electronegativity: {bold(p_en)}")
-    print(f"Secondary element ({s_name}) electronegativity: {bold(s_en)}")
-    print(f"Difference: {bold(f'{diff:.3f}')}")
+    print(f"Primary element ({bond.first}) electronegativity: {bold(bond.first_electronegativity)}")
+    print(f"Secondary element ({bond.second}) electronegativity: {bold(bond.second_electronegativity)}")
+    print(f"Difference: {bold(f'{bond.difference:.3f}')}")
     print(f"Bond type: {bond_type} (Pauling scale)")
     print()
 
@@ -868,10 +856,13 @@ def f_bond_type():
 
 def f_random():
     global current_element_data
-    print("Picking a random element for you...")
     logger.info("Picking a random element...")
 
     current_element_data = random.choice(list(full_element_data.values()))
+    if json_output:
+        return
+
+    print("Picking a random element for you...")
     print(f"I pick {bold(current_element_data["general"]["fullname"])} for you!")
     logger.info(f"Picked {current_element_data["general"]["fullname"]} as a random element.")
 
@@ -899,6 +890,7 @@ def f_raw():
 
     update_symbols(False)
     update_color_configs(False)
+    profiler.plain = True
 
 def f_hide_isotopes():
     global hide_isotopes
@@ -906,47 +898,651 @@ def f_hide_isotopes():
 
     logger.info("Disabled isotope display.")
 
+def f_json():
+    global json_output
+    json_output = True
+
+    logger.info("Enabled JSON output.")
+
+def f_matrix():
+    global matrix_output
+    matrix_output = True
+
+    if "--bond-type" not in separated_flags and "-B" not in separated_flags:
+        logger.warn("The --matrix flag only changes --bond-type; ignoring it.")
+    logger.info("Enabled the bond type matrix.")
+
+def f_no_pager():
+    global use_pager
+    use_pager = False
+
+    logger.info("Disabled the pager.")
+
+def f_isotope_window():
+    global isotopes_limit, isotopes_page
+
+    for flag in ("--isotopes-limit", "--isotopes-page"):
+        if flag not in separated_flags:
+            continue
+        value = flag_values.get(flag, "")
+        if not value.isdigit() or int(value) < 1:
+            print(fore(f"The {bold(flag)} flag needs a whole number of at least 1, e.g. {flag} 2.", RED))
+            logger.abort(f"Invalid value for {flag}: {value!r}")
+
+    if "--isotopes-limit" in separated_flags:
+        isotopes_limit = int(flag_values["--isotopes-limit"])
+    if "--isotopes-page" in separated_flags:
+        isotopes_page = int(flag_values["--isotopes-page"])
+        isotopes_limit = isotopes_limit or ISOTOPES_PAGE_SIZE
+
+    logger.info(f"Showing isotopes {isotopes_limit} at a time, page {isotopes_page}.")
+
+def f_sections():
+    global card_sections
+
+    value = flag_values.get("--section", "")
+    requested = [name.strip().lower() for name in value.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in CARD_SECTIONS]
+
+    if not requested or unknown:
+        print(fore(f"The {bold('--section')} flag needs a comma-separated list of sections out of: {', '.join(CARD_SECTIONS)}.", RED))
+        logger.abort(f"Invalid value for --section: {value!r}")
+
+    # The card keeps its own order, whatever order the sections were asked for in
+    card_sections = tuple(section for section in CARD_SECTIONS if section in requested)
+
+    logger.info(f"Only showing the card sections: {card_sections}")
+
+def isotope_blocks(nuclides: Iterable[tuple[str, dict[str, Any]]], fullname: str) -> Iterator[str]:
+    # Each block is only formatted once the consumer asks for it, so closing the pager early stops the rendering
+    for isotope, information in nuclides:
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            print_isotope(isotope, information, fullname)
+        yield buffer.getvalue()
+
+@contextlib.contextmanager
+def paged_output() -> Iterator[None]:
+    # Like git, the pager is only used on a terminal, and LESS=FRX makes it print short output directly
+    if not use_pager or json_output or not sys.stdout.isatty():
+        yield
+        return
+
+    import subprocess, shlex
+
+    command = os.environ.get("PERIODICA_PAGER") or os.environ.get("PAGER") or "less"
+    try:
+        pager = subprocess.Popen(
+            shlex.split(command), stdin=subprocess.PIPE, text=True, encoding="utf-8", bufsize=1,
+            env={"LESS": "FRX", **os.environ},
+        )
+    except (OSError, ValueError) as error:
+        logger.warn(f"Could not start the pager {command!r}: {error}")
+        yield
+        return
+
+    stdout = sys.stdout
+    sys.stdout = pager.stdin
+    try:
+        yield
+    except BrokenPipeError:
+        logger.info("The pager was closed before the output ended.")
+    finally:
+        sys.stdout = stdout
+        try:
+            pager.stdin.close() # type: ignore
+        except BrokenPipeError:
+            pass
+        pager.wait()
+
+def emit_json(data: Any) -> None:
+    json.dump(data, sys.stdout, ensure_ascii=False)
+    sys.stdout.write("\n")
+
+def json_fail(message: str, **details: Any) -> None:
+    # Nothing is asked interactively in JSON mode; a failed lookup is reported as an error object instead
+    emit_json({"error": message, **details})
+    logger.abort(message)
+
+def f_refresh():
+    f_redirect("--refresh", "data refresh")
+
+    base_url = positional_arguments[0] if positional_arguments else DATA_BASE_URL
+    refresh_dataset(base_url)
+
+    # Shells keep completing from the old data until the candidate cache is rebuilt
+    if COMPLETIONS_DIR.is_dir():
+        load_data()
+        update_completion_cache()
+    sys.exit(0)
+
+def f_profile():
+    profiler.enable()
+    logger.info("Enabled profiling; a timing summary will be printed to stderr on exit.")
+
+def f_profile_dump():
+    profiler.enable(dump=True)
+    logger.info("Enabled profiling with cProfile and tracemalloc dumps.")
+
+def print_table(columns: list[str], rows: list[tuple[Any, ...]]) -> None:
+    cells = [[("NULL" if value is None else str(value))[:MAX_CELL_WIDTH] for value in row] for row in rows]
+    widths = [max([len(column)] + [len(row[index]) for row in cells]) for index, column in enumerate(columns)]
+
+    print(bold("  ".join(column.ljust(width) for column, width in zip(columns, widths))))
+    for row in cells:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+
+def f_sql():
+    import sqlite3
+    from periodica.sqlite import PREPARED_QUERIES, compile_database, database_hash, connect, run_query, run_prepared
+
+    f_redirect("--sql", "SQL query")
+
+    if not positional_arguments:
+        print(f"Give the {bold('--sql')} flag an SQL statement in quotes, or one of these prepared queries with its arguments:\n")
+        for name, (parameters, description, _) in PREPARED_QUERIES.items():
+            arguments = " ".join(fore(parameter, BLUE) for parameter in parameters)
+            print(f"  {bold(name)} {arguments}")
+            print(f"    {dim(description)}")
+        print()
+        sys.exit(0)
+
+    # The database is compiled from the data files, and compiled again whenever they change
+    if not data_hash or database_hash(DATABASE_FILE) != data_hash:
+        print(dim(f"Compiling the dataset into {DATABASE_FILE}..."))
+        logger.info("Compiling the SQLite database.")
+        compile_database(DATABASE_FILE, dataset=dataset, data_hash=data_hash)
+
+    connection = connect(DATABASE_FILE)
+    try:
+        if positional_arguments[0] in PREPARED_QUERIES:
+            columns, rows = run_prepared(connection, positional_arguments[0], positional_arguments[1:])
+        else:
+            columns, rows = run_query(connection, " ".join(positional_arguments))
+    except (sqlite3.Error, ValueError) as error:
+        print(fore(f"The query failed: {error}", RED))
+        logger.abort(f"SQL query failed: {error}")
+    finally:
+        connection.close()
+
+    logger.info(f"SQL query returned {len(rows)} row(s).")
+    if json_output:
+        emit_json([dict(zip(columns, row)) for row in rows])
+        sys.exit(0)
+
+    if columns:
+        print_table(columns, rows)
+    print()
+    print(dim(f"{len(rows)} row(s)"))
+    sys.exit(0)
+
+def init_render_worker(width: int, raw: bool, hide: bool) -> None:
+    global terminal_width, hide_isotopes
+
+    # Forked workers inherit the loaded data and the --raw patches; spawned ones have to set them up again
+    terminal_width = width
+    hide_isotopes = hide
+    if raw and verbose_output:
+        f_raw()
+    if not full_element_data:
+        load_data()
+
+def render_card(name: str, directory: str, extension: str) -> tuple[str, int]:
+    import io, contextlib, tempfile
+
+    element = full_element_data[name]
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        print_element_card(element)
+    content = buffer.getvalue().encode("utf-8")
+
+    target = pathlib.Path(directory) / f"{element['general']['atomic_number']:03}-{name.lower()}{extension}"
+    descriptor, temporary = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".part", dir=directory)
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(content)
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, target)
+    except BaseException:
+        pathlib.Path(temporary).unlink(missing_ok=True)
+        raise
+
+    return target.name, len(content)
+
+def f_render_all():
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    f_redirect("--render-all", "card rendering")
+
+    if not positional_arguments:
+        print(fore(f"Give the {bold('--render-all')} flag a directory to write the cards into.", RED))
+        logger.abort("No output directory given for --render-all.")
+
+    directory = pathlib.Path(positional_arguments[0]).expanduser()
+    width = RENDER_WIDTH
+    if len(positional_arguments) > 1:
+        if not positional_arguments[1].isdigit() or int(positional_arguments[1]) < 40:
+            print(fore("The card width has to be a whole number of at least 40 columns.", RED))
+            logger.abort(f"Invalid render width: {positional_arguments[1]}")
+        width = int(positional_arguments[1])
+
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError as error:
+        print(fore(f"Could not create {directory}: {error.strerror}", RED))
+        logger.abort(f"Could not create the render directory: {error}")
+
+    raw = not verbose_output
+    extension = ".txt" if raw else ".ans"
+    names = list(full_element_data)
+
+    # Forking shares the data loaded here with every worker instead of each one parsing it again
+    context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+    workers = min(os.cpu_count() or 1, len(names)) or 1
+
+    print(f"Rendering {bold(len(names))} cards at {width} columns into {directory} with {workers} worker(s)...")
+    logger.info(f"Rendering {len(names)} cards into {directory} ({workers} workers, width {width}, raw {raw}).")
+
+    start = time.perf_counter()
+    written = 0
+    failures: list[str] = []
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=init_render_worker, initargs=(width, raw, hide_isotopes)) as executor:
+        futures = {executor.submit(render_card, name, str(directory), extension): name for name in names}
+        for future in as_completed(futures):
+            try:
+                written += future.result()[1]
+            except Exception as error:
+                failures.append(futures[future])
+                logger.warn(f"Failed to render {futures[future]}: {error!r}")
+
+    elapsed = time.perf_counter() - start
+    rendered = len(names) - len(failures)
+
+    print(f"Rendered {bold(rendered)} cards ({written / 1024:.1f} KiB) in {elapsed:.2f}s: {rendered / elapsed:.1f} cards/s, {written / 1024 / 1024 / elapsed:.2f} MiB/s.")
+    if failures:
+        print(fore(f"Failed to render {len(failures)} card(s): {conjunction_join(failures)}. Check the log for details.", RED))
+    sys.exit(0)
+
+def f_serve():
+    import asyncio
+    from periodica.server import ApiServer, ENDPOINTS, DEFAULT_HOST, DEFAULT_PORT
+
+    f_redirect("--serve", "API server")
+
+    host, port = DEFAULT_HOST, DEFAULT_PORT
+    if positional_arguments:
+        host_part, _, port_part = positional_arguments[0].rpartition(":")
+        if not port_part.isdigit() or not 0 < int(port_part) < 65536:
+            print(fore("Give the address as host:port or just a port, e.g. 127.0.0.1:8765.", RED))
+            logger.abort(f"Invalid server address: {positional_arguments[0]}")
+        host, port = host_part or DEFAULT_HOST, int(port_part)
+
+    def ready(_) -> None:
+        print(f"Serving the periodica API on {bold(f'http://{host}:{port}/')}")
+        for endpoint, description in ENDPOINTS.items():
+            print(f"  {fore(endpoint, BLUE)} {dim(description)}")
+        print(dim("Press Ctrl+C to stop."))
+
+    server = ApiServer(dataset)
+    try:
+        asyncio.run(server.serve(host, port, ready=ready))
+    except KeyboardInterrupt:
+        print(f"\nStopped after {server.requests} request(s).")
+    except OSError as error:
+        print(fore(f"Could not start the server on {host}:{port}: {error.strerror}", RED))
+        logger.abort(f"Could not start the API server: {error}")
+
+    logger.info(f"API server stopped after {server.requests} requests.")
+    sys.exit(0)
+
+REPL_COMMANDS = {
+    "compare": "compare <factor> [ascending | descending | name]",
+    "bond": "bond <element> <element>",
+    "export": "export <element | isotope> or export all | nuclides [filters...] [csv | ndjson] [path]",
+    "random": "random",
+    "help": "help",
+    "quit": "quit",
+}
+
+def element_words() -> list[str]:
+    words: list[str] = []
+    for element in full_element_data.values():
+        words += [element["general"]["fullname"].lower(), element["general"]["symbol"]]
+    return words
+
+def isotope_words() -> list[str]:
+    words: list[str] = []
+    for element in full_element_data.values():
+        for key, nuclide in dataset.read_isotopes(element).items():
+            words.append(key)
+            words += [key + label for label in nuclide.get("metastable") or {}]
+    return words
+
+def build_completion_tries() -> dict[str, PrefixTrie]:
+    elements = PrefixTrie(element_words())
+    lookups = PrefixTrie(elements.complete("") + isotope_words())
+    return {
+        "command": PrefixTrie(list(REPL_COMMANDS) + lookups.complete("")),
+        "element": elements,
+        "lookup": lookups,
+        "compare": PrefixTrie(list(COMPARE_FACTORS) + list(SORTING_METHODS)),
+        "export": PrefixTrie(["all", "nuclides", "csv", "ndjson"] + lookups.complete("")),
+    }
+
+def make_repl_completer(readline: Any, tries: dict[str, PrefixTrie]) -> Callable[[str, int], str | None]:
+    cache: dict[str, Any] = {"key": None, "matches": []}
+
+    def complete(text: str, state: int) -> str | None:
+        # Readline asks for one match at a time (state 0, 1, ...), so the matches are worked out once per prefix
+        words = readline.get_line_buffer()[:readline.get_begidx()].split()
+        if state == 0 or cache["key"] != (tuple(words), text):
+            if not words:
+                trie = tries["command"]
+            else:
+                trie = {"compare": tries["compare"], "bond": tries["element"], "export": tries["export"]}.get(words[0].lower())
+            cache["key"] = (tuple(words), text)
+            cache["matches"] = [match + " " for match in trie.complete(text)] if trie else []
+        return cache["matches"][state] if state < len(cache["matches"]) else None
+
+    return complete
+
+def repl_lookup(query: str) -> None:
+    if query.lower() == "random":
+        f_random()
+        element = current_element_data
+    else:
+        element, suggestion = find_isotope(query)
+        if element is None:
+            if suggestion:
+                print(fore(f"Could not find that element or isotope. Did you mean {bold(suggestion)}?", YELLOW))
+            elif not parse_isotope(query)["mass_number"]:
+                print(fore("Could not find that element or isotope.", RED))
+            return
+        if element is True:
+            # Isotopes print themselves
+            return
+
+    if json_output:
+        emit_json(element_summary(element, dataset=dataset, isotopes=not hide_isotopes, sections=card_sections))
+    else:
+        with paged_output():
+            print_element_card(element)
+
+def f_repl():
+    global positional_arguments, export_enabled, isotope_logic
+
+    f_redirect("--repl", "REPL")
+
+    try:
+        import readline
+    except ImportError:
+        readline = None
+        logger.warn("readline is not available; the REPL runs without history and completion.")
+
+    if readline is not None:
+        readline.set_completer(make_repl_completer(readline, build_completion_tries()))
+        readline.set_completer_delims(" \t")
+        # macOS ships libedit instead of GNU readline, which takes a different binding syntax
+        readline.parse_and_bind("bind ^I rl_complete" if "libedit" in (readline.__doc__ or "") else "tab: complete")
+        readline.set_history_length(REPL_HISTORY_LENGTH)
+        try:
+            readline.read_history_file(REPL_HISTORY_FILE)
+        except OSError:
+            pass
+
+    print(f"{bold('periodica')} REPL: type an element or isotope to look it up, or {bold('help')} for the commands. {dim('Tab completes.')}")
+
+    while True:
+        try:
+            line = input("periodica> ").strip()
+        except EOFError:
+            print()
+            break
+        except KeyboardInterrupt:
+            print()
+            continue
+
+        if not line:
+            continue
+
+        command, *arguments = line.split()
+        command = command.lower()
+        logger.info(f"REPL input: \"{line}\"")
+
+        if command in ("quit", "q", "exit"):
+            break
+        if command == "help":
+            for usage in REPL_COMMANDS.values():
+                print(f"  {usage}")
+            print(f"  {dim('Anything else is looked up as an element or isotope.')}")
+            continue
+
+        # The command handlers read their arguments from the same global as the command line ones, and end with sys.exit()
+        positional_arguments = arguments
+        export_enabled = False
+        isotope_logic = False
+        try:
+            match command:
+                case "compare":
+                    f_compare()
+                case "bond":
+                    f_bond_type()
+                case "export":
+                    f_export()
+                case _:
+                    repl_lookup(line)
+        except SystemExit:
+            pass
+        except KeyboardInterrupt:
+            print()
+
+    if readline is not None:
+        try:
+            readline.write_history_file(REPL_HISTORY_FILE)
+        except OSError as error:
+            logger.warn(f"Could not save the REPL history: {error}")
+
+    print("Okay. Exiting...")
+    sys.exit(0)
+
+def update_completion_cache() -> None:
+    flags = sorted(valid_flags, key=lambda flag: (not flag.startswith("--"), flag))
+    write_completion_cache(COMPLETIONS_DIR, {
+        "flags": flags,
+        "lookups": element_words() + isotope_words(),
+        "factors": list(COMPARE_FACTORS) + list(SORTING_METHODS),
+    })
+    logger.info(f"Wrote the shell completion candidates to {COMPLETIONS_DIR}.")
+
+def f_completions():
+    f_redirect("--completions", "shell completion")
+
+    shell = positional_arguments[0].lower() if positional_arguments else os.path.basename(os.environ.get("SHELL", ""))
+    if shell not in COMPLETION_SHELLS:
+        print(fore(f"Give the {bold('--completions')} flag one of: {', '.join(COMPLETION_SHELLS)}.", RED), file=sys.stderr)
+        logger.abort(f"Unsupported shell for completions: {shell!r}")
+
+    try:
+        update_completion_cache()
+    except OSError as error:
+        print(fore(f"Could not write the completion cache: {error}", RED), file=sys.stderr)
+        logger.abort(f"Could not write the completion cache: {error}")
+
+    # Only the script goes to stdout, so it can be redirected or sourced directly
+    sys.stdout.write(completion_script(shell, COMPLETIONS_DIR))
+    sys.exit(0)
+
+def molar_mass_summary(result: MolarMass) -> dict[str, Any]:
+    return {
+        "formula": result.formula,
+        "molar_mass": result.mass,
+        "charge": result.charge,
+        "components": [component._asdict() for component in result.components],
+    }
+
+def run_batch(
+    lines: Iterable[str], key: str, evaluate: Callable[[str], Any], summarize: Callable[[str, Any], dict[str, Any]], describe: Callable[[Any], str]
+) -> None:
+    # One input per line, one line out per input in the same order; a bad input doesn't stop the batch
+    write = sys.stdout.write
+    evaluated = failed = 0
+    start = time.perf_counter()
+
+    for number, line in enumerate(lines, 1):
+        text = line.strip()
+        if not text or text.startswith("#"):
+            continue
+        evaluated += 1
+
+        try:
+            result = evaluate(text)
+        except (FormulaError, BalanceError) as error:
+            failed += 1
+            if json_output:
+                details = {"position": error.position} if isinstance(error, FormulaError) else {}
+                write(json.dumps({key: text, "error": str(error), **details}, ensure_ascii=False) + "\n")
+            else:
+                write(f"{text}\tN/A\n")
+                print(fore(f"Line {number}: {error}", RED), file=sys.stderr)
+            continue
+
+        if json_output:
+            write(json.dumps(summarize(text, result), ensure_ascii=False) + "\n")
+        else:
+            write(f"{text}\t{describe(result)}\n")
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"Evaluated {evaluated} {key}(s), {failed} failed, in {elapsed:.3f}s.")
+
+def print_molar_mass(result: MolarMass) -> None:
+    charge = ""
+    if result.charge:
+        charge = f" (charge {result.charge:+d}, electrons included)"
+
+    print()
+    print(f"Molar mass of {bold(result.formula)}: {bold(fore(f'{result.mass:.5f}', BRIGHT_RED))} g/mol{charge}")
+    print()
+    print_table(
+        ["Element", "Atoms", "Mass (g/mol)", "Share"],
+        [
+            (f"{component.element} ({component.symbol})", component.count, f"{component.mass:.5f}", f"{component.fraction * 100:.2f}%")
+            for component in result.components
+        ],
+    )
+    print()
+
+def f_molar_mass():
+    f_redirect("--molar-mass", "molar mass")
+
+    if not positional_arguments:
+        if not sys.stdin.isatty():
+            run_batch(sys.stdin, "formula", lambda formula: molar_mass(formula, dataset=dataset), lambda _, result: molar_mass_summary(result), lambda result: f"{result.mass:.5f}")
+            sys.exit(0)
+
+        print(f"Give the {bold('--molar-mass')} flag one or more formulas, e.g. {bold('"Ca(OH)2"')} or {bold('CuSO4*5H2O')}.")
+        print(dim("(Tip: Pipe formulas into it, one per line, to evaluate a whole batch of them.)"))
+        sys.exit(0)
+
+    results: list[dict[str, Any]] = []
+    for formula in positional_arguments:
+        try:
+            result = molar_mass(formula, dataset=dataset)
+        except FormulaError as error:
+            if json_output and len(positional_arguments) == 1:
+                json_fail(str(error), formula=formula, position=error.position)
+            if json_output:
+                results.append({"formula": formula, "error": str(error), "position": error.position})
+                continue
+            print(fore(str(error), RED))
+            logger.warn(f"Invalid formula: {error}")
+            continue
+
+        if json_output:
+            results.append(molar_mass_summary(result))
+        else:
+            print_molar_mass(result)
+
+    if json_output:
+        emit_json(results[0] if len(results) == 1 else results)
+    sys.exit(0)
+
+def balanced_summary(equation: str, result: Balanced) -> dict[str, Any]:
+    return {
+        "equation": equation,
+        "balanced": result.equation,
+        "reactants": [{"species": species, "coefficient": coefficient} for coefficient, species in result.reactants],
+        "products": [{"species": species, "coefficient": coefficient} for coefficient, species in result.products],
+    }
+
+def print_balanced(result: Balanced) -> None:
+    def side(terms: tuple[tuple[int, str], ...]) -> str:
+        return " + ".join(f"{bold(fore(coefficient, GREEN)) if coefficient != 1 else ''}{species}" for coefficient, species in terms)
+
+    arrow = "→" if verbose_output else "->"
+    print()
+    print(f"{side(result.reactants)} {arrow} {side(result.products)}")
+    print()
+
+def f_balance():
+    f_redirect("--balance", "equation balancing")
+
+    if not positional_arguments:
+        if not sys.stdin.isatty():
+            run_batch(
+                sys.stdin, "equation", lambda equation: balance(equation, dataset=dataset),
+                balanced_summary, lambda result: result.equation,
+            )
+            sys.exit(0)
+
+        print(f"Give the {bold('--balance')} flag one or more equations in quotes, e.g. {bold('"Fe + O2 -> Fe2O3"')}.")
+        print(dim("(Tip: Pipe equations into it, one per line, to balance a whole batch of them.)"))
+        sys.exit(0)
+
+    results: list[dict[str, Any]] = []
+    for equation in positional_arguments:
+        try:
+            result = balance(equation, dataset=dataset)
+        except (FormulaError, BalanceError) as error:
+            if json_output and len(positional_arguments) == 1:
+                json_fail(str(error), equation=equation)
+            if json_output:
+                results.append({"equation": equation, "error": str(error)})
+                continue
+            print(fore(str(error), RED))
+            logger.warn(f"Could not balance {equation!r}: {error}")
+            continue
+
+        if json_output:
+            results.append(balanced_summary(equation, result))
+        else:
+            print_balanced(result)
+
+    if json_output:
+        emit_json(results[0] if len(results) == 1 else results)
+    sys.exit(0)
+
 def f_version():
     global PYPROJECT_FILE
-    from update import fetch_toml
+    from update import fetch_toml, load_version_check
 
     logger.info("User gave --version flag; showing version information.")
 
     local_version = fetch_toml()
+    latest_version = load_version_check()
+
+    if json_output:
+        emit_json({"version": local_version, "latest_version": latest_version, "python": platform.python_version()})
+        sys.exit(0)
 
     print(f"Version: {local_version}")
+    if latest_version:
+        print(f"Latest Version: {latest_version} {dim('(from the last update check)')}")
     print(f"Python Interpreter: {".".join(platform.python_version_tuple())}")
 
     sys.exit(0)
 
-# Extract symbol and number from an isotope
-def extract_isotope_factors(isotope: str) -> dict[str, str | None]:
-    text = isotope.strip().lower()
-
-    match = re.match(r"^(\d+)\s*([A-Za-z][a-z]?)$", text)
-    if match:
-        mass, identifier = match.groups()
-        return {
-            "mass_number": mass,
-            "raw_identifier": identifier,
-            "meta": None,
-        }
-
-    match = re.match(r"^([A-Za-z]+)[\s\-]*(\d+)(m\d*)?$", text)
-    if match:
-        identifier, mass, meta = match.groups()
-        return {
-            "mass_number": mass,
-            "raw_identifier": identifier.capitalize(),
-            "meta": meta,
-        }
-
-    return {
-        "mass_number": None,
-        "raw_identifier": None,
-        "meta": None,
-    }
-
 def show_decay(
     decays: dict[str, Any] | list[dict[str, Any]],
     display_name: str,
@@ -986,7 +1582,7 @@ def show_decay(
                 unsure = True
                 product = product[:-1]
 
-            parsed = extract_isotope_factors(product)
+            parsed = parse_isotope(product)
             product_number = parsed["mass_number"]
             product_symbol = parsed["raw_identifier"]
 
@@ -1071,7 +1667,7 @@ def print_isotope(isotope: str, isotope_data: dict[str, Any], fullname: str) ->
 
 # Formats an isotope respecting the isotope format
 def format_isotope(isotope: str, fullname: str, *, metastable: str = "") -> str:
-    factors = extract_isotope_factors(isotope)
+    factors = parse_isotope(isotope)
     mass = factors["mass_number"]
     meta = factors["meta"]
 
@@ -1082,101 +1678,61 @@ def format_isotope(isotope: str, fullname: str, *, metastable: str = "") -> str:
 
     return f"{fullname.capitalize()}-{mass}{meta_suffix}"
 
-def recognize_isotope(element_identifier: str, mass_number: str, search_query: str, meta: str = "") -> dict[str, Any] | bool:
+def recognize_isotope(element_identifier: str, mass_number: str, meta: str = "") -> dict[str, Any] | bool:
     global isotope_logic
 
-    element_data, _ = find_element(element_identifier)
-    if not element_data:
-        logger.warn(f"No element found for symbol or name: {element_identifier}")
-        print(fore(f"No element found for symbol or name: {element_identifier}", YELLOW))
-        return False
-
-    element_name = element_data["general"]["fullname"]
-    element_symbol = element_data["general"]["symbol"]
-
-    logger.info(f"Element match found for '{element_identifier}': {element_name} ({element_symbol})")
-
-    isotope_data = full_isotope_data.get(element_name, {})
-    if not isotope_data:
-        return False
-
-    base_key = f"{mass_number}{element_symbol.upper()}"
-    if base_key not in isotope_data:
-        base_key = f"{element_symbol.upper()}{mass_number}"
-
-    if base_key not in isotope_data:
-        print(fore(f"No isotope match found for mass number {mass_number} in element {element_name}.", YELLOW))
-        logger.warn(f"No isotope match found for mass number {mass_number} in element {element_name}")
+    try:
+        match = periodica.lookup.find_isotope(element_identifier, mass_number, meta, dataset=dataset)
+    except IsotopeNotFound as error:
+        if json_output:
+            json_fail(str(error))
+        print(fore(str(error), YELLOW))
+        logger.warn(str(error))
         return False
 
-    info = isotope_data[base_key]
-
-    if meta:
-        meta_key = meta.lower()
-        if "metastable" not in info or meta_key not in info["metastable"]:
-            print(fore(f"No metastable isomer {meta.upper()} found for {base_key}.", RED))
-            return False
-        info = info["metastable"][meta_key]
-
     isotope_logic = True
-    logger.info(f"Found isotope match: {base_key}{meta.upper() if meta else ''} ({mass_number}{element_symbol}) in {element_name}")
+    logger.info(f"Found isotope match: {match.isotope} in {match.fullname}")
 
     if export_enabled:
-        return {
-            "isotope": base_key + meta,
-            "symbol": element_symbol,
-            "fullname": element_name,
-            "info": info
-        }
+        return match._asdict()
+
+    if json_output:
+        emit_json(isotope_summary(match, dataset=dataset))
+        return True
 
     print_separator()
-    print_isotope(search_query, info, element_name)
+    print_isotope(match.nuclide, dataset.isotopes[match.fullname][match.nuclide], match.fullname)
     print_separator()
 
     return True
 
 def find_element(candidate: str) -> Tuple[dict[str, Any] | None, str | None]:
     logger.info(f"Searching for element match: {candidate}")
-    candidate = candidate.lower()
-    possible_names: list[str] = []
 
-    for _, element_candidate_data in enumerate(full_element_data.values()):
-        name = element_candidate_data["general"]["fullname"].lower()
-        symbol = element_candidate_data["general"]["symbol"].lower()
-        atomic_number = str(element_candidate_data["general"]["atomic_number"])
-
-        possible_names.extend([name, symbol])
+    try:
+        element = periodica.lookup.find_element(candidate, dataset=dataset)
+    except ElementNotFound as error:
+        if error.suggestion:
+            logger.warn(f"No direct match found for '{candidate}'. Found a close match; '{error.suggestion}'?")
+        else:
+            logger.warn(f"No match or suggestion found for input: '{candidate}'")
+        return None, error.suggestion
 
-        if candidate in (name, symbol, atomic_number):
-            logger.info(f"Exact match found: {name} ({symbol})")
-            return element_candidate_data, None
+    logger.info(f"Exact match found: {element['general']['fullname']} ({element['general']['symbol']})")
+    return element, None
 
-    suggestion = difflib.get_close_matches(candidate, possible_names, n=1, cutoff=0.6)
-    if suggestion:
-        logger.warn(f"No direct match found for '{candidate}'. Found a close match; '{suggestion[0]}'?")
-        return None, suggestion[0]
+def find_isotope(user_input: str) -> Tuple[Any | None, Any | None]:
+    parsed = parse_isotope(user_input)
+    mass_number = parsed["mass_number"]
+    identifier  = parsed["raw_identifier"]
+    meta        = parsed["meta"]
 
-    logger.warn(f"No match or suggestion found for input: '{candidate}'")
-    return None, None
+    if identifier and mass_number:
+        # Either the export record, or True once the isotope has been printed
+        result = recognize_isotope(identifier, mass_number, meta or "")
+        return (result, None) if result else (None, None)
 
-def find_isotope(user_input: str) -> Tuple[Any | None, Any | None]:
-    try:
-        index = int(user_input) - 1
-        search_result = full_element_data[list(full_element_data.keys())[index]]
-        return search_result, None
-    except (ValueError, IndexError):
-        parsed = extract_isotope_factors(user_input)
-        mass_number = parsed["mass_number"]
-        identifier  = parsed["raw_identifier"]
-        meta        = parsed["meta"]
-
-        if identifier and mass_number:
-            result = recognize_isotope(identifier, mass_number, user_input, meta or "")
-            if isinstance(result, dict):
-                return result, None
-            return None, None
-
-        return find_element(user_input)
+    return find_element(user_input)
 
 def safe_format(value: Any, measurement: str = "", *, placeholder: str = "None"):
     if value is not None:
@@ -1184,9 +1740,10 @@ def safe_format(value: Any, measurement: str = "", *, placeholder: str = "None")
 
     return fore(placeholder, NULL)
 
-# Information
-periodica_logo = bold(gradient("Periodica", (156, 140, 255), (140, 255, 245)) if verbose_output else fore("periodica", BLUE))
-program_information = f"""Welcome to {periodica_logo}!
+# The banner is only built for --info, after --raw has had a chance to disable styling
+def build_program_information() -> str:
+    periodica_logo = bold(gradient("Periodica", (156, 140, 255), (140, 255, 245)) if verbose_output else fore("periodica", BLUE))
+    return f"""Welcome to {periodica_logo}!
 
 This CLI brings you detailed information about elements in the periodic table, and it all started as a fun side project by Discord user {bold(fore("Lanzoor", INDIGO))} in {bold("March 2025")}. What began as a hobby quickly turned into a serious project.
 
@@ -1209,6 +1766,22 @@ Modifier flags can be stacked with main flags, and main flags change major logic
   Hide isotope information in element displays.
   {italic("Does not affect results when searching a specific isotope.")}
 
+- {bold("--isotopes-limit")} {fore("count", BLUE)} / {bold("--isotopes-page")} {fore("page", BLUE)}
+  Show only some of an element's isotopes, a page at a time (10 per page unless a limit is given).
+  {italic("On a terminal the card opens in a pager (less, or $PAGER); --no-pager prints it directly.")}
+
+- {bold("--section")} {fore("sections", BLUE)}
+  Only build and show some sections of the element card, e.g. --section nuclear,electronic.
+  {italic("Sections: general, nuclear, physical, electronic, measurements. Also narrows --json output.")}
+
+- {bold("--json")} / {bold("-J")}
+  Print machine-readable JSON instead of the formatted output, with the derived values (quarks, shells, unpaired electrons, Z_eff) included.
+  {italic("Works for element and isotope lookups, --random, --compare, --bond-type, --sql, --molar-mass, --balance, --heatmap and --version; failed lookups print an error object.")}
+
+- {bold("--profile")} / {bold("-P")}
+  Print a timing summary of every phase of the run to stderr when the program exits.
+  {italic("Use --profile-dump to also save cProfile and tracemalloc reports in ~/.periodica.")}
+
 - {bold("--random")} / {bold("-R")}
   Display information for a random element.
   {italic("Cannot be combined with other main flags like -C or -B.")}
@@ -1223,365 +1796,444 @@ Modifier flags can be stacked with main flags, and main flags change major logic
 - {bold("--update")} / {bold("-u")}
   Check for available updates.
 
+- {bold("--refresh")} [{fore("mirror URL", BLUE)}] / {bold("-F")}
+  Download fresh data JSON files, skipping the ones that did not change.
+
 - {bold("--export")} [{fore("element", BLUE)} | {fore("isotope", GREEN)}] / {bold("-X")}
   Export element or isotope data to a JSON file.
 
+- {bold("--export")} {fore("all", BLUE)} | {fore("nuclides", BLUE)} | {fore("filters...", GREEN)} [{fore("csv", RED)} | {fore("ndjson", RED)}] [{fore("gzip", RED)} | {fore("xz", RED)}] [{fore("path", RED)}] / {bold("-X")}
+  Stream every element (or nuclide) to an NDJSON or CSV file, optionally compressed; CSV flattens the nested data into columns.
+  {italic("Filters look like block=p, type=\"Noble gas\" or period<=3; the format can also come from the path, e.g. elements.csv.gz.")}
+
 - {bold("--compare")} [{fore("factor", RED)}] / {bold("-C")}
   Compare all elements by a chosen property (e.g., melting_point, atomic_mass).
 
 - {bold("--bond-type")} {fore("element1", BLUE)} {fore("element2", GREEN)} / {bold("-B")}
   Determine the bond type between two elements.
 
-For more details, please check the {bold("README.md")} file for installation instructions.
+- {bold("--bond-type")} {bold("--matrix")} [{fore("path", BLUE)}]
+  Show the bond type of every pair of elements as a colored grid, or save their electronegativity differences to a CSV file.
+  {italic("Elements without an electronegativity are masked. With --json, the whole matrix is printed as JSON.")}
 
-Enjoy exploring the periodic table!"""
+- {bold("--sql")} [{fore("statement", BLUE)} | {fore("prepared query", GREEN)} {fore("arguments...", GREEN)}] / {bold("-Q")}
+  Query the dataset compiled into a read-only SQLite database (tables: elements, nuclides, metastable_states, decays, decay_products).
+  {italic("Run it without arguments to list the prepared queries.")}
 
-logger.info("Program initialized.")
+- {bold("--repl")} / {bold("-L")}
+  Start an interactive session that keeps the data loaded between lookups, compares, bond types and exports.
+  {italic("Tab completes element names, symbols, isotopes and compare factors; history is kept in ~/.periodica/repl_history.")}
 
-# Terminal size logic
+- {bold("--completions")} {fore("bash", BLUE)} | {fore("zsh", BLUE)} | {fore("fish", BLUE)}
+  Print a shell completion script, and cache the candidates it completes from in ~/.periodica/completions.
+  {italic("For example: periodica --completions bash > ~/.local/share/bash-completion/completions/periodica")}
 
-try:
-    terminal_width = os.get_terminal_size().columns
-    terminal_height = os.get_terminal_size().lines
-    logger.info(f"Terminal size: {terminal_width}x{terminal_height} (width x height)")
-except OSError:
-    print(bold("You aren't running this on a terminal, which is very weird. We will try to ignore this issue, and will determine your terminal width as 80. Please move on like nothing ever happened."))
-    logger.warn("The script ran without a terminal, so failback to reasonable terminal width variable.")
-    terminal_width = 80
-    terminal_height = 40
-
-if terminal_width < 80:
-    print(fore(f"You are running this program in a terminal that has a width of {bold(str(terminal_width))},\nwhich may be too compact to display and provide the information.\nPlease try resizing your terminal.\nThis will still display content, but it may look broken or poorly word-wrapped.", RED))
-    logger.warn("Not enough width for terminal.")
+- {bold("--molar-mass")} {fore("formulas...", BLUE)} / {bold("-M")}
+  Calculate molar masses, with each element's share, from formulas with groups, hydrates and charges (e.g. "Ca(OH)2", CuSO4*5H2O, "SO4^2-").
+  {italic("Without formulas, one formula per line is read from stdin and a tab-separated formula and mass is printed for each.")}
 
-# JSON file logic
+- {bold("--balance")} {fore("equations...", BLUE)} / {bold("-E")}
+  Balance chemical equations like "Fe + O2 -> Fe2O3" or "MnO4^- + Fe^2+ + H^+ -> Mn^2+ + Fe^3+ + H2O" with exact integer coefficients.
+  {italic("Species are separated by ' + '; underdetermined or impossible equations are reported. Without equations, they are read from stdin.")}
 
-def fetch_and_replace(url: str, file_path: Path, description: str):
-    print(f"Getting content from {url} ({description})...")
-    response = get_response(url)
-    data = json.loads(response.text)  # type: ignore
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(response.text)  # type: ignore
+- {bold("--heatmap")} {fore("factor", BLUE)} / {bold("-T")}
+  Color every element of the periodic table by one of the --compare factors, from the lowest value (blue) to the highest (red).
+  {italic("Elements without a value are dimmed. In --raw mode, each symbol is followed by its step from 0 to 9.")}
 
-    logger.info(f"Successfully got {description} from {url}.")
-    print(f"Successfully replaced {description}.\n")
-    return data
+- {bold("--render-all")} {fore("directory", BLUE)} [{fore("width", GREEN)}] / {bold("-W")}
+  Render every element card into its own file in a directory, in parallel, at a fixed width (80 by default).
+  {italic("Combine it with --raw for plain text cards, or --hide-isotopes to leave the isotopes out.")}
 
-try:
-    with open(ELEMENT_DATA_FILE, 'r', encoding="utf-8") as file:
-        full_element_data = json.load(file)
-        logger.info("elements.json file was successfully found.")
-
-    with open(ISOTOPE_DATA_FILE, 'r', encoding="utf-8") as file:
-        full_isotope_data = json.load(file)
-        logger.info("isotopes.json file was successfully found.")
-except json.JSONDecodeError:
-    logger.warn("The data JSON files were modified.")
-    print("The data JSON files were modified and malformed.\nThis means you need fresh data JSON files, is it okay for me to get the file for you on GitHub? (y/N)")
-    data_malformed = True
-except FileNotFoundError:
-    logger.warn("The data JSON files were not found.")
-    print("The data JSON files were not found. Is it okay for me to get the file for you on GitHub? (y/N)")
-    data_malformed = True
-
-if data_malformed:
-    confirmation = input("> ").strip().lower()
-    if confirmation not in ["y", "yes"]:
-        print("Okay, exiting...")
-        logger.abort("User denied confirmation for fetching the correct data JSON files.")
-
-    full_element_data = fetch_and_replace(
-        "https://raw.githubusercontent.com/Lanzoor/periodica/main/src/elements.json",
-        ELEMENT_DATA_FILE,
-        "elements.json"
-    )
+- {bold("--serve")} [{fore("host:port", BLUE)}] / {bold("-S")}
+  Serve element, isotope, compare, bond type and decay chain lookups as a local HTTP JSON API (127.0.0.1:8765 by default).
+  {italic("src/loadtest.py measures its requests per second and latency.")}
 
-    full_isotope_data = fetch_and_replace(
-        "https://raw.githubusercontent.com/Lanzoor/periodica/main/src/isotopes.json",
-        ISOTOPE_DATA_FILE,
-        "isotopes.json"
-    )
+For more details, please check the {bold("README.md")} file for installation instructions.
 
-# Handling Flags
+Enjoy exploring the periodic table!"""
 
-user_input = None
+# Terminal size logic
 
-if len(sys.argv) > 1:
-    unrecognized_flags = [f for f in separated_flags if f not in valid_flags]
-    if unrecognized_flags:
-        print("Unrecognizable flags detected. Run the script with the --info flag for more information.")
-        logger.abort(f"Unrecognizable flags detected: {unrecognized_flags}")
+def probe_terminal() -> None:
+    global terminal_width, terminal_height
 
-    modifier_used = [f for f in separated_flags if f in modifier_flags]
-    primary_flags = [f for f in separated_flags if f not in modifier_flags]
+    try:
+        terminal_width = os.get_terminal_size().columns
+        terminal_height = os.get_terminal_size().lines
+        logger.info(f"Terminal size: {terminal_width}x{terminal_height} (width x height)")
+    except OSError:
+        print(bold("You aren't running this on a terminal, which is very weird. We will try to ignore this issue, and will determine your terminal width as 80. Please move on like nothing ever happened."))
+        logger.warn("The script ran without a terminal, so failback to reasonable terminal width variable.")
+        terminal_width = 80
+        terminal_height = 40
+
+    if terminal_width < 80:
+        print(fore(f"You are running this program in a terminal that has a width of {bold(str(terminal_width))},\nwhich may be too compact to display and provide the information.\nPlease try resizing your terminal.\nThis will still display content, but it may look broken or poorly word-wrapped.", RED))
+        logger.warn("Not enough width for terminal.")
 
-    logger.info(f"Modifiers: {modifier_used}")
-    logger.info(f"Primary flags: {primary_flags}")
-    logger.info(f"Positional args: {positional_arguments}")
+# JSON file logic
 
-    # Modifier flags
-    create_flag_event("--debug", "-d", f_callable=f_debug)
-    create_flag_event("--raw", "-r", f_callable=f_raw)
-    create_flag_event("--hide-isotopes", "-H", f_callable=f_hide_isotopes)
+def refresh_dataset(base_url: str = DATA_BASE_URL, *, force: bool = False) -> Tuple[dict[str, Any], dict[str, Any]]:
+    print(f"Getting content from {base_url} (elements.json and isotopes.json)...")
 
-    primary_flag = None
-    user_input = None
+    try:
+        element_data, isotope_data, statuses = refresh_data(base_url, force=force)
+    except RefreshError as error:
+        print(fore(str(error), RED))
+        logger.abort(f"Failed to refresh the data files: {error}")
+
+    for name, status in statuses.items():
+        if status == "updated":
+            print(f"Successfully replaced {name}.")
+        else:
+            print(f"{name} is already up-to-date.")
+        logger.info(f"Data refresh: {name} was {status}.")
 
-    if len(primary_flags) > 1:
-        print("Multiple main flags detected. Run the script with the --info flag for more information.")
-        logger.abort(f"Multiple main flags detected: {primary_flags}")
+    print()
+    return element_data, isotope_data # type: ignore
 
-    elif len(primary_flags) == 1:
-        primary_flag = primary_flags[0]
+def load_data() -> None:
+    global full_element_data, full_isotope_data, dataset, data_hash
+    data_malformed = False
 
-        # Case 1: primary flag requires positional argument
-        if primary_flag in positionarg_req_flags:
-            if (
-                len(positional_arguments) > 1
-                and primary_flag not in ["-C", "-B", "--compare", "--bond-type"]
-            ):
-                print(fore("Too many positional arguments. Refer to --info.", RED))
-                logger.abort("Too many positional arguments.")
+    profiler.begin("json load")
 
-            user_input = positional_arguments[0] if positional_arguments else None
+    try:
+        with open(ELEMENT_DATA_FILE, 'rb') as file:
+            element_bytes = file.read()
+            full_element_data = json.loads(element_bytes)
+            logger.info("elements.json file was successfully found.")
+
+        with open(ISOTOPE_DATA_FILE, 'rb') as file:
+            isotope_bytes = file.read()
+            logger.info("isotopes.json file was successfully found.")
+
+        # Schema validation only runs once per version of the data files; known-good hashes are remembered.
+        # Known-good isotope data is also trusted enough to be deserialized one element at a time, on demand.
+        data_hash = hash_data(element_bytes, isotope_bytes)
+        data_known_valid = is_known_valid(data_hash)
+        if data_known_valid:
+            isotope_index = get_isotope_index(isotope_bytes, data_hash, ISOTOPE_INDEX_FILE)
+            full_isotope_data = LazyIsotopes(isotope_bytes, isotope_index) # type: ignore
+        else:
+            full_isotope_data = json.loads(isotope_bytes)
+    except ValueError: # Includes json.JSONDecodeError and UnicodeDecodeError
+        logger.warn("The data JSON files were modified.")
+        print("The data JSON files were modified and malformed.\nThis means you need fresh data JSON files, is it okay for me to get the file for you on GitHub? (y/N)")
+        data_malformed = True
+    except FileNotFoundError:
+        logger.warn("The data JSON files were not found.")
+        print("The data JSON files were not found. Is it okay for me to get the file for you on GitHub? (y/N)")
+        data_malformed = True
+
+    if not data_malformed:
+        if data_known_valid:
+            logger.info("Data files match a previously validated version; skipping validation.")
+        else:
+            profiler.begin("schema validation")
+            problems = validate_dataset(full_element_data, full_isotope_data)
+            profiler.end("schema validation")
+
+            if problems:
+                for problem in problems:
+                    logger.warn(f"Schema problem: {problem}")
+
+                print(fore(f"The data JSON files failed validation with {len(problems)} problem(s):", RED))
+                for problem in problems[:MAX_SHOWN_PROBLEMS]:
+                    print(f"  - {problem}")
+                if len(problems) > MAX_SHOWN_PROBLEMS:
+                    print(dim(f"  ... and {len(problems) - MAX_SHOWN_PROBLEMS} more (see the execution log for all of them)"))
+                print("This means you need fresh data JSON files, is it okay for me to get the file for you on GitHub? (y/N)")
+                data_malformed = True
+            else:
+                remember_valid(data_hash)
+                logger.info("Data files passed schema validation.")
 
-        # Case 2: primary flag forbids positional arguments
-        elif primary_flag in positionarg_nreq_flags:
-            if len(positional_arguments) > 0:
-                print(fore("Unexpected positional argument. Refer to --info.", RED))
-                logger.abort("Unexpected additional arguments.")
+    if data_malformed:
+        confirmation = input("> ").strip().lower()
+        if confirmation not in ["y", "yes"]:
+            print("Okay, exiting...")
+            logger.abort("User denied confirmation for fetching the correct data JSON files.")
 
-        create_flag_event("--info", "-i", f_callable=f_info)
-        create_flag_event("--update", "-u", f_callable=f_update)
-        create_flag_event("--export", "-X", f_callable=f_export)
-        create_flag_event("--compare", "-C", f_callable=f_compare)
-        create_flag_event("--bond-type", "-B", f_callable=f_bond_type)
-        create_flag_event("--random", "-R", f_callable=f_random)
-        create_flag_event("--version", "-v", f_callable=f_version)
+        full_element_data, full_isotope_data = refresh_dataset(force=True)
+        data_hash = ""
 
-    else:
-        if len(positional_arguments) > 1:
-            print(fore("Too many positional arguments. Refer to --info.", RED))
-            logger.abort("Too many positional arguments.")
+    dataset = Dataset(full_element_data, full_isotope_data)
+    profiler.end("json load")
 
-        user_input = positional_arguments[0] if positional_arguments else None
-else:
-    logger.warn("No arguments provided, falling back to interactive input.")
 
-if user_input:
-    logger.info(f'Element positional argument entry given: "{user_input}"')
+def render_table(layout: TableLayout, cell: Callable[[str | None], str]) -> str:
+    # The whole table as one string, with the f-block rows set apart by a blank line
+    lines: list[str] = []
+    for index, row in enumerate(layout.rows):
+        if index == layout.main_rows:
+            lines.append("")
+        lines.append(("  " + " ".join(cell(name) for name in row)).rstrip())
+    return "\n".join(lines) + "\n"
 
-current_element_data = resolve_element_or_isotope(
-    label="search",
-    initial_input=user_input
-)
+def f_heatmap():
+    f_redirect("--heatmap", "heatmap")
 
-if isotope_logic:
-    sys.exit(0)
+    factors = list(COMPARE_FACTORS)
+    factor = positional_arguments[0].lower().replace(" ", "_") if positional_arguments else None
+    formatted_factors = wrap_paragraphs(", ".join(map(bold, factors)), round(terminal_width * 1.25))
 
-if debug_mode:
-    print("Printing data...")
-    pprint(
-        current_element_data,
-        indent=2,
-        width=terminal_width,
-        sort_dicts=False,
-        underscore_numbers=True
-    )
+    if factor is None:
+        print(f"Give the {bold('--heatmap')} flag a factor to color the periodic table by. The valid factors are:\n\n{formatted_factors}\n")
+        sys.exit(0)
 
-# Dividing categories
-general: dict[str, Any] = current_element_data["general"]
-historical: dict[str, Any] = current_element_data["historical"]
-nuclear: dict[str, Any] = current_element_data["nuclear"]
-electronic: dict[str, Any] = current_element_data["electronic"]
-physical: dict[str, Any] = current_element_data["physical"]
-measurements: dict[str, Any] = current_element_data["measurements"]
+    if factor not in factors:
+        suggestion = difflib.get_close_matches(factor, factors, n=1, cutoff=0.6)
+        if json_output:
+            json_fail(f"Unknown factor: {factor}", suggestion=suggestion[0] if suggestion else None)
+        hint = f" Did you mean \"{bold(suggestion[0])}\"?" if suggestion else ""
+        print(fore(f"Not a valid factor.{hint} The valid factors are:", RED) + f"\n\n{formatted_factors}\n")
+        logger.abort(f"Unknown heatmap factor: {factor}")
+
+    comparison = compare(factor, order="name", dataset=dataset)
+    values = dict(comparison.values)
+    present = [(value, name) for name, value in comparison.values if value is not None]
+    (low, low_name), (high, high_name) = (min(present), max(present)) if present else ((0.0, ""), (0.0, ""))
+
+    def step(value: float) -> int:
+        if high == low:
+            return 0
+        return min(HEATMAP_STEPS - 1, int((value - low) / (high - low) * HEATMAP_STEPS))
+
+    layout = dataset.layout
+    symbols = {name: element["general"]["symbol"] for name, element in dataset.elements.items()}
+
+    if json_output:
+        emit_json({
+            "factor": factor,
+            "unit": comparison.unit,
+            "minimum": {"name": low_name, "value": low} if present else None,
+            "maximum": {"name": high_name, "value": high} if present else None,
+            "cells": [
+                {
+                    "name": name, "symbol": symbols[name], "row": row, "column": column,
+                    "value": values.get(name), "step": None if values.get(name) is None else step(values[name]),
+                }
+                for name, (row, column) in layout.positions.items()
+            ],
+        })
+        sys.exit(0)
 
-# General properties
-fullname: str = general["fullname"]
-symbol: str = general["symbol"]
-atomic_number: int = general["atomic_number"]
-description: str = general["description"]
+    # Every step's color is computed once; in raw mode the step is written out as a digit after the symbol instead
+    colors = color_ramp(HEATMAP_COLD, HEATMAP_HOT, HEATMAP_STEPS)
+
+    def cell(name: str | None) -> str:
+        if name is None:
+            return "   "
+        value = values.get(name)
+        if value is None:
+            return dim(f"{symbols[name]:<3}") if verbose_output else f"{symbols[name]:<2}."
+        if verbose_output:
+            return bold(fore(f"{symbols[name]:<3}", colors[step(value)]))
+        return f"{symbols[name]:<2}{step(value)}"
+
+    unit = comparison.unit
+    legend = "".join(fore("██", color) for color in colors) if verbose_output else "".join(map(str, range(HEATMAP_STEPS)))
+    missing = [name for name in layout.positions if values.get(name) is None]
+
+    output = [f"\n  {bold(factor)}{f' ({unit})' if unit else ''}\n\n", render_table(layout, cell), "\n"]
+    if present:
+        output.append(f"  {low:g}{unit} ({low_name}) {legend} {high:g}{unit} ({high_name})\n")
+    if missing:
+        output.append(dim(f"  ({len(missing)} element(s) without a value are {'dimmed' if verbose_output else 'marked with a dot'}.)") + "\n")
+    output.append("\n")
+
+    sys.stdout.write("".join(output))
+    sys.exit(0)
 
-description = "\n\n" + "\n\n".join(
-    textwrap.fill(paragraph.strip(), width=terminal_width, initial_indent="    ", subsequent_indent="")
-    for paragraph in description.strip().split("\n\n")
-)
+def print_general_section(element_data: dict[str, Any]) -> None:
+    general: dict[str, Any] = element_data["general"]
+    historical: dict[str, Any] = element_data["historical"]
 
-appearance_desc: list[int] = general["appearance"]["description"]
+    fullname: str = general["fullname"]
+    symbol: str = general["symbol"]
+    atomic_number: int = general["atomic_number"]
+    description: str = general["description"]
 
-phase: str = general["appearance"]["phase"].capitalize()
-formatted_phase: str = phase[:]
+    description = "\n\n" + wrap_paragraphs(description, terminal_width)
 
-try:
-    formatted_phase = fore(phase, phase_colors[phase])
-except KeyError:
-    logger.warn(f"Invalid STP phase for {fullname.capitalize()}; Please pay attention.")
-    phase = "solid"
+    appearance_desc: list[int] = general["appearance"]["description"]
 
-try:
-    formatted_phase += f" {phase_symbols[phase]}" # type: ignore
-except (KeyError, TypeError):
-    pass
-
-discoverers = historical["discoverers"]
-discovery_date = historical["date"]
-coordinates = general["coordinates"]
-period: int = coordinates["period"]
-group: int = coordinates["group"]
-element_type = general["type"]
-block = general["block"]
-cas_number = general["cas_number"]
-
-periodic_table = [
-    ["▪", " ", " ", " ", " ", " ", " ", " ", " ", " ", " ", " ", " ", " ", " ", " ", " ", "▪"],
-    ["▪", "▪", " ", " ", " ", " ", " ", " ", " ", " ", " ", " ", "▪", "▪", "▪", "▪", "▪", "▪"],
-    ["▪", "▪", " ", " ", " ", " ", " ", " ", " ", " ", " ", " ", "▪", "▪", "▪", "▪", "▪", "▪"],
-    ["▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪"],
-    ["▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪"],
-    ["▪", "▪", " ", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪"],
-    ["▪", "▪", " ", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪", "▪"],
-]
+    phase: str = general["appearance"]["phase"].capitalize()
+    formatted_phase: str = phase[:]
 
-lanthanides = [" "] * 4 + ["▪"] * 15
-actinides = [" "] * 4 + ["▪"] * 15
+    try:
+        formatted_phase = fore(phase, phase_colors[phase])
+    except KeyError:
+        logger.warn(f"Invalid STP phase for {fullname.capitalize()}; Please pay attention.")
+        phase = "solid"
 
-if (period != 6 and group != 3) and (period != 7 and group != 3):
-    periodic_table = [list(map(dim, symbol)) for symbol in periodic_table]
+    try:
+        formatted_phase += f" {phase_symbols[phase]}" # type: ignore
+    except (KeyError, TypeError):
+        pass
+
+    discoverers = historical["discoverers"]
+    discovery_date = historical["date"]
+    coordinates = general["coordinates"]
+    period: int = coordinates["period"]
+    group: int = coordinates["group"]
+    element_type = general["type"]
+    block = general["block"]
+    cas_number = general["cas_number"]
+
+    entries = [
+        fore(name, TURQUOISE if gender == "TURQUOISE" else PINK)
+        for name, gender in discoverers.items()
+    ]
 
-lanthanides = [dim(symbol) for symbol in lanthanides]
-actinides = [dim(symbol) for symbol in actinides]
+    discoverers = conjunction_join(entries)
 
-LANTHANUM = 57
-LUTHENIUM = 72
-ACTINIUM = 89
-LAWRENCIUM = 103
+    print()
+    print_header("General")
+    print()
 
-lanthanides_range = range(LANTHANUM, LUTHENIUM + 1)
-actinides_range = range(ACTINIUM, LAWRENCIUM + 1)
+    print(f" 🔡 - Element Name: {bold(fullname)} ({bold(symbol)})")
+    print(f" Z - Atomic Number: {bold(str(atomic_number))}")
+    print(f" 📃 - Description: {description}\n")
+    print(f" 🔡 - STP Phase: {formatted_phase}")
+    print(f" 🎨 - Appearance(s) on STP: {bold(str(appearance_desc))}")
+    print(f" 🔍 - Discoverer(s): {discoverers}")
+    print(f" 🔍 - Discovery Date: {bold(discovery_date)}")
+    print(f" ↔️ - Period (Row): {bold(str(period))}")
+    print(f" ↕️ - Group (Column): {bold(str(group))}")
 
-if atomic_number in lanthanides_range:
-    lanthanides[atomic_number - LANTHANUM + 3] = bold(fore("▪", element_type_colors[element_type]))
-elif atomic_number in actinides_range:
-    actinides[atomic_number - ACTINIUM + 3] = bold(fore("▪", element_type_colors[element_type]))
-else:
-    periodic_table[period - 1][group - 1] = bold(fore("▪", element_type_colors[element_type]))
+    try:
+        print(f" 🎨 - Element Type: {bold(fore(element_type, element_type_colors[element_type]))}")
+    except KeyError:
+        logger.warn(f"Invalid element type for {fullname.capitalize()}. Please pay attention.")
+
+    print(f" 🧱 - Block: {bold(block)}")
+    print(f" 📇 - CAS Number: {bold(cas_number)}")
+
+    # The periodic table is only drawn in verbose output
+    if verbose_output:
+        highlight = bold(fore("▪", element_type_colors.get(element_type, DEFAULT_COLOR)))
+        cells = {
+            name: highlight if element["general"]["atomic_number"] == atomic_number else dim("▪")
+            for name, element in dataset.elements.items()
+        }
 
-entries = [
-    fore(name, TURQUOISE if gender == "TURQUOISE" else PINK)
-    for name, gender in discoverers.items()
-]
+        print()
+        sys.stdout.write(render_table(dataset.layout, lambda name: cells[name] if name else " "))
+
+def print_nuclear_section(element_data: dict[str, Any]) -> None:
+    general: dict[str, Any] = element_data["general"]
+    nuclear: dict[str, Any] = element_data["nuclear"]
+    electronic: dict[str, Any] = element_data["electronic"]
+
+    fullname: str = general["fullname"]
+    atomic_number: int = general["atomic_number"]
+
+    protons = nuclear["protons"]
+    neutrons = nuclear["neutrons"]
+    electrons = nuclear["electrons"]
+    up_quarks = (protons * 2) + neutrons
+    down_quarks = protons + (neutrons * 2)
+    shells = electronic["shells"]
+    valence_electrons = shells[-1]
+    subshells = electronic["subshells"]
+    isotopes: dict[str, Any] = full_isotope_data[fullname.capitalize()]
+
+    possible_shells = "klmnopqrstuvwxyz"
+    shell_result = ""
+    for index, electron in enumerate(shells):
+        max_capacity = ((index + 1) ** 2) * 2
+        if index != len(shells) - 1:
+            shell_result += f"{bold(str(electron) + str(possible_shells[index]))} ({electron}/{max_capacity}), "
+        else:
+            shell_result += f"{bold(fore(str(electron) + str(possible_shells[index]), VALENCE_ELECTRONS_COL))} ({electron}/{max_capacity})"
 
-discoverers = conjunction_join(entries)
-
-# Nuclear properties
-protons = nuclear["protons"]
-neutrons = nuclear["neutrons"]
-electrons = nuclear["electrons"]
-up_quarks = (protons * 2) + neutrons
-down_quarks = protons + (neutrons * 2)
-mass_number = protons + neutrons
-shells = electronic["shells"]
-valence_electrons = shells[-1]
-subshells = electronic["subshells"]
-isotopes: dict[str, Any] = full_isotope_data[fullname.capitalize()]
-
-possible_shells = "klmnopqrstuvwxyz"
-shell_result = ""
-for index, electron in enumerate(shells):
-    max_capacity = ((index + 1) ** 2) * 2
-    if index != len(shells) - 1:
-        shell_result += f"{bold(str(electron) + str(possible_shells[index]))} ({electron}/{max_capacity}), "
-    else:
-        shell_result += f"{bold(fore(str(electron) + str(possible_shells[index]), VALENCE_ELECTRONS_COL))} ({electron}/{max_capacity})"
-
-unpaired_electrons = 0
-subshell_capacities = {"s": 2, "p": 6, "d": 10, "f": 14}
-orbital_capacity_map = {"s": 1, "p": 3, "d": 5, "f": 7}
-subshell_result = ""
-subshell_pattern = re.compile(r"(\d)([spdf])(\d+)")
-
-for index, subshell in enumerate(subshells):
-    if len(subshell) < 3 or not subshell[-1].isdigit():
-        logger.warn(f"To the developers, a malformed subshell was detected in {fullname.capitalize()}. Issue: {subshell}")
-        continue
-
-    formatted_subshell = subshell[:-1] + (convert_superscripts(subshell[-1]) if verbose_output else subshell[-1])
-    match = subshell_pattern.match(subshell)
-    if match:
-        energy_level, subshell_type, electron_count = match.groups()
-        electron_count = int(electron_count)
-        max_capacity = subshell_capacities[subshell_type]
-        colored_subshell = fore(formatted_subshell, subshell_colors.get(subshell_type, DEFAULT_COLOR))
-        colored_subshell = inverse(colored_subshell) if index + 1 == len(subshells) else colored_subshell
-        subshell_result += f"{colored_subshell} ({electron_count}/{max_capacity}), "
-    else:
-        subshell_type = subshell[1] if len(subshell) > 1 else 's'
-        colored_subshell = fore(formatted_subshell, subshell_colors.get(subshell_type, DEFAULT_COLOR))
-        colored_subshell = inverse(colored_subshell) if index + 1 == len(subshells) else colored_subshell
-        subshell_result += f"{colored_subshell}, "
-
-subshell_result = subshell_result.rstrip(", ")
-
-formatted_subshell_lines: list[str] = []
-for subshell_string in subshells:
-    match = subshell_pattern.fullmatch(subshell_string)
-    if not match:
-        continue
-    energy_level, orbital_type, electron_count = match.groups()
-    electron_count = int(electron_count)
-    number_of_orbitals = orbital_capacity_map[orbital_type]
-    orbitals = [""] * number_of_orbitals
-
-    for index in range(min(electron_count, number_of_orbitals)):
-        orbitals[index] = up_arrow
-    remaining_electrons = electron_count - number_of_orbitals
-    for index in range(number_of_orbitals):
-        if remaining_electrons <= 0:
-            break
-        orbitals[index] += down_arrow
-        remaining_electrons -= 1
+    unpaired_electrons = 0
+    subshell_capacities = {"s": 2, "p": 6, "d": 10, "f": 14}
+    orbital_capacity_map = {"s": 1, "p": 3, "d": 5, "f": 7}
+    subshell_result = ""
+    subshell_pattern = re.compile(r"(\d)([spdf])(\d+)")
 
-    orbital_boxes: list[str] = []
-    for orbital in orbitals:
-        if orbital == "":
-            orbital_boxes.append("[  ]")
+    for index, subshell in enumerate(subshells):
+        if len(subshell) < 3 or not subshell[-1].isdigit():
+            logger.warn(f"To the developers, a malformed subshell was detected in {fullname.capitalize()}. Issue: {subshell}")
+            continue
+
+        formatted_subshell = subshell[:-1] + (convert_superscripts(subshell[-1]) if verbose_output else subshell[-1])
+        match = subshell_pattern.match(subshell)
+        if match:
+            energy_level, subshell_type, electron_count = match.groups()
+            electron_count = int(electron_count)
+            max_capacity = subshell_capacities[subshell_type]
+            colored_subshell = fore(formatted_subshell, subshell_colors.get(subshell_type, DEFAULT_COLOR))
+            colored_subshell = inverse(colored_subshell) if index + 1 == len(subshells) else colored_subshell
+            subshell_result += f"{colored_subshell} ({electron_count}/{max_capacity}), "
         else:
-            spins_colored = "".join(
-                fore("\u2191", GREEN) if spin == up_arrow else fore("\u2193", RED)
-                for spin in orbital
-            )
-            orbital_boxes.append(f"[{spins_colored}]")
-
-    formatted_line = f"  {energy_level + orbital_type:<4} {' '.join(orbital_boxes)}"
-    formatted_subshell_lines.append(formatted_line)
-    current_unpaired_electrons = sum(1 for orbital in orbitals if orbital == up_arrow or orbital == down_arrow)
-    unpaired_electrons += current_unpaired_electrons
-
-subshell_visualisation = "\n".join(formatted_subshell_lines)
-subshell_examples = "".join([fore(orbital, subshell_colors[orbital]) for orbital in list("spdf")])
-pair_determiner = fore("Diamagnetic", VALENCE_ELECTRONS_COL) if unpaired_electrons == 0 else fore("Paramagnetic", ELECTRONEG_COL)
-
-if subshells:
-    last_subshell = subshells[-1]
-    match = subshell_pattern.match(last_subshell)
-    if match:
-        principal, subshell_type, electron_count = match.groups()
-        principal = int(principal)
+            subshell_type = subshell[1] if len(subshell) > 1 else 's'
+            colored_subshell = fore(formatted_subshell, subshell_colors.get(subshell_type, DEFAULT_COLOR))
+            colored_subshell = inverse(colored_subshell) if index + 1 == len(subshells) else colored_subshell
+            subshell_result += f"{colored_subshell}, "
+
+    subshell_result = subshell_result.rstrip(", ")
+
+    formatted_subshell_lines: list[str] = []
+    for subshell_string in subshells:
+        match = subshell_pattern.fullmatch(subshell_string)
+        if not match:
+            continue
+        energy_level, orbital_type, electron_count = match.groups()
         electron_count = int(electron_count)
-        azimuthal = {"s": 0, "p": 1, "d": 2, "f": 3}[subshell_type]
-        magnetic = 0
-        spin_quantum_number = "+1/2" if unpaired_electrons % 2 == 1 else "-1/2"
-        shielding_constant = calculate_shielding_constant(subshells, last_subshell[:-1])
+        number_of_orbitals = orbital_capacity_map[orbital_type]
+        orbitals = [""] * number_of_orbitals
+
+        for index in range(min(electron_count, number_of_orbitals)):
+            orbitals[index] = up_arrow
+        remaining_electrons = electron_count - number_of_orbitals
+        for index in range(number_of_orbitals):
+            if remaining_electrons <= 0:
+                break
+            orbitals[index] += down_arrow
+            remaining_electrons -= 1
+
+        orbital_boxes: list[str] = []
+        for orbital in orbitals:
+            if orbital == "":
+                orbital_boxes.append("[  ]")
+            else:
+                spins_colored = "".join(
+                    fore("\u2191", GREEN) if spin == up_arrow else fore("\u2193", RED)
+                    for spin in orbital
+                )
+                orbital_boxes.append(f"[{spins_colored}]")
+
+        formatted_line = f"  {energy_level + orbital_type:<4} {' '.join(orbital_boxes)}"
+        formatted_subshell_lines.append(formatted_line)
+        current_unpaired_electrons = sum(1 for orbital in orbitals if orbital == up_arrow or orbital == down_arrow)
+        unpaired_electrons += current_unpaired_electrons
+
+    subshell_visualisation = "\n".join(formatted_subshell_lines)
+    subshell_examples = "".join([fore(orbital, subshell_colors[orbital]) for orbital in list("spdf")])
+
+    if subshells:
+        last_subshell = subshells[-1]
+        match = subshell_pattern.match(last_subshell)
+        if match:
+            principal, subshell_type, electron_count = match.groups()
+            principal = int(principal)
+            electron_count = int(electron_count)
+            azimuthal = {"s": 0, "p": 1, "d": 2, "f": 3}[subshell_type]
+            magnetic = 0
+            shielding_constant = calculate_shielding_constant(subshells, last_subshell[:-1])
 
-        z_eff = atomic_number - shielding_constant
+            z_eff = atomic_number - shielding_constant
 
-        last_subshell = last_subshell[:-1] + convert_superscripts(last_subshell[-1]) if verbose_output else last_subshell
-        last_subshell = fore(last_subshell, subshell_colors.get(subshell_type, (255, 255, 255)))
+            last_subshell = last_subshell[:-1] + convert_superscripts(last_subshell[-1]) if verbose_output else last_subshell
+            last_subshell = fore(last_subshell, subshell_colors.get(subshell_type, (255, 255, 255)))
 
-        principal, azimuthal, magnetic = str(principal), str(azimuthal), str(magnetic)
+            principal, azimuthal, magnetic = str(principal), str(azimuthal), str(magnetic)
 
-        subshell_visualisation += f"""
+            subshell_visualisation += f"""
 
       {fore("Valence Subshell", VALENCE_ELECTRONS_COL)} ({inverse(last_subshell)}):
         n - {fore('Principal', CYAN)}: {bold(principal)}
@@ -1590,233 +2242,383 @@ if subshells:
         {sigma} - {fore('Shielding Constant', PERIWINKLE)}: {bold(f'{shielding_constant:.2f}')}
         Z_eff - {fore('Effective Nuclear Charge', GOLD)}: {bold(f'{z_eff:.2f}')}"""
 
-# Physical properties
-melting_point = physical["melt"]
-boiling_point = physical["boil"]
-atomic_mass = physical["atomic_mass"]
-radioactive = general["radioactive"]
-half_life = general["half_life"]
-formatted_half_life, decay_constant, lifetime = format_half_life(half_life)
-
-structure = physical.get("structure", None)
-
-structure_type = None
-structure_description = None
-structure_constants = None
-
-if structure is not None:
-    structure_type = structure["type"]
-    structure_description = structure["description"]
-    formatted_structure_description = bold(structure_type) + f" ({structure_description})"
-    structure_constants = structure["constants"]
-    formatted_structure_constants = [f"{key} ≈ {value}Å ≈ {float(value) * 10:2f}nm" for (key, value) in structure_constants.items()]
-    formatted_structure_constants = ",\n      ".join(formatted_structure_constants)
-    formatted_structure_constants = "      " + formatted_structure_constants
-
-# Electronic properties
-electronegativity = electronic["electronegativity"]
-electron_affinity = electronic["electron_affinity"]
-ionization_energy = electronic["ionization_energy"]
-oxidation_states = electronic["oxidation_states"]
-
-conductivity_type = electronic["conductivity_type"]
+    print()
+    print_header("Nuclear Properties")
+    print()
 
-try:
-    formatted_conductivity = fore(conductivity_type, conductivity_colors[conductivity_type])
-except KeyError:
-    logger.warn(f"Invalid conductivity type found; {conductivity_type}. Please pay attention.")
-    formatted_conductivity = bold(conductivity_type)
+    print(f" p+ - {fore('Protons', RED)}: {bold(protons)}")
+    print(f" n{superscript_zero} - {fore('Neutrons', BLUE)}: {bold(neutrons)}")
+    print(f" e- - {fore('Electrons', YELLOW)}: {bold(electrons)}")
+    print(f" nv - {fore('Valence Electrons', VALENCE_ELECTRONS_COL)}: {bold(valence_electrons)}")
 
-try:
-    formatted_conductivity += f" {conductivity_symbols[conductivity_type]}" # type: ignore
-except (KeyError, TypeError):
-    pass
-
-# Measurements
-radius = measurements["radius"]
-hardness = measurements["hardness"]
-moduli = measurements["moduli"]
-density = measurements["density"]
-sound_transmission_speed = measurements["sound_transmission_speed"]
-
-logger.info("Starting output.")
-
-print()
-print_header("General")
-print()
-
-print(f" 🔡 - Element Name: {bold(fullname)} ({bold(symbol)})")
-print(f" Z - Atomic Number: {bold(str(atomic_number))}")
-print(f" 📃 - Description: {description}\n")
-print(f" 🔡 - STP Phase: {formatted_phase}")
-print(f" 🎨 - Appearance(s) on STP: {bold(str(appearance_desc))}")
-print(f" 🔍 - Discoverer(s): {discoverers}")
-print(f" 🔍 - Discovery Date: {bold(discovery_date)}")
-print(f" ↔️ - Period (Row): {bold(str(period))}")
-print(f" ↕️ - Group (Column): {bold(str(group))}")
+    up_quarks_calculation = f"({fore(protons, RED)} * 2) + {fore(neutrons, BLUE)} = {bold(up_quarks)}"
+    print(f" u - {fore('Up Quarks', GREEN)}: {up_quarks_calculation}")
 
-try:
-    print(f" 🎨 - Element Type: {bold(fore(element_type, element_type_colors[element_type]))}")
-except KeyError:
-    logger.warn(f"Invalid element type for {fullname.capitalize()}. Please pay attention.")
+    down_quarks_calculation = f"{fore(protons, RED)} + ({fore(neutrons, BLUE)} * 2) = {bold(down_quarks)}"
+    print(f" d - {fore('Down Quarks', CYAN)}: {down_quarks_calculation}")
 
-print(f" 🧱 - Block: {bold(block)}")
-print(f" 📇 - CAS Number: {bold(cas_number)}")
+    shell_tip = dim(f'(Valence electrons in {fore('yellow', VALENCE_ELECTRONS_COL)})')
+    print(f" ⚛️ - {fore('Shells', EXCITED)} {shell_tip}:\n    {shell_result}")
 
-if verbose_output:
-    print()
+    subshell_tip = dim(f'(Colored by type: {subshell_examples}, the valence subshell has its color {inverse("inversed")})')
+    print(f" 🌀 - {fore('Subshells', PERIWINKLE)} {subshell_tip}:\n    {subshell_result}")
+    print(f"      {bold('Breakdown')}:\n\n{subshell_visualisation}\n")
 
-    print("  ", end="")
-    for y in periodic_table:
-        for x in y:
-            print(x, end=" ")
-        print("\n  ", end="")
+    if not hide_isotopes:
+        isotope_tip = dim(f"(Decay processes in {fore("red", RED)} need verification. Do not trust them!)")
+    else:
+        isotope_tip = dim(fore(f"(HIDDEN due to -H / --hide-isotopes flag usage)", RED))
+
+    print(f" 🪞 - Isotopes ({len(isotopes.keys())}): {isotope_tip}")
+
+    if not hide_isotopes:
+        profiler.begin("isotope rendering")
+        start = (isotopes_page - 1) * isotopes_limit if isotopes_limit else 0
+        stop = min(start + isotopes_limit, len(isotopes)) if isotopes_limit else len(isotopes)
+
+        for block in isotope_blocks(itertools.islice(isotopes.items(), start, stop), fullname):
+            print()
+            sys.stdout.write(block)
+
+        if start >= len(isotopes) and isotopes:
+            print(dim(f"\n    (Page {isotopes_page} is past the last page of isotopes, {math.ceil(len(isotopes) / isotopes_limit)}.)")) # type: ignore
+        elif stop < len(isotopes) or start > 0:
+            more = f" Use --isotopes-page {isotopes_page + 1} for more." if stop < len(isotopes) else ""
+            print(dim(f"\n    (Showing isotopes {start + 1}-{stop} of {len(isotopes)}.{more})"))
+        profiler.end("isotope rendering")
+
+def print_physical_section(element_data: dict[str, Any]) -> None:
+    general: dict[str, Any] = element_data["general"]
+    nuclear: dict[str, Any] = element_data["nuclear"]
+    physical: dict[str, Any] = element_data["physical"]
+
+    protons = nuclear["protons"]
+    neutrons = nuclear["neutrons"]
+    melting_point = physical["melt"]
+    boiling_point = physical["boil"]
+    atomic_mass = physical["atomic_mass"]
+    radioactive = general["radioactive"]
+    half_life = general["half_life"]
+    formatted_half_life, decay_constant, lifetime = format_half_life(half_life)
+
+    structure = physical.get("structure", None)
+
+    structure_type = None
+    structure_description = None
+    structure_constants = None
+
+    if structure is not None:
+        structure_type = structure["type"]
+        structure_description = structure["description"]
+        formatted_structure_description = bold(structure_type) + f" ({structure_description})"
+        structure_constants = structure["constants"]
+        formatted_structure_constants = [f"{key} ≈ {value}Å ≈ {float(value) * 10:2f}nm" for (key, value) in structure_constants.items()]
+        formatted_structure_constants = ",\n      ".join(formatted_structure_constants)
+        formatted_structure_constants = "      " + formatted_structure_constants
 
     print()
+    print_header("Physical Properties")
+    print()
 
-    for lanthanide in lanthanides:
-        print(lanthanide, end=" ")
+    print(f" 💧 - {fore("Melting Point", MELT_COL)}: {format_temperature(melting_point)}")
+    print(f" 💨 - {fore("Boiling Point", BOIL_COL)}: {format_temperature(boiling_point)}")
+    print(f" A - {fore("Mass Number", GOLD)}: {fore(protons, RED)} + {fore(neutrons, BLUE)} = {bold(protons + neutrons)}")
+    print(f" u - {fore("Atomic Mass", BRIGHT_RED)}: {bold(atomic_mass)}g/mol")
 
-    print()
+    radioactive_determiner = fore("Yes", GREEN) if radioactive else fore("No", RED)
+    print(f" {emoji_radioactive} - {fore("Radioactive", ORANGE)}: {radioactive_determiner}")
+
+    print(f" t1/2 - {fore("Half Life", PERIWINKLE)}: {formatted_half_life}")
+
+    if decay_constant is not None and lifetime is not None:
+        print(f" t - {fore("Lifetime", PERIWINKLE)}: {lifetime}")
+        print(f" λ - {fore("Decay Consonant", EXCITED)}: {decay_constant}")
+
+    if structure is not None:
+        print(f" {fore("Structure", PERIWINKLE)}: ")
+        print(f"    Structure Type: {formatted_structure_description}") # type: ignore
+        print(f"    Structure Constants:\n{formatted_structure_constants}\n") # type: ignore
+    else:
+        print(f" {fore("Structure", PERIWINKLE)}: {fore('N/A', RED)}\n")
+
+def print_electronic_section(element_data: dict[str, Any]) -> None:
+    general: dict[str, Any] = element_data["general"]
+    electronic: dict[str, Any] = element_data["electronic"]
+
+    atomic_number: int = general["atomic_number"]
+    subshells = electronic["subshells"]
+    electronegativity = electronic["electronegativity"]
+    electron_affinity = electronic["electron_affinity"]
+    ionization_energy = electronic["ionization_energy"]
+    oxidation_states = electronic["oxidation_states"]
 
-    for actinide in actinides:
-        print(actinide, end=" ")
+    conductivity_type = electronic["conductivity_type"]
 
+    try:
+        formatted_conductivity = fore(conductivity_type, conductivity_colors[conductivity_type])
+    except KeyError:
+        logger.warn(f"Invalid conductivity type found; {conductivity_type}. Please pay attention.")
+        formatted_conductivity = bold(conductivity_type)
+
+    try:
+        formatted_conductivity += f" {conductivity_symbols[conductivity_type]}" # type: ignore
+    except (KeyError, TypeError):
+        pass
+
+    print()
+    print_header("Electronic Properties")
     print()
 
-print()
-print_header("Nuclear Properties")
-print()
+    print(f" x - {fore("Electronegativity", ELECTRONEG_COL)}: {bold(electronegativity)}")
+    print(f" EA - {fore("Electron Affinity", EXCITED)}: {format_energy(electron_affinity)}")
+    print(f" IE - {fore("Ionization Energy", PINK)}: {format_energy(ionization_energy)}")
 
-print(f" p+ - {fore('Protons', RED)}: {bold(protons)}")
-print(f" n{superscript_zero} - {fore('Neutrons', BLUE)}: {bold(neutrons)}")
-print(f" e- - {fore('Electrons', YELLOW)}: {bold(electrons)}")
-print(f" nv - {fore('Valence Electrons', VALENCE_ELECTRONS_COL)}: {bold(valence_electrons)}")
+    profiler.begin("ionization series")
+    ionization_series = calculate_ionization_series(subshells, atomic_number, ionization_energy)
+    profiler.end("ionization series")
 
-up_quarks_calculation = f"({fore(protons, RED)} * 2) + {fore(neutrons, BLUE)} = {bold(up_quarks)}"
-print(f" u - {fore('Up Quarks', GREEN)}: {up_quarks_calculation}")
+    print(f"      {bold("ESTIMATED")} Calculated Ionization Energy Series:")
+    print(f"\n{ionization_series}\n")
 
-down_quarks_calculation = f"{fore(protons, RED)} + ({fore(neutrons, BLUE)} * 2) = {bold(down_quarks)}"
-print(f" d - {fore('Down Quarks', CYAN)}: {down_quarks_calculation}")
+    if verbose_output:
+        negatives_template = [0, -1, -2, -3, -4, -5]
+        positives_template = [1, 2, 3, 4, 5, 6, 7, 8, 9]
 
-shell_tip = dim(f'(Valence electrons in {fore('yellow', VALENCE_ELECTRONS_COL)})')
-print(f" ⚛️ - {fore('Shells', EXCITED)} {shell_tip}:\n    {shell_result}")
+        negatives: list[str] = []
+        positives: list[str] = []
 
-subshell_tip = dim(f'(Colored by type: {subshell_examples}, the valence subshell has its color {inverse("inversed")})')
-print(f" 🌀 - {fore('Subshells', PERIWINKLE)} {subshell_tip}:\n    {subshell_result}")
-print(f"      {bold('Breakdown')}:\n\n{subshell_visualisation}\n")
+        for state in negatives_template:
+            if state in oxidation_states:
+                if state == 0:
+                    negatives.append(bold(fore(str(state), GREEN)))
+                else:
+                    negatives.append(bold(fore(str(state), BLUE)))
+            else:
+                negatives.append(dim(str(state)))
 
-if not hide_isotopes:
-    isotope_tip = dim(f"(Decay processes in {fore("red", RED)} need verification. Do not trust them!)")
-else:
-    isotope_tip = dim(fore(f"(HIDDEN due to -H / --hide-isotopes flag usage)", RED))
+        for state in positives_template:
+            if state in oxidation_states:
+                positives.append(bold(fore(str(state), RED)))
+            else:
+                positives.append(dim(str(state)))
 
-print(f" 🪞 - Isotopes ({len(isotopes.keys())}): {isotope_tip}")
+        negatives_result = ", ".join(negatives)
+        positives_result = ", ".join(positives)
+        oxidation_states_result = f"\n{"    " + negatives_result}\n{"    " + positives_result}\n"
+        oxidation_states_tip = dim(f"(Only the ones that have {fore("color", BLUE)} are activated)")
+    else:
+        raw_oxidation_states = map(str, oxidation_states[:])
+        raw_oxidation_states = ", ".join(raw_oxidation_states)
+        oxidation_states_result = f"\n{raw_oxidation_states}\n"
+        oxidation_states_tip = ""
 
-if not hide_isotopes:
-    for isotope, information in isotopes.items():
-        print()
-        print_isotope(isotope, information, fullname)
+    print(f" {fore("Oxidation States", YELLOW)} {oxidation_states_tip}:{oxidation_states_result}")
+    print(f" c - {fore("Conductivity Type", BRIGHT_BLACK)}: {bold(formatted_conductivity)}")
 
-print()
-print_header("Physical Properties")
-print()
+def print_measurements_section(element_data: dict[str, Any]) -> None:
+    measurements: dict[str, Any] = element_data["measurements"]
 
-print(f" 💧 - {fore("Melting Point", MELT_COL)}: {format_temperature(melting_point)}")
-print(f" 💨 - {fore("Boiling Point", BOIL_COL)}: {format_temperature(boiling_point)}")
-print(f" A - {fore("Mass Number", GOLD)}: {fore(protons, RED)} + {fore(neutrons, BLUE)} = {bold(protons + neutrons)}")
-print(f" u - {fore("Atomic Mass", BRIGHT_RED)}: {bold(atomic_mass)}g/mol")
+    radius = measurements["radius"]
+    hardness = measurements["hardness"]
+    moduli = measurements["moduli"]
+    density = measurements["density"]
+    sound_transmission_speed = measurements["sound_transmission_speed"]
 
-radioactive_determiner = fore("Yes", GREEN) if radioactive else fore("No", RED)
-print(f" {emoji_radioactive} - {fore("Radioactive", ORANGE)}: {radioactive_determiner}")
+    print()
+    print_header("Measurements")
+    print()
 
-print(f" t1/2 - {fore("Half Life", PERIWINKLE)}: {formatted_half_life}")
+    print(f" r - {fore("Radius", PINK)}: ")
+    print(f"    r_calc - Calculated: {safe_format(radius['calculated'], 'pm', placeholder='N/A')}")
+    print(f"    r_emp - Empirical: {safe_format(radius['empirical'], 'pm', placeholder='N/A')}")
+    print(f"    r_cov - Covalent: {safe_format(radius['covalent'], 'pm', placeholder='N/A')}")
+    print(f"    rvdW - Van der Waals: {safe_format(radius['van_der_waals'], 'pm', placeholder='N/A')}\n")
+
+    print(f" H - {fore("Hardness", PERIWINKLE)}: ")
+    print(f"    HB - Brinell: {safe_format(hardness['brinell'], f'kgf/{mm2}')}")
+    print(f"    H - Mohs: {safe_format(hardness['mohs'], '')}")
+    print(f"    HV - Vickers: {safe_format(hardness['vickers'], f'kgf/{mm2}')}\n")
+
+    print(f" {fore("Moduli", EXCITED)}: ")
+    print(f"    K - Bulk Modulus: {safe_format(moduli['bulk'], 'GPa')}")
+    print(f"    E - Young's Modulus: {safe_format(moduli['young'], 'GPa')}")
+    print(f"    G - Shear Modulus: {safe_format(moduli['shear'], 'GPa')}")
+    print(f"    ν - Poisson's Ratio: {safe_format(moduli['poissons_ratio'], '')}\n")
+
+    print(f" p - {fore("Density", CYAN)}: ")
+    print(f"    STP Density: {safe_format(density['STP'], f'kg/{m3}')}")
+    print(f"    Liquid Density: {safe_format(density['liquid'], f'kg/{m3}')}\n")
+
+    print(f" -> - {fore("Speed of Sound Transmission", BRIGHT_BLACK)}: {bold(sound_transmission_speed)}m/s = {bold(sound_transmission_speed / 1000)}km/s")
+
+# Every section reads what it needs from the element and formats it right before printing,
+# so the sections left out with --section cost nothing
+card_section_printers: dict[str, Callable[[dict[str, Any]], None]] = {
+    "general": print_general_section,
+    "nuclear": print_nuclear_section,
+    "physical": print_physical_section,
+    "electronic": print_electronic_section,
+    "measurements": print_measurements_section,
+}
 
-if decay_constant is not None and lifetime is not None:
-    print(f" t - {fore("Lifetime", PERIWINKLE)}: {lifetime}")
-    print(f" λ - {fore("Decay Consonant", EXCITED)}: {decay_constant}")
+def print_element_card(element_data: dict[str, Any]) -> None:
+    logger.info("Starting output.")
+    profiler.begin("terminal output")
 
-if structure is not None:
-    print(f" {fore("Structure", PERIWINKLE)}: ")
-    print(f"    Structure Type: {formatted_structure_description}") # type: ignore
-    print(f"    Structure Constants:\n{formatted_structure_constants}\n") # type: ignore
-else:
-    print(f" {fore("Structure", PERIWINKLE)}: {fore('N/A', RED)}\n")
+    for section in card_sections:
+        profiler.begin(f"{section} section")
+        card_section_printers[section](element_data)
+        profiler.end(f"{section} section")
 
-print()
-print_header("Electronic Properties")
-print()
+    print_separator()
+    profiler.end("terminal output")
+
+
+# Main flags, their handlers, and what each one needs initialized before it runs.
+# Anything not listed here (an element or isotope lookup) needs everything.
+primary_flag_events: list[tuple[tuple[str, ...], Callable[[], None], set[str]]] = [
+    (("--info", "-i"), f_info, {"terminal"}),
+    (("--version", "-v"), f_version, set()),
+    (("--update", "-u"), f_update, set()),
+    (("--refresh", "-F"), f_refresh, set()),
+    (("--export", "-X"), f_export, {"terminal", "data"}),
+    (("--compare", "-C"), f_compare, {"terminal", "data"}),
+    (("--bond-type", "-B"), f_bond_type, {"terminal", "data"}),
+    (("--random", "-R"), f_random, {"terminal", "data"}),
+    (("--sql", "-Q"), f_sql, {"terminal", "data"}),
+    (("--render-all", "-W"), f_render_all, {"data"}),
+    (("--serve", "-S"), f_serve, {"data"}),
+    (("--repl", "-L"), f_repl, {"terminal", "data"}),
+    (("--completions",), f_completions, {"data"}),
+    (("--molar-mass", "-M"), f_molar_mass, {"data"}),
+    (("--balance", "-E"), f_balance, {"data"}),
+    (("--heatmap", "-T"), f_heatmap, {"terminal", "data"}),
+]
 
-print(f" x - {fore("Electronegativity", ELECTRONEG_COL)}: {bold(electronegativity)}")
-print(f" EA - {fore("Electron Affinity", EXCITED)}: {format_energy(electron_affinity)}")
-print(f" IE - {fore("Ionization Energy", PINK)}: {format_energy(ionization_energy)}")
+def main() -> None:
+    configure_logging()
 
-print(f"      {bold("ESTIMATED")} Calculated Ionization Energy Series:")
-print(f"\n{calculate_ionization_series(subshells, atomic_number, ionization_energy)}\n")
+    # Profiling has to start before anything expensive happens, so it is handled ahead of the other modifiers
+    create_flag_event("--profile", "-P", f_callable=f_profile)
+    create_flag_event("--profile-dump", f_callable=f_profile_dump)
 
-if verbose_output:
-    negatives_template = [0, -1, -2, -3, -4, -5]
-    positives_template = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    logger.info("Program initialized.")
 
-    negatives: list[str] = []
-    positives: list[str] = []
+    # Handling Flags
 
-    for state in negatives_template:
-        if state in oxidation_states:
-            if state == 0:
-                negatives.append(bold(fore(str(state), GREEN)))
-            else:
-                negatives.append(bold(fore(str(state), BLUE)))
-        else:
-            negatives.append(dim(str(state)))
+    profiler.begin("flag handling")
+    primary_flag = None
+    user_input = None
+
+    if len(sys.argv) > 1:
+        unrecognized_flags = [f for f in separated_flags if f not in valid_flags]
+        if unrecognized_flags:
+            print("Unrecognizable flags detected. Run the script with the --info flag for more information.")
+            logger.abort(f"Unrecognizable flags detected: {unrecognized_flags}")
+
+        modifier_used = [f for f in separated_flags if f in modifier_flags]
+        primary_flags = [f for f in separated_flags if f not in modifier_flags]
+
+        logger.info(f"Modifiers: {modifier_used}")
+        logger.info(f"Primary flags: {primary_flags}")
+        logger.info(f"Positional args: {positional_arguments}")
+
+        # Modifier flags
+        create_flag_event("--debug", "-d", f_callable=f_debug)
+        create_flag_event("--raw", "-r", f_callable=f_raw)
+        create_flag_event("--hide-isotopes", "-H", f_callable=f_hide_isotopes)
+        create_flag_event("--json", "-J", f_callable=f_json)
+        create_flag_event("--no-pager", f_callable=f_no_pager)
+        create_flag_event("--isotopes-limit", "--isotopes-page", f_callable=f_isotope_window)
+        create_flag_event("--section", f_callable=f_sections)
+        create_flag_event("--matrix", f_callable=f_matrix)
+
+        if len(primary_flags) > 1:
+            print("Multiple main flags detected. Run the script with the --info flag for more information.")
+            logger.abort(f"Multiple main flags detected: {primary_flags}")
+
+        elif len(primary_flags) == 1:
+            primary_flag = primary_flags[0]
+
+            # Case 1: primary flag requires positional argument
+            if primary_flag in positionarg_req_flags:
+                if (
+                    len(positional_arguments) > 1
+                    and primary_flag not in ["-C", "-B", "-Q", "-X", "-W", "--compare", "--bond-type", "--sql", "--export", "--render-all", "-M", "--molar-mass", "-E", "--balance"]
+                ):
+                    print(fore("Too many positional arguments. Refer to --info.", RED))
+                    logger.abort("Too many positional arguments.")
+
+                user_input = positional_arguments[0] if positional_arguments else None
+
+            # Case 2: primary flag forbids positional arguments
+            elif primary_flag in positionarg_nreq_flags:
+                if len(positional_arguments) > 0:
+                    print(fore("Unexpected positional argument. Refer to --info.", RED))
+                    logger.abort("Unexpected additional arguments.")
 
-    for state in positives_template:
-        if state in oxidation_states:
-            positives.append(bold(fore(str(state), RED)))
         else:
-            positives.append(dim(str(state)))
-
-    negatives_result = ", ".join(negatives)
-    positives_result = ", ".join(positives)
-    oxidation_states_result = f"\n{"    " + negatives_result}\n{"    " + positives_result}\n"
-    oxidation_states_tip = dim(f"(Only the ones that have {fore("color", BLUE)} are activated)")
-else:
-    raw_oxidation_states = map(str, oxidation_states[:])
-    raw_oxidation_states = ", ".join(raw_oxidation_states)
-    oxidation_states_result = f"\n{raw_oxidation_states}\n"
-    oxidation_states_tip = ""
-
-print(f" {fore("Oxidation States", YELLOW)} {oxidation_states_tip}:{oxidation_states_result}")
-print(f" c - {fore("Conductivity Type", BRIGHT_BLACK)}: {bold(formatted_conductivity)}")
-
-print()
-print_header("Measurements")
-print()
-
-print(f" r - {fore("Radius", PINK)}: ")
-print(f"    r_calc - Calculated: {safe_format(radius['calculated'], 'pm', placeholder='N/A')}")
-print(f"    r_emp - Empirical: {safe_format(radius['empirical'], 'pm', placeholder='N/A')}")
-print(f"    r_cov - Covalent: {safe_format(radius['covalent'], 'pm', placeholder='N/A')}")
-print(f"    rvdW - Van der Waals: {safe_format(radius['van_der_waals'], 'pm', placeholder='N/A')}\n")
-
-print(f" H - {fore("Hardness", PERIWINKLE)}: ")
-print(f"    HB - Brinell: {safe_format(hardness['brinell'], f'kgf/{mm2}')}")
-print(f"    H - Mohs: {safe_format(hardness['mohs'], '')}")
-print(f"    HV - Vickers: {safe_format(hardness['vickers'], f'kgf/{mm2}')}\n")
-
-print(f" {fore("Moduli", EXCITED)}: ")
-print(f"    K - Bulk Modulus: {safe_format(moduli['bulk'], 'GPa')}")
-print(f"    E - Young's Modulus: {safe_format(moduli['young'], 'GPa')}")
-print(f"    G - Shear Modulus: {safe_format(moduli['shear'], 'GPa')}")
-print(f"    ν - Poisson's Ratio: {safe_format(moduli['poissons_ratio'], '')}\n")
-
-print(f" p - {fore("Density", CYAN)}: ")
-print(f"    STP Density: {safe_format(density['STP'], f'kg/{m3}')}")
-print(f"    Liquid Density: {safe_format(density['liquid'], f'kg/{m3}')}\n")
-
-print(f" -> - {fore("Speed of Sound Transmission", BRIGHT_BLACK)}: {bold(sound_transmission_speed)}m/s = {bold(sound_transmission_speed / 1000)}km/s")
-
-print_separator()
-
-logger.info("End of program reached. Aborting...")
-sys.exit(0)
+            if len(positional_arguments) > 1:
+                print(fore("Too many positional arguments. Refer to --info.", RED))
+                logger.abort("Too many positional arguments.")
+
+            user_input = positional_arguments[0] if positional_arguments else None
+    else:
+        logger.warn("No arguments provided, falling back to interactive input.")
+
+    requirements = {"terminal", "data"}
+    primary_event = None
+    for flags, f_callable, needs in primary_flag_events:
+        if primary_flag in flags:
+            requirements, primary_event = needs, f_callable
+
+    profiler.end("flag handling")
+
+    # JSON output never looks at the terminal, and must not be preceded by its warnings
+    if "terminal" in requirements and not json_output:
+        probe_terminal()
+    if "data" in requirements:
+        load_data()
+
+    if primary_event is not None:
+        primary_event()
+
+    # --random picks the element itself; every other path resolves one from the input
+    if primary_event is not f_random:
+        if user_input:
+            logger.info(f'Element positional argument entry given: "{user_input}"')
+
+        profiler.begin("resolve_element_or_isotope")
+        element_data = resolve_element_or_isotope(
+            label="search",
+            initial_input=user_input
+        )
+        profiler.end("resolve_element_or_isotope")
+    else:
+        element_data = current_element_data
+
+    if isotope_logic:
+        sys.exit(0)
+
+    if json_output:
+        emit_json(element_summary(element_data, dataset=dataset, isotopes=not hide_isotopes, sections=card_sections))
+        sys.exit(0)
+
+    if debug_mode:
+        print("Printing data...")
+        pprint(
+            element_data,
+            indent=2,
+            width=terminal_width,
+            sort_dicts=False,
+            underscore_numbers=True
+        )
+
+    with paged_output():
+        print_element_card(element_data)
+
+    logger.info("End of program reached. Aborting...")
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
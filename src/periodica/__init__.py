@@ -0,0 +1,17 @@
+import logging
+
+from periodica.dataset import Dataset, DatasetError, Element, load_dataset, get_dataset
+from periodica.lookup import ElementNotFound, IsotopeNotFound, IsotopeMatch, parse_isotope, find_element, find_isotope, isotope, search
+from periodica.records import ElementRecord, NuclideRecord, DecayBranch, MetastableState, build_records
+from periodica.compare import COMPARE_FACTORS, SORTING_METHODS, Comparison, compare
+from periodica.bonds import Bond, BondMatrix, bond_type, bond_matrix
+from periodica.electrons import IonizationStep, ionization_series
+from periodica.decay import DecayNode, decay_chain
+from periodica.layout import TableLayout, build_layout
+from periodica.export import ExportError, export_records, export_bond_matrix
+from periodica.formula import FormulaError, Formula, MolarMass, parse_formula, molar_mass
+from periodica.balance import BalanceError, Balanced, balance
+
+# Importing the library does no I/O; the data files are read the first time a query needs them.
+# Log records go nowhere unless the application configures logging.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
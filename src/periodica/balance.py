@@ -0,0 +1,124 @@
+import re, math, functools
+from typing import NamedTuple
+from periodica.dataset import Dataset, get_dataset
+from periodica.formula import parse_formula, element_by_symbol
+
+# Equations are species joined by " + " (with spaces, so NH4+ keeps its charge) on both sides of an arrow.
+# Coefficients already in front of a species are ignored, since the balanced ones replace them.
+ARROW_PATTERN = re.compile(r"\s*(?:<=>|<->|⇌|->|=>|→|=)\s*")
+SEPARATOR_PATTERN = re.compile(r"\s+\+\s+")
+COEFFICIENT_PATTERN = re.compile(r"^\d+\s*(?=\S)")
+CHARGE = "charge"
+
+class BalanceError(ValueError):
+    pass
+
+class Balanced(NamedTuple):
+    reactants: tuple[tuple[int, str], ...]
+    products: tuple[tuple[int, str], ...]
+
+    @property
+    def equation(self) -> str:
+        def side(terms: tuple[tuple[int, str], ...]) -> str:
+            return " + ".join(f"{coefficient if coefficient != 1 else ''}{species}" for coefficient, species in terms)
+        return f"{side(self.reactants)} -> {side(self.products)}"
+
+def split_equation(equation: str) -> tuple[list[str], list[str]]:
+    sides = ARROW_PATTERN.split(equation.strip())
+    if len(sides) != 2:
+        raise BalanceError(f"An equation needs exactly one arrow (->) between its reactants and products: {equation!r}")
+
+    reactants, products = ([COEFFICIENT_PATTERN.sub("", species.strip()) for species in SEPARATOR_PATTERN.split(side.strip())] for side in sides)
+    if not all(reactants) or not all(products):
+        raise BalanceError(f"Every side of an equation needs at least one species, each separated by ' + ': {equation!r}")
+    return reactants, products
+
+def nullspace_vector(matrix: list[list[int]], columns: int) -> list[int]:
+    # Gauss-Jordan elimination over the integers: rows are combined by cross-multiplying and then divided by their gcd,
+    # which keeps the arithmetic exact without the cost of fractions
+    rows = [row[:] for row in matrix if any(row)]
+    pivots: list[int] = []
+    rank = 0
+
+    for column in range(columns):
+        pivot = next((index for index in range(rank, len(rows)) if rows[index][column]), None)
+        if pivot is None:
+            continue
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        pivot_row = rows[rank]
+
+        for index, row in enumerate(rows):
+            if index == rank or not row[column]:
+                continue
+            factor, scale = row[column], pivot_row[column]
+            combined = [value * scale - pivot_value * factor for value, pivot_value in zip(row, pivot_row)]
+            divisor = math.gcd(*combined)
+            rows[index] = [value // divisor for value in combined] if divisor > 1 else combined
+
+        pivots.append(column)
+        rank += 1
+        if rank == len(rows):
+            break
+
+    free = [column for column in range(columns) if column not in pivots]
+    if not free:
+        raise BalanceError("The equation can't be balanced; no combination of coefficients conserves every element.")
+    if len(free) > 1:
+        raise BalanceError(
+            f"The equation is underdetermined; it has {len(free)} independent balanced forms, so it mixes several reactions."
+        )
+
+    # With a single free column, every pivot row reads pivot * x_pivot + entry * x_free = 0
+    free_column = free[0]
+    scale = math.lcm(*(rows[index][column] for index, column in enumerate(pivots))) if pivots else 1
+    vector = [0] * columns
+    vector[free_column] = scale
+    for index, column in enumerate(pivots):
+        vector[column] = -rows[index][free_column] * scale // rows[index][column]
+
+    divisor = math.gcd(*vector)
+    return [value // divisor for value in vector]
+
+@functools.lru_cache(maxsize=4096)
+def solve_coefficients(reactants: tuple[str, ...], products: tuple[str, ...]) -> tuple[int, ...]:
+    # One row per element (and one for charge), one column per species; products count negatively
+    species = reactants + products
+    parsed = [parse_formula(formula) for formula in species]
+
+    elements = list(dict.fromkeys(symbol for formula in parsed for symbol, _ in formula.counts))
+    if any(formula.charge for formula in parsed):
+        elements.append(CHARGE)
+
+    matrix = [[0] * len(species) for _ in elements]
+    row_of = {element: index for index, element in enumerate(elements)}
+    for column, formula in enumerate(parsed):
+        sign = 1 if column < len(reactants) else -1
+        for symbol, count in formula.counts:
+            matrix[row_of[symbol]][column] = sign * count
+        if formula.charge:
+            matrix[row_of[CHARGE]][column] = sign * formula.charge
+
+    coefficients = nullspace_vector(matrix, len(species))
+    if all(value < 0 for value in coefficients):
+        coefficients = [-value for value in coefficients]
+
+    # A zero or negative coefficient means a species is not part of the reaction or is on the wrong side
+    if any(value <= 0 for value in coefficients):
+        misplaced = [formula for formula, value in zip(species, coefficients) if value <= 0]
+        raise BalanceError(f"The equation can't be balanced as written; check the side of: {', '.join(misplaced)}")
+    return tuple(coefficients)
+
+def balance(equation: str, *, dataset: Dataset | None = None) -> Balanced:
+    if dataset is None:
+        dataset = get_dataset()
+    reactants, products = split_equation(equation)
+
+    for formula in reactants + products:
+        for symbol, _ in parse_formula(formula).counts:
+            element_by_symbol(formula, symbol, dataset)
+
+    coefficients = solve_coefficients(tuple(reactants), tuple(products))
+    return Balanced(
+        tuple(zip(coefficients[:len(reactants)], reactants)),
+        tuple(zip(coefficients[len(reactants):], products)),
+    )
@@ -0,0 +1,57 @@
+from typing import NamedTuple
+from periodica.dataset import Dataset, Element, get_dataset
+from periodica.lookup import as_element
+
+# Electronegativity differences on the Pauling scale where bonds stop being nonpolar covalent and polar covalent
+NONPOLAR_LIMIT = 0.4
+POLAR_LIMIT = 1.7
+
+class Bond(NamedTuple):
+    first: str
+    second: str
+    first_electronegativity: float
+    second_electronegativity: float
+    difference: float
+    kind: str
+
+def classify_bond(difference: float) -> str:
+    if difference < NONPOLAR_LIMIT:
+        return "nonpolar covalent"
+    if difference < POLAR_LIMIT:
+        return "polar covalent"
+    return "ionic"
+
+def bond_type(first: str | Element, second: str | Element, *, dataset: Dataset | None = None) -> Bond | None:
+    # None when either element has no electronegativity (mostly the noble gases)
+    first = as_element(first, dataset)
+    second = as_element(second, dataset)
+
+    first_en = first["electronic"]["electronegativity"]
+    second_en = second["electronic"]["electronegativity"]
+    if first_en is None or second_en is None:
+        return None
+
+    difference = abs(first_en - second_en)
+    return Bond(first["general"]["fullname"], second["general"]["fullname"], first_en, second_en, difference, classify_bond(difference))
+
+class BondMatrix(NamedTuple):
+    # Every element in atomic number order; None marks the masked cells, where either element has no electronegativity
+    symbols: tuple[str, ...]
+    electronegativities: tuple[float | None, ...]
+    differences: tuple[tuple[float | None, ...], ...]
+
+    def kinds(self) -> tuple[tuple[str | None, ...], ...]:
+        return tuple(tuple(None if difference is None else classify_bond(difference) for difference in row) for row in self.differences)
+
+def bond_matrix(*, dataset: Dataset | None = None) -> BondMatrix:
+    if dataset is None:
+        dataset = get_dataset()
+    elements = sorted(dataset.elements.values(), key=lambda element: element["general"]["atomic_number"])
+    values = tuple(element["electronic"]["electronegativity"] for element in elements)
+
+    # Electronegativities have two decimals, so rounding only drops the floating point noise of the subtraction
+    differences = tuple(
+        tuple(None if first is None or second is None else round(abs(first - second), 6) for second in values)
+        for first in values
+    )
+    return BondMatrix(tuple(element["general"]["symbol"] for element in elements), values, differences)
@@ -0,0 +1,78 @@
+import logging
+from typing import NamedTuple
+from periodica.dataset import Dataset, get_dataset
+from periodica.records import ElementRecord
+
+logger = logging.getLogger(__name__)
+
+# Every factor elements can be compared by, and the unit its values are in
+COMPARE_FACTORS: dict[str, str] = {
+    "protons": "",
+    "electrons": "",
+    "neutrons": "",
+    "mass_number": "",
+    "up_quarks": "",
+    "down_quarks": "",
+    "isotopes": "",
+    "melting_point": "°C",
+    "boiling_point": "°C",
+    "atomic_mass": "g/mol",
+    "electronegativity": "",
+    "electron_affinity": "eV",
+    "ionization_energy": "eV",
+    "calculated_radius": "pm",
+    "empirical_radius": "pm",
+    "covalent_radius": "pm",
+    "van_der_waals_radius": "pm",
+    "brinell_hardness": "kgf/mm2",
+    "mohs_hardness": "",
+    "vickers_hardness": "kgf/mm2",
+    "bulk_modulus": "GPa",
+    "young_modulus": "GPa",
+    "shear_modulus": "GPa",
+    "poissons_ratio": "",
+    "stp_density": "kg/m3",
+    "liquid_density": "kg/m3",
+    "sound_transmission_speed": "m/s",
+}
+
+SORTING_METHODS = ("ascending", "descending", "name")
+
+class Comparison(NamedTuple):
+    factor: str
+    unit: str
+    order: str
+    values: list[tuple[str, float | None]]
+
+def factor_value(record: ElementRecord, factor: str) -> float | None:
+    # Factor names double as ElementRecord attribute names
+    if factor == "isotopes":
+        return float(record.isotope_count)
+
+    result = getattr(record, factor)
+    try:
+        return float(result) if result is not None else None
+    except (ValueError, TypeError) as error:
+        logger.warning(f"Couldn't convert {result!r} to float: {error}")
+        return None
+
+def sort_values(values: list[tuple[str, float | None]], order: str) -> list[tuple[str, float | None]]:
+    # Missing values always go last
+    match order:
+        case "ascending":
+            return sorted(values, key=lambda item: (item[1] is None, item[1]))
+        case "descending":
+            return sorted(values, key=lambda item: (item[1] is not None, item[1]), reverse=True)
+        case "name":
+            return values
+        case _:
+            raise ValueError(f"Unknown sorting method: {order}")
+
+def compare(factor: str, *, order: str = "ascending", dataset: Dataset | None = None) -> Comparison:
+    if factor not in COMPARE_FACTORS:
+        raise ValueError(f"Unknown factor: {factor}")
+
+    if dataset is None:
+        dataset = get_dataset()
+    values = [(name, factor_value(record, factor)) for name, record in dataset.records.items()]
+    return Comparison(factor, COMPARE_FACTORS[factor], order, sort_values(values, order))
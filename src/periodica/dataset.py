@@ -0,0 +1,106 @@
+import json, hashlib, functools, logging
+from typing import Any
+from collections.abc import Mapping
+from pathlib import Path
+from periodica.records import ElementRecord
+from periodica.layout import TableLayout, build_layout
+from periodica.isotope_index import LazyIsotopes, get_isotope_index
+
+logger = logging.getLogger(__name__)
+
+Element = dict[str, Any]
+
+class DatasetError(Exception):
+    pass
+
+class Dataset():
+    def __init__(self, elements: dict[str, Element], isotopes: Mapping[str, dict[str, Any]]):
+        self.elements = elements
+        self.isotopes = isotopes
+
+        # Names, symbols and atomic numbers all resolve through one index; the first element wins on a clash
+        self.index: dict[str, Element] = {}
+        for element in elements.values():
+            general = element["general"]
+            for key in (general["fullname"].lower(), general["symbol"].lower(), str(general["atomic_number"])):
+                self.index.setdefault(key, element)
+
+        self.search_terms = [term for term in self.index if not term.isdigit()]
+        self._records: dict[str, ElementRecord] | None = None
+        self._layout: TableLayout | None = None
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    @property
+    def records(self) -> dict[str, ElementRecord]:
+        # Built on first use; the raw dicts stay around for callers (like the CLI renderer) that want them. Nuclides are
+        # only attached when a record's isotopes are used, and read without caching them in the isotope mapping.
+        if self._records is None:
+            self._records = {
+                name: ElementRecord.from_dict(element, functools.partial(self.read_isotopes, element))
+                for name, element in self.elements.items()
+            }
+        return self._records
+
+    @property
+    def layout(self) -> TableLayout:
+        # Laid out once from the coordinates in the data, then shared by every card and heatmap
+        if self._layout is None:
+            self._layout = build_layout(self.elements)
+        return self._layout
+
+    def isotopes_of(self, element: Element) -> dict[str, Any]:
+        return self.isotopes.get(element["general"]["fullname"].capitalize(), {})
+
+    def read_isotopes(self, element: Element) -> dict[str, Any]:
+        # Like isotopes_of, but without caching what it parses, so a pass over every element keeps memory flat
+        name = element["general"]["fullname"].capitalize()
+        if isinstance(self.isotopes, LazyIsotopes) and name in self.isotopes.index and name not in self.isotopes.loaded:
+            return self.isotopes.read(name)
+        return self.isotopes.get(name, {})
+
+def load_dataset(
+    element_file: Path | str | None = None,
+    isotope_file: Path | str | None = None,
+    *,
+    validate: bool = False,
+    index_cache: Path | None = None,
+) -> Dataset:
+    # Unless the data is validated (which needs all of it), each element's nuclides are only parsed when first used.
+    # index_cache keeps the offset index on disk so it is built once per version of isotopes.json.
+    from lib.directories import ELEMENT_DATA_FILE, ISOTOPE_DATA_FILE
+
+    element_file = Path(element_file) if element_file is not None else ELEMENT_DATA_FILE
+    isotope_file = Path(isotope_file) if isotope_file is not None else ISOTOPE_DATA_FILE
+
+    try:
+        with open(element_file, "rb") as file:
+            elements = json.loads(file.read())
+        with open(isotope_file, "rb") as file:
+            isotope_bytes = file.read()
+
+        if validate:
+            isotopes: Mapping[str, Any] = json.loads(isotope_bytes)
+        else:
+            data_hash = hashlib.sha256(isotope_bytes).hexdigest() if index_cache is not None else None
+            isotopes = LazyIsotopes(isotope_bytes, get_isotope_index(isotope_bytes, data_hash, index_cache))
+    except FileNotFoundError as error:
+        raise DatasetError(f"Data file not found: {error.filename}")
+    except ValueError as error:
+        raise DatasetError(f"Data file is not valid JSON: {error}")
+
+    if validate:
+        from lib.schema import validate_dataset
+
+        problems = validate_dataset(elements, isotopes)
+        if problems:
+            raise DatasetError(f"The dataset failed validation with {len(problems)} problem(s): {problems[0]}")
+
+    logger.info(f"Loaded {len(elements)} elements from {element_file}.")
+    return Dataset(elements, isotopes)
+
+@functools.cache
+def get_dataset() -> Dataset:
+    # The bundled (or PERIODICA_DATA_DIR) dataset, read on first use rather than on import
+    return load_dataset()
@@ -0,0 +1,45 @@
+from collections import deque
+from typing import NamedTuple
+from periodica.dataset import Dataset, get_dataset
+from periodica.lookup import IsotopeNotFound, isotope
+from periodica.records import DecayBranch, HalfLife, compact_decays
+
+# Products in the data may carry a trailing "?" when the decay product is not confirmed
+UNSURE_SUFFIX = "?"
+MAX_CHAIN_LENGTH = 256
+
+class DecayNode(NamedTuple):
+    nuclide: str
+    element: str | None
+    half_life: HalfLife
+    decays: tuple[DecayBranch, ...]
+    # False for products that have no entry in the dataset, which end their branch of the chain
+    known: bool
+
+def decay_chain(notation: str, *, dataset: Dataset | None = None) -> list[DecayNode]:
+    # Every nuclide reachable from the starting one through its decay products, breadth first, each listed once
+    if dataset is None:
+        dataset = get_dataset()
+    start = isotope(notation, dataset=dataset)
+
+    nodes = [DecayNode(start.isotope, start.fullname, start.info.get("half_life"), compact_decays(start.info.get("decay")), True)]
+    seen = {start.isotope}
+    pending = deque(product for branch in nodes[0].decays for product in branch.products)
+
+    while pending and len(nodes) < MAX_CHAIN_LENGTH:
+        product = pending.popleft().rstrip(UNSURE_SUFFIX)
+        if product in seen:
+            continue
+        seen.add(product)
+
+        try:
+            match = isotope(product, dataset=dataset)
+        except IsotopeNotFound:
+            nodes.append(DecayNode(product, None, None, (), False))
+            continue
+
+        node = DecayNode(match.isotope, match.fullname, match.info.get("half_life"), compact_decays(match.info.get("decay")), True)
+        nodes.append(node)
+        pending.extend(product for branch in node.decays for product in branch.products)
+
+    return nodes
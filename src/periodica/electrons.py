@@ -0,0 +1,106 @@
+import re, logging
+from typing import NamedTuple
+from periodica.dataset import Dataset, Element
+from periodica.lookup import as_element
+
+logger = logging.getLogger(__name__)
+
+RYDBERG_CONSTANT = 13.605693009
+SUBSHELL_AZIMUTHALS = {"s": 0, "p": 1, "d": 2, "f": 3}
+SUBSHELL_PATTERN = re.compile(r"(\d+)([spdf])(\d+)")
+
+class IonizationStep(NamedTuple):
+    order: int
+    subshell: str
+    shielding_constant: float
+    effective_nuclear_charge: float
+    energy: float
+    # Estimated error in eV; None for the first ionization, which comes from measured data when there is any
+    uncertainty: int | None
+
+def extract_subshell_factors(subshells: list[str]) -> list[tuple[int, str, int]]:
+    config: list[tuple[int, str, int]] = []
+    for subshell in subshells:
+        match = SUBSHELL_PATTERN.fullmatch(subshell)
+        if match:
+            quantum_no, azimuthal_no, count = match.groups()
+            config.append((int(quantum_no), azimuthal_no, int(count)))
+        else:
+            logger.warning(f"Malformed subshell detected: {subshell}")
+    return config
+
+def shielding_constant(subshells: list[str], target_subshell: str) -> float:
+    # Slater's rules
+    try:
+        target_principal, target_type = int(target_subshell[0]), target_subshell[1]
+        target_azimuthal = SUBSHELL_AZIMUTHALS[target_type]
+    except (IndexError, KeyError, ValueError):
+        logger.warning(f"Invalid target subshell format: {target_subshell}")
+        return 0.0
+
+    configuration = extract_subshell_factors(subshells)
+    if not configuration:
+        logger.warning(f"No valid configuration for subshell list: {subshells}")
+        return 0.0
+
+    constant = 0.0
+    for principal, subshell_type, electron_count in configuration:
+        if principal == target_principal:
+            contribution = 0.30 if subshell_type == "s" and principal == 1 else 0.35
+            if subshell_type == target_type:
+                constant += contribution * (electron_count - 1)
+            else:
+                constant += contribution * electron_count
+        elif principal == target_principal - 1:
+            constant += 0.85 * electron_count if target_azimuthal in (0, 1) else 1.00 * electron_count
+        elif principal < target_principal - 1:
+            constant += 1.00 * electron_count
+
+    return constant
+
+def calculate_ionization_series(subshells: list[str], atomic_number: int, ionization_energy: float | None) -> list[IonizationStep]:
+    steps: list[IonizationStep] = []
+    current_config = extract_subshell_factors(subshells)
+    uncertainty: int | None = None
+
+    for index in range(atomic_number):
+        # Electrons are removed from the outermost filled subshell first
+        last_idx = next((j for j in range(len(current_config) - 1, -1, -1) if current_config[j][2] > 0), None)
+        if last_idx is None:
+            break
+
+        quantum_target, azimuthal, _ = current_config[last_idx]
+        subshell = f"{quantum_target}{azimuthal}"
+        current_subshells = [f"{q}{a}{c}" for q, a, c in current_config if c > 0]
+        constant = shielding_constant(current_subshells, subshell)
+        z_eff = atomic_number - constant
+
+        if index == 0 and ionization_energy is not None:
+            energy = ionization_energy
+        else:
+            energy = RYDBERG_CONSTANT * (z_eff ** 2) / (quantum_target ** 2)
+
+        if index == 0:
+            uncertainty = None
+        elif index == 1:
+            # The first breakdown always has a lot of inaccuracy
+            uncertainty = 75
+        elif index < atomic_number // 2:
+            # Then it settles in the next half
+            uncertainty = 50
+        elif index > atomic_number // 2:
+            # The last half and especially the last one is actually pretty accurate
+            uncertainty = 25
+
+        steps.append(IonizationStep(index + 1, subshell, constant, z_eff, energy, uncertainty))
+        current_config[last_idx] = (quantum_target, azimuthal, current_config[last_idx][2] - 1)
+
+    return steps
+
+def ionization_series(element: str | Element, *, dataset: Dataset | None = None) -> list[IonizationStep]:
+    element = as_element(element, dataset)
+    return calculate_ionization_series(
+        element["electronic"]["subshells"],
+        element["general"]["atomic_number"],
+        element["electronic"]["ionization_energy"],
+    )
@@ -0,0 +1,225 @@
+import csv, gzip, json, lzma, operator, os, re, tempfile
+from typing import Any, Callable, Iterable, Iterator, TextIO
+from pathlib import Path
+from periodica.dataset import Dataset, get_dataset
+from periodica.bonds import bond_matrix
+
+# Bulk exports are written one record at a time, so memory use does not grow with the size of the dataset.
+# NDJSON keeps the nested schema as is; CSV flattens it into dotted columns like "general.coordinates.period".
+
+EXPORT_SUBJECTS = ("elements", "nuclides")
+EXPORT_FORMATS = ("ndjson", "csv")
+COMPRESSIONS = {".gz": "gzip", ".xz": "lzma"}
+
+FILTER_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "!=": operator.ne,
+    "=": operator.eq,
+    "<": operator.lt,
+    ">": operator.gt,
+}
+FILTER_PATTERN = re.compile(r"([A-Za-z_.]+)\s*(<=|>=|!=|=|<|>)\s*(.*)")
+
+Record = dict[str, Any]
+Predicate = Callable[[Record], bool]
+
+class ExportError(Exception):
+    pass
+
+def schema_columns(spec: Any, prefix: str = "") -> list[str]:
+    from lib.schema import Optional, Nullable
+
+    while isinstance(spec, (Optional, Nullable)):
+        spec = spec.spec
+    if not isinstance(spec, dict):
+        return [prefix]
+
+    columns: list[str] = []
+    for key, field in spec.items():
+        columns.extend(schema_columns(field, f"{prefix}.{key}" if prefix else key))
+    return columns
+
+def element_columns() -> list[str]:
+    from lib.schema import ELEMENT_SCHEMA
+
+    return schema_columns(ELEMENT_SCHEMA) + ["isotope_count"]
+
+def nuclide_columns() -> list[str]:
+    from lib.schema import NUCLIDE_SCHEMA
+
+    return ["element", "symbol", "nuclide"] + schema_columns(NUCLIDE_SCHEMA)
+
+def flatten(record: Record, prefix: str = "", into: Record | None = None) -> Record:
+    # Lists and free-form mappings (discoverers, lattice constants, metastable states) become compact JSON cells
+    flat: Record = {} if into is None else into
+    for key, value in record.items():
+        column = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict) and key not in ("discoverers", "constants", "metastable"):
+            flatten(value, column, flat)
+        elif isinstance(value, (list, dict)):
+            flat[column] = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        else:
+            flat[column] = value
+    return flat
+
+def resolve_column(name: str, columns: list[str]) -> str:
+    # Columns can be named in full or by their last segment; on a clash the shallowest column wins (type is general.type)
+    if name in columns:
+        return name
+    candidates = [column for column in columns if column.endswith(f".{name}")]
+    depths = sorted(column.count(".") for column in candidates)
+    if len(depths) == 1 or (depths and depths[0] < depths[1]):
+        return min(candidates, key=lambda column: column.count("."))
+    if candidates:
+        raise ExportError(f"\"{name}\" is ambiguous, use one of: {', '.join(candidates)}")
+    raise ExportError(f"Unknown column \"{name}\".")
+
+def coerce_value(value: str) -> Any:
+    lowered = value.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    if lowered in ("null", "none"):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return lowered
+
+def parse_filter(expression: str, columns: list[str]) -> Predicate:
+    match = FILTER_PATTERN.fullmatch(expression.strip())
+    if not match:
+        raise ExportError(f"Invalid filter \"{expression}\", expected something like block=p or period<=3.")
+
+    name, symbol, raw_value = match.groups()
+    column = resolve_column(name, columns)
+    compare = FILTER_OPERATORS[symbol]
+    expected = coerce_value(raw_value.strip())
+
+    def predicate(record: Record) -> bool:
+        value = record.get(column)
+        if isinstance(value, str):
+            value = value.lower()
+        if expected is None or value is None:
+            return compare(value is None, expected is None) if symbol in ("=", "!=") else False
+        try:
+            return compare(value, expected)
+        except TypeError:
+            # Mismatched types (a number column against a word) never match, but "!=" should still hold
+            return symbol == "!="
+    return predicate
+
+def element_rows(dataset: Dataset, *, nested: bool) -> Iterator[tuple[Record, Record]]:
+    # Yields (output record, flat record); the flat one is what filters look at
+    for element in dataset.elements.values():
+        nuclides = dataset.read_isotopes(element)
+        flat = flatten(element)
+        flat["isotope_count"] = len(nuclides)
+        yield ({**element, "isotopes": nuclides} if nested else flat), flat
+
+def nuclide_rows(dataset: Dataset, *, nested: bool) -> Iterator[tuple[Record, Record]]:
+    for element in dataset.elements.values():
+        general = element["general"]
+        for key, nuclide in dataset.read_isotopes(element).items():
+            head = {"element": general["fullname"].capitalize(), "symbol": general["symbol"], "nuclide": key}
+            flat = flatten(nuclide, into=dict(head))
+            yield ({**head, **nuclide} if nested else flat), flat
+
+def open_output(path: Path, compression: str | None) -> TextIO:
+    if compression == "gzip":
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    if compression == "lzma":
+        return lzma.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+def write_records(file: TextIO, rows: Iterable[Record], export_format: str, columns: list[str]) -> int:
+    count = 0
+    if export_format == "csv":
+        writer = csv.DictWriter(file, fieldnames=columns, restval="", extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    else:
+        for row in rows:
+            file.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+            file.write("\n")
+            count += 1
+    return count
+
+def detect_format(path: Path) -> tuple[str | None, str | None]:
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    compression = COMPRESSIONS.get(suffixes[-1]) if suffixes else None
+    if compression is not None:
+        suffixes = suffixes[:-1]
+    export_format = suffixes[-1].lstrip(".") if suffixes and suffixes[-1].lstrip(".") in EXPORT_FORMATS else None
+    return export_format, compression
+
+def export_records(
+    subject: str,
+    destination: Path | str,
+    *,
+    export_format: str | None = None,
+    compression: str | None = None,
+    filters: Iterable[str] = (),
+    dataset: Dataset | None = None,
+) -> int:
+    # The format and compression default to what the destination's suffixes say (e.g. elements.csv.gz), then NDJSON.
+    # Output goes to a temporary file first, so a failed export never leaves a truncated file behind.
+    if dataset is None:
+        dataset = get_dataset()
+    destination = Path(destination)
+
+    if subject not in EXPORT_SUBJECTS:
+        raise ExportError(f"Unknown export subject \"{subject}\", expected one of: {', '.join(EXPORT_SUBJECTS)}")
+
+    detected_format, detected_compression = detect_format(destination)
+    export_format = export_format or detected_format or "ndjson"
+    compression = compression or detected_compression
+    if export_format not in EXPORT_FORMATS:
+        raise ExportError(f"Unknown export format \"{export_format}\", expected one of: {', '.join(EXPORT_FORMATS)}")
+
+    columns = element_columns() if subject == "elements" else nuclide_columns()
+    predicates = [parse_filter(expression, columns) for expression in filters]
+
+    source = element_rows if subject == "elements" else nuclide_rows
+    rows = (
+        output
+        for output, flat in source(dataset, nested=export_format == "ndjson")
+        if all(predicate(flat) for predicate in predicates)
+    )
+
+    return write_atomically(destination, compression, lambda file: write_records(file, rows, export_format, columns))
+
+def write_atomically(destination: Path, compression: str | None, write: Callable[[TextIO], int]) -> int:
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(prefix=f".{destination.name}.", suffix=".part", dir=destination.parent)
+    os.close(descriptor)
+    os.chmod(temporary, 0o644)
+    try:
+        with open_output(Path(temporary), compression) as file:
+            count = write(file)
+        os.replace(temporary, destination)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+    return count
+
+def export_bond_matrix(destination: Path | str, *, dataset: Dataset | None = None) -> int:
+    # A square CSV with the symbols as both the header and the first column; masked cells are left empty
+    destination = Path(destination)
+    matrix = bond_matrix(dataset=dataset)
+
+    def write(file: TextIO) -> int:
+        writer = csv.writer(file)
+        writer.writerow(["symbol", *matrix.symbols])
+        for symbol, row in zip(matrix.symbols, matrix.differences):
+            writer.writerow([symbol, *("" if difference is None else difference for difference in row)])
+        return len(matrix.symbols)
+
+    return write_atomically(destination, detect_format(destination)[1], write)
@@ -0,0 +1,158 @@
+import re, functools
+from typing import NamedTuple
+from periodica.dataset import Dataset, Element, get_dataset
+from periodica.lookup import ElementNotFound, find_element
+
+# Formulas are written the usual way: element symbols with counts, nested groups in (), [] or {}, hydrates joined with
+# ·, •, * or . (each part may start with a coefficient, as in CuSO4·5H2O), and an optional charge at the end.
+# Charges are ^2-, ^+, ²⁻ or a run of signs (NH4+, O--); a bare 2- is not one, since SO42- could be SO4²⁻ or S O42⁻.
+
+FORMULA_CACHE_SIZE = 4096
+ELECTRON_MOLAR_MASS = 0.000548579909 # g/mol
+
+HYDRATE_SEPARATORS = "·•*."
+BRACKETS = {"(": ")", "[": "]", "{": "}"}
+SUBSCRIPTS = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
+SUPERSCRIPTS = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻", "0123456789+-")
+
+SYMBOL_PATTERN = re.compile(r"[A-Z][a-z]*")
+COUNT_PATTERN = re.compile(r"\d+")
+CHARGE_PATTERN = re.compile(r"\^(\d*)([+-])(\d*)$|([⁰¹²³⁴⁵⁶⁷⁸⁹]*)([⁺⁻])$|(\++|-+)$")
+
+class FormulaError(ValueError):
+    def __init__(self, formula: str, message: str, position: int | None = None):
+        super().__init__(f"{message} in {formula!r}" + (f" at position {position + 1}" if position is not None else ""))
+        self.formula = formula
+        self.position = position
+
+class Formula(NamedTuple):
+    formula: str
+    # Atoms of every element, in the order the elements first appear
+    counts: tuple[tuple[str, int], ...]
+    charge: int
+
+class Component(NamedTuple):
+    symbol: str
+    element: str
+    count: int
+    mass: float
+    fraction: float
+
+class MolarMass(NamedTuple):
+    formula: str
+    mass: float
+    charge: int
+    components: tuple[Component, ...]
+
+def split_charge(formula: str, text: str) -> tuple[str, int]:
+    match = CHARGE_PATTERN.search(text)
+    if not match:
+        return text, 0
+
+    caret_before, caret_sign, caret_after, superscript_digits, superscript_sign, signs = match.groups()
+    if signs:
+        magnitude, sign = len(signs), signs[0]
+    elif caret_sign:
+        if caret_before and caret_after:
+            raise FormulaError(formula, "A charge has digits on both sides of its sign", match.start())
+        magnitude, sign = int(caret_before or caret_after or 1), caret_sign
+    else:
+        magnitude, sign = int(superscript_digits.translate(SUPERSCRIPTS) or 1), superscript_sign.translate(SUPERSCRIPTS)
+
+    return text[:match.start()], magnitude if sign == "+" else -magnitude
+
+def read_count(formula: str, text: str, position: int) -> tuple[int, int]:
+    match = COUNT_PATTERN.match(text, position)
+    if not match:
+        return 1, position
+    if int(match.group()) == 0:
+        raise FormulaError(formula, "A count of zero", position)
+    return int(match.group()), match.end()
+
+def add_counts(target: dict[str, int], source: dict[str, int], multiplier: int) -> None:
+    for symbol, count in source.items():
+        target[symbol] = target.get(symbol, 0) + count * multiplier
+
+@functools.lru_cache(maxsize=FORMULA_CACHE_SIZE)
+def parse_formula(formula: str) -> Formula:
+    # Groups are kept on a stack rather than parsed recursively, so deep nesting can't hit the recursion limit
+    text = "".join(formula.split()).translate(SUBSCRIPTS)
+    text, charge = split_charge(formula, text)
+    if not text:
+        raise FormulaError(formula, "No elements")
+
+    totals: dict[str, int] = {}
+    groups: list[dict[str, int]] = [{}]
+    closers: list[tuple[str, int]] = []
+    coefficient, position = read_count(formula, text, 0)
+
+    while position < len(text):
+        character = text[position]
+
+        if character.isupper():
+            symbol = SYMBOL_PATTERN.match(text, position).group() # type: ignore
+            count, position = read_count(formula, text, position + len(symbol))
+            groups[-1][symbol] = groups[-1].get(symbol, 0) + count
+
+        elif character in BRACKETS:
+            groups.append({})
+            closers.append((BRACKETS[character], position))
+            position += 1
+
+        elif character in BRACKETS.values():
+            if not closers or closers[-1][0] != character:
+                raise FormulaError(formula, f"Unmatched {character!r}", position)
+            group = groups.pop()
+            if not group:
+                raise FormulaError(formula, "An empty group", closers[-1][1])
+            closers.pop()
+            count, position = read_count(formula, text, position + 1)
+            add_counts(groups[-1], group, count)
+
+        elif character in HYDRATE_SEPARATORS:
+            if closers:
+                raise FormulaError(formula, f"Unclosed {text[closers[-1][1]]!r}", closers[-1][1])
+            if not groups[0]:
+                raise FormulaError(formula, "An empty part", position)
+            add_counts(totals, groups[0], coefficient)
+            groups = [{}]
+            coefficient, position = read_count(formula, text, position + 1)
+
+        else:
+            raise FormulaError(formula, f"Unexpected {character!r}", position)
+
+    if closers:
+        raise FormulaError(formula, f"Unclosed {text[closers[-1][1]]!r}", closers[-1][1])
+    if not groups[0]:
+        raise FormulaError(formula, "An empty part", position)
+    add_counts(totals, groups[0], coefficient)
+
+    return Formula(formula, tuple(totals.items()), charge)
+
+def element_by_symbol(formula: str, symbol: str, dataset: Dataset) -> Element:
+    # The element lookup also takes names and numbers, so the match has to be checked to really be that symbol
+    try:
+        element = find_element(symbol, dataset=dataset)
+    except ElementNotFound:
+        raise FormulaError(formula, f"Unknown element symbol {symbol!r}")
+    if element["general"]["symbol"] != symbol:
+        raise FormulaError(formula, f"Unknown element symbol {symbol!r}")
+    return element
+
+def molar_mass(formula: str, *, dataset: Dataset | None = None) -> MolarMass:
+    if dataset is None:
+        dataset = get_dataset()
+    parsed = parse_formula(formula)
+
+    parts: list[tuple[str, str, int, float]] = []
+    for symbol, count in parsed.counts:
+        element = element_by_symbol(formula, symbol, dataset)
+        atomic_mass = element["physical"]["atomic_mass"]
+        if atomic_mass is None:
+            raise FormulaError(formula, f"{element['general']['fullname']} has no atomic mass")
+        parts.append((symbol, element["general"]["fullname"], count, atomic_mass * count))
+
+    # Ions weigh their electrons more or less than the neutral atoms do
+    total = sum(mass for *_, mass in parts) - parsed.charge * ELECTRON_MOLAR_MASS
+    components = tuple(Component(symbol, name, count, mass, mass / total) for symbol, name, count, mass in parts)
+    return MolarMass(formula, total, parsed.charge, components)
@@ -0,0 +1,95 @@
+import re, json
+from typing import Any, Iterator
+from collections.abc import Mapping
+from pathlib import Path
+
+# isotopes.json is one object keyed by element name. Instead of parsing all of it, an index of where each
+# element's value starts and ends in the raw bytes lets a lookup deserialize just the element it needs.
+
+IsotopeIndex = dict[str, tuple[int, int]]
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+def build_isotope_index(data: bytes) -> IsotopeIndex:
+    # Latin-1 maps every byte to exactly one character, so string positions are byte offsets. Multi-byte UTF-8
+    # sequences only ever contain bytes >= 0x80, so they can't be mistaken for JSON syntax.
+    text = data.decode("latin-1")
+    decoder = json.JSONDecoder()
+    index: IsotopeIndex = {}
+
+    position = WHITESPACE.match(text, 0).end() # type: ignore
+    if text[position:position + 1] != "{":
+        raise ValueError("The isotope data is not a JSON object")
+    position = WHITESPACE.match(text, position + 1).end() # type: ignore
+
+    while text[position:position + 1] != "}":
+        if text[position:position + 1] != '"':
+            raise ValueError(f"Expected a key at byte {position} of the isotope data")
+        key_start = position
+        _, position = json.decoder.scanstring(text, position + 1) # type: ignore
+        key = json.loads(data[key_start:position])
+        position = WHITESPACE.match(text, position).end() # type: ignore
+        if text[position:position + 1] != ":":
+            raise ValueError(f"Expected ':' at byte {position} of the isotope data")
+        position = WHITESPACE.match(text, position + 1).end() # type: ignore
+
+        # Skipping the value still means decoding it, but nothing decoded here is kept
+        _, end = decoder.raw_decode(text, position)
+        index[key] = (position, end - position)
+
+        position = WHITESPACE.match(text, end).end() # type: ignore
+        if text[position:position + 1] == ",":
+            position = WHITESPACE.match(text, position + 1).end() # type: ignore
+
+    return index
+
+def load_cached_index(cache_file: Path, data_hash: str) -> IsotopeIndex | None:
+    try:
+        with open(cache_file, "r", encoding="utf-8") as file:
+            cached = json.load(file)
+        if cached.get("hash") != data_hash:
+            return None
+        return {name: (start, length) for name, (start, length) in cached["offsets"].items()}
+    except (FileNotFoundError, json.JSONDecodeError, AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+def get_isotope_index(data: bytes, data_hash: str | None = None, cache_file: Path | None = None) -> IsotopeIndex:
+    # The index is persisted next to the data hash it was built for, so it is only ever built once per file version
+    if cache_file is not None and data_hash is not None:
+        index = load_cached_index(cache_file, data_hash)
+        if index is not None:
+            return index
+
+    index = build_isotope_index(data)
+
+    if cache_file is not None and data_hash is not None:
+        try:
+            with open(cache_file, "w", encoding="utf-8") as file:
+                json.dump({"hash": data_hash, "offsets": index}, file)
+        except OSError:
+            pass
+
+    return index
+
+class LazyIsotopes(Mapping[str, dict[str, Any]]):
+    # Behaves like the parsed isotopes.json object, deserializing each element's nuclides on first access
+    def __init__(self, data: bytes, index: IsotopeIndex):
+        self.data = data
+        self.index = index
+        self.loaded: dict[str, dict[str, Any]] = {}
+
+    def __getitem__(self, name: str) -> dict[str, Any]:
+        if name not in self.loaded:
+            self.loaded[name] = self.read(name)
+        return self.loaded[name]
+
+    def read(self, name: str) -> dict[str, Any]:
+        # Deserializes without caching, for single passes over every element
+        start, length = self.index[name]
+        return json.loads(self.data[start:start + length])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
@@ -0,0 +1,38 @@
+from typing import Any, NamedTuple
+
+# The table is laid out from each element's period and group. f-block elements all sit in group 3, so they go to a
+# row of their own under the main table, one per period, in atomic number order. The same happens to any element whose
+# cell is already taken.
+
+MAIN_COLUMNS = 18
+F_ROW_OFFSET = 3
+
+class TableLayout(NamedTuple):
+    # Element names (the dataset keys) per cell, None for gaps; the f-block rows come after the main rows
+    rows: tuple[tuple[str | None, ...], ...]
+    main_rows: int
+    positions: dict[str, tuple[int, int]]
+
+def build_layout(elements: dict[str, dict[str, Any]]) -> TableLayout:
+    ordered = sorted(elements.items(), key=lambda item: item[1]["general"]["atomic_number"])
+
+    main: dict[tuple[int, int], str] = {}
+    overflow: dict[int, list[str]] = {}
+    for name, element in ordered:
+        general = element["general"]
+        period, group = general["coordinates"]["period"], general["coordinates"]["group"]
+        if general["block"] == "f" or (period, group) in main:
+            overflow.setdefault(period, []).append(name)
+        else:
+            main[period, group] = name
+
+    periods = max([period for period, _ in main] + list(overflow), default=0)
+    columns = max([MAIN_COLUMNS] + [group for _, group in main] + [F_ROW_OFFSET + len(names) for names in overflow.values()])
+
+    rows = [[main.get((period, group)) for group in range(1, columns + 1)] for period in range(1, periods + 1)]
+    for period in sorted(overflow):
+        names = overflow[period]
+        rows.append([None] * F_ROW_OFFSET + names + [None] * (columns - F_ROW_OFFSET - len(names)))
+
+    positions = {name: (row, column) for row, cells in enumerate(rows) for column, name in enumerate(cells) if name is not None}
+    return TableLayout(tuple(tuple(row) for row in rows), periods, positions)
@@ -0,0 +1,103 @@
+import re, difflib, logging
+from typing import Any, NamedTuple
+from periodica.dataset import Dataset, Element, get_dataset
+
+logger = logging.getLogger(__name__)
+
+class ElementNotFound(LookupError):
+    def __init__(self, query: str, suggestion: str | None = None):
+        super().__init__(f"No element found for {query!r}" + (f"; did you mean {suggestion!r}?" if suggestion else ""))
+        self.query = query
+        self.suggestion = suggestion
+
+class IsotopeNotFound(LookupError):
+    pass
+
+class IsotopeMatch(NamedTuple):
+    isotope: str
+    symbol: str
+    fullname: str
+    info: dict[str, Any]
+    # The ground state key (e.g. "10Li" for "10Lim2"), whose record lists every metastable state
+    nuclide: str
+
+def parse_isotope(notation: str) -> dict[str, str | None]:
+    text = notation.strip().lower()
+
+    match = re.match(r"^(\d+)\s*([A-Za-z][a-z]?)(?:[\s\-]*(m\d*))?$", text)
+    if match:
+        mass, identifier, meta = match.groups()
+        return {
+            "mass_number": mass,
+            "raw_identifier": identifier,
+            "meta": meta,
+        }
+
+    match = re.match(r"^([A-Za-z]+)[\s\-]*(\d+)(m\d*)?$", text)
+    if match:
+        identifier, mass, meta = match.groups()
+        return {
+            "mass_number": mass,
+            "raw_identifier": identifier.capitalize(),
+            "meta": meta,
+        }
+
+    return {
+        "mass_number": None,
+        "raw_identifier": None,
+        "meta": None,
+    }
+
+def find_element(query: str, *, dataset: Dataset | None = None) -> Element:
+    if dataset is None:
+        dataset = get_dataset()
+    candidate = query.strip().lower()
+
+    element = dataset.index.get(candidate)
+    if element is not None:
+        return element
+
+    suggestion = difflib.get_close_matches(candidate, dataset.search_terms, n=1, cutoff=0.6)
+    raise ElementNotFound(query, suggestion[0] if suggestion else None)
+
+def as_element(element: str | Element, dataset: Dataset | None = None) -> Element:
+    return find_element(element, dataset=dataset) if isinstance(element, str) else element
+
+def find_isotope(element: str | Element, mass_number: int | str, meta: str = "", *, dataset: Dataset | None = None) -> IsotopeMatch:
+    if dataset is None:
+        dataset = get_dataset()
+
+    try:
+        element = as_element(element, dataset)
+    except ElementNotFound:
+        raise IsotopeNotFound(f"No element found for symbol or name: {element}")
+
+    element_name = element["general"]["fullname"]
+    symbol = element["general"]["symbol"]
+    nuclides = dataset.isotopes_of(element)
+
+    key = f"{mass_number}{symbol}"
+    if key not in nuclides:
+        raise IsotopeNotFound(f"No isotope match found for mass number {mass_number} in element {element_name}.")
+
+    info = nuclides[key]
+    if meta:
+        meta = meta.lower()
+        if meta not in (info.get("metastable") or {}):
+            raise IsotopeNotFound(f"No metastable isomer {meta.upper()} found for {key}.")
+        info = info["metastable"][meta]
+
+    return IsotopeMatch(key + meta, symbol, element_name, info, key)
+
+def isotope(notation: str, *, dataset: Dataset | None = None) -> IsotopeMatch:
+    parsed = parse_isotope(notation)
+    if not parsed["raw_identifier"] or not parsed["mass_number"]:
+        raise IsotopeNotFound(f"Not an isotope notation: {notation!r}")
+    return find_isotope(parsed["raw_identifier"], parsed["mass_number"], parsed["meta"] or "", dataset=dataset)
+
+def search(query: str, *, dataset: Dataset | None = None) -> Element | IsotopeMatch:
+    # Anything that parses as isotope notation is looked up as one, everything else as an element
+    parsed = parse_isotope(query)
+    if parsed["raw_identifier"] and parsed["mass_number"]:
+        return find_isotope(parsed["raw_identifier"], parsed["mass_number"], parsed["meta"] or "", dataset=dataset)
+    return find_element(query, dataset=dataset)
@@ -0,0 +1,215 @@
+import sys
+from typing import Any, Callable
+
+# Compact read-only views of the dataset. Every element and nuclide becomes one __slots__ object with flat
+# attributes instead of a tree of dicts, and the small vocabularies that repeat across thousands of records
+# (units, decay modes, decay products, types, phases) are interned so each distinct string exists once.
+
+HalfLife = tuple[Any, ...] | str | None
+
+# An element's nuclides, either already parsed or as a function that parses them when they are first needed
+NuclideSource = dict[str, Any] | Callable[[], dict[str, Any]]
+
+def intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+def compact_half_life(half_life: Any) -> HalfLife:
+    if isinstance(half_life, list):
+        return tuple(intern(part) for part in half_life)
+    return intern(half_life)
+
+class DecayBranch():
+    __slots__ = ("mode", "products", "chance")
+
+    def __init__(self, mode: str, products: tuple[str, ...], chance: float | None):
+        self.mode = mode
+        self.products = products
+        self.chance = chance
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DecayBranch":
+        return cls(sys.intern(data["mode"]), tuple(sys.intern(product) for product in data.get("product", ())), data.get("chance"))
+
+    def __repr__(self) -> str:
+        return f"DecayBranch({self.mode!r}, {self.products!r}, {self.chance!r})"
+
+def compact_decays(decays: Any) -> tuple[DecayBranch, ...]:
+    return tuple(DecayBranch.from_dict(branch) for branch in decays) if isinstance(decays, list) else ()
+
+class MetastableState():
+    __slots__ = ("label", "energy", "half_life", "decays")
+
+    def __init__(self, label: str, energy: float, half_life: HalfLife, decays: tuple[DecayBranch, ...]):
+        self.label = label
+        self.energy = energy
+        self.half_life = half_life
+        self.decays = decays
+
+    def __repr__(self) -> str:
+        return f"MetastableState({self.label!r}, energy={self.energy!r})"
+
+class NuclideRecord():
+    __slots__ = ("key", "name", "protons", "neutrons", "half_life", "isotope_weight", "decays", "metastable")
+
+    def __init__(
+        self,
+        key: str,
+        name: str | None,
+        protons: int,
+        neutrons: int,
+        half_life: HalfLife,
+        isotope_weight: float,
+        decays: tuple[DecayBranch, ...],
+        metastable: tuple[MetastableState, ...],
+    ):
+        self.key = key
+        self.name = name
+        self.protons = protons
+        self.neutrons = neutrons
+        self.half_life = half_life
+        self.isotope_weight = isotope_weight
+        self.decays = decays
+        self.metastable = metastable
+
+    @property
+    def mass_number(self) -> int:
+        return self.protons + self.neutrons
+
+    @classmethod
+    def from_dict(cls, key: str, data: dict[str, Any]) -> "NuclideRecord":
+        metastable = tuple(
+            MetastableState(sys.intern(label), state["energy"], compact_half_life(state.get("half_life")), compact_decays(state.get("decay")))
+            for label, state in (data.get("metastable") or {}).items()
+        )
+        return cls(
+            sys.intern(key),
+            data.get("name"),
+            data["protons"],
+            data["neutrons"],
+            compact_half_life(data.get("half_life")),
+            data["isotope_weight"],
+            compact_decays(data.get("decay")),
+            metastable,
+        )
+
+    def __repr__(self) -> str:
+        return f"NuclideRecord({self.key!r})"
+
+def compact_nuclides(isotopes: dict[str, Any]) -> tuple[NuclideRecord, ...]:
+    return tuple(NuclideRecord.from_dict(key, nuclide) for key, nuclide in isotopes.items())
+
+class ElementRecord():
+    __slots__ = (
+        "name", "symbol", "atomic_number", "description", "appearance", "phase", "period", "group", "type", "block",
+        "cas_number", "radioactive", "half_life", "discovery_date", "discoverers",
+        "protons", "neutrons", "electrons",
+        "shells", "subshells", "electronegativity", "electron_affinity", "ionization_energy", "oxidation_states", "conductivity_type",
+        "melting_point", "boiling_point", "atomic_mass", "structure",
+        "calculated_radius", "empirical_radius", "covalent_radius", "van_der_waals_radius",
+        "brinell_hardness", "mohs_hardness", "vickers_hardness",
+        "bulk_modulus", "young_modulus", "shear_modulus", "poissons_ratio",
+        "stp_density", "liquid_density", "sound_transmission_speed",
+        "_isotopes", "_isotope_source",
+    )
+
+    name: str
+    symbol: str
+    atomic_number: int
+    _isotopes: tuple[NuclideRecord, ...] | None
+    _isotope_source: Callable[[], dict[str, Any]] | None
+
+    @property
+    def mass_number(self) -> int:
+        return self.protons + self.neutrons
+
+    @property
+    def isotopes(self) -> tuple[NuclideRecord, ...]:
+        if self._isotopes is None:
+            self._isotopes = compact_nuclides(self._isotope_source()) # type: ignore
+            self._isotope_source = None
+        return self._isotopes
+
+    @property
+    def isotope_count(self) -> int:
+        # Counting doesn't need the nuclides kept around, so a lazy record stays lazy
+        if self._isotopes is None:
+            return len(self._isotope_source()) # type: ignore
+        return len(self._isotopes)
+
+    @property
+    def up_quarks(self) -> int:
+        return (self.protons * 2) + self.neutrons
+
+    @property
+    def down_quarks(self) -> int:
+        return self.protons + (self.neutrons * 2)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], isotopes: NuclideSource) -> "ElementRecord":
+        general, nuclear, electronic = data["general"], data["nuclear"], data["electronic"]
+        physical, measurements, historical = data["physical"], data["measurements"], data["historical"]
+        radius, hardness, moduli, density = measurements["radius"], measurements["hardness"], measurements["moduli"], measurements["density"]
+
+        record = cls()
+        record.name = general["fullname"]
+        record.symbol = sys.intern(general["symbol"])
+        record.atomic_number = general["atomic_number"]
+        record.description = general["description"]
+        record.appearance = general["appearance"]["description"]
+        record.phase = sys.intern(general["appearance"]["phase"])
+        record.period = general["coordinates"]["period"]
+        record.group = general["coordinates"]["group"]
+        record.type = sys.intern(general["type"])
+        record.block = sys.intern(general["block"])
+        record.cas_number = general["cas_number"]
+        record.radioactive = general["radioactive"]
+        record.half_life = compact_half_life(general["half_life"])
+        record.discovery_date = historical["date"]
+        record.discoverers = tuple(historical["discoverers"].items())
+        record.protons = nuclear["protons"]
+        record.neutrons = nuclear["neutrons"]
+        record.electrons = nuclear["electrons"]
+        record.shells = tuple(electronic["shells"])
+        record.subshells = tuple(sys.intern(subshell) for subshell in electronic["subshells"])
+        record.electronegativity = electronic["electronegativity"]
+        record.electron_affinity = electronic["electron_affinity"]
+        record.ionization_energy = electronic["ionization_energy"]
+        record.oxidation_states = tuple(electronic["oxidation_states"])
+        record.conductivity_type = sys.intern(electronic["conductivity_type"])
+        record.melting_point = physical["melt"]
+        record.boiling_point = physical["boil"]
+        record.atomic_mass = physical["atomic_mass"]
+        record.structure = physical.get("structure")
+        record.calculated_radius = radius["calculated"]
+        record.empirical_radius = radius["empirical"]
+        record.covalent_radius = radius["covalent"]
+        record.van_der_waals_radius = radius["van_der_waals"]
+        record.brinell_hardness = hardness["brinell"]
+        record.mohs_hardness = hardness["mohs"]
+        record.vickers_hardness = hardness["vickers"]
+        record.bulk_modulus = moduli["bulk"]
+        record.young_modulus = moduli["young"]
+        record.shear_modulus = moduli["shear"]
+        record.poissons_ratio = moduli["poissons_ratio"]
+        record.stp_density = density["STP"]
+        record.liquid_density = density["liquid"]
+        record.sound_transmission_speed = measurements["sound_transmission_speed"]
+        if callable(isotopes):
+            record._isotopes, record._isotope_source = None, isotopes
+        else:
+            record._isotopes, record._isotope_source = compact_nuclides(isotopes), None
+        return record
+
+    def __repr__(self) -> str:
+        return f"ElementRecord({self.name!r})"
+
+def build_records(elements: dict[str, Any], isotopes: dict[str, Any], *, consume: bool = False) -> dict[str, ElementRecord]:
+    # With consume, each element's dicts are dropped as soon as its record exists, so the records can reuse
+    # that memory instead of the process briefly holding both representations in full
+    if not consume:
+        return {name: ElementRecord.from_dict(element, isotopes.get(name, {})) for name, element in elements.items()}
+
+    records: dict[str, ElementRecord] = {}
+    for name in list(elements):
+        records[name] = ElementRecord.from_dict(elements.pop(name), isotopes.pop(name, {}))
+    return records
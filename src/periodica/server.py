@@ -0,0 +1,216 @@
+import asyncio, functools, json, logging
+from typing import Any
+from urllib.parse import unquote, urlsplit, parse_qs
+from periodica.dataset import Dataset, get_dataset
+from periodica.lookup import ElementNotFound, IsotopeNotFound, find_element, isotope
+from periodica.compare import SORTING_METHODS, compare
+from periodica.bonds import bond_type
+from periodica.decay import decay_chain
+from periodica.summary import comparison_summary
+
+# A small HTTP/1.1 JSON API on asyncio streams. Connections are kept alive between requests, and since the dataset
+# never changes while serving, encoded responses are cached by path.
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+KEEPALIVE_TIMEOUT = 15.0
+MAX_REQUEST_LINE = 8 * 1024
+MAX_HEADERS = 100
+MAX_BODY = 64 * 1024
+RESPONSE_CACHE_SIZE = 4096
+
+ENDPOINTS = {
+    "/elements/{query}": "An element by name, symbol or atomic number",
+    "/isotopes/{notation}": "An isotope or metastable isomer (e.g. 6Li, li-6, 10Li-m2)",
+    "/compare/{factor}?order=ascending|descending|name": "Every element's value for a factor",
+    "/bond/{first}/{second}": "The bond type between two elements",
+    "/decay/{notation}": "Every nuclide reachable through the decays of an isotope",
+}
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Content Too Large", 422: "Unprocessable Entity"}
+
+logger = logging.getLogger(__name__)
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str, **details: Any):
+        super().__init__(message)
+        self.status = status
+        self.details = {"error": message, **details}
+
+def element_response(query: str, dataset: Dataset) -> Any:
+    try:
+        return find_element(query, dataset=dataset)
+    except ElementNotFound as error:
+        raise ApiError(404, str(error), suggestion=error.suggestion)
+
+def isotope_response(notation: str, dataset: Dataset) -> Any:
+    try:
+        return isotope(notation, dataset=dataset)._asdict()
+    except IsotopeNotFound as error:
+        raise ApiError(404, str(error))
+
+def compare_response(factor: str, order: str, dataset: Dataset) -> Any:
+    if order not in SORTING_METHODS:
+        raise ApiError(400, f"Unknown sorting method: {order}", choices=list(SORTING_METHODS))
+    try:
+        comparison = compare(factor, order=order, dataset=dataset)
+    except ValueError as error:
+        raise ApiError(404, str(error))
+    return comparison_summary(comparison)
+
+def bond_response(first: str, second: str, dataset: Dataset) -> Any:
+    try:
+        bond = bond_type(first, second, dataset=dataset)
+    except ElementNotFound as error:
+        raise ApiError(404, str(error), suggestion=error.suggestion)
+    if bond is None:
+        raise ApiError(422, "At least one of the elements has no electronegativity, so the bond type is unknown.")
+    return bond._asdict()
+
+def decay_response(notation: str, dataset: Dataset) -> Any:
+    try:
+        chain = decay_chain(notation, dataset=dataset)
+    except IsotopeNotFound as error:
+        raise ApiError(404, str(error))
+    return [
+        {
+            "nuclide": node.nuclide,
+            "element": node.element,
+            "half_life": node.half_life,
+            "known": node.known,
+            "decays": [{"mode": branch.mode, "products": list(branch.products), "chance": branch.chance} for branch in node.decays],
+        }
+        for node in chain
+    ]
+
+def route(target: str, dataset: Dataset) -> tuple[int, bytes]:
+    url = urlsplit(target)
+    parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+    query = parse_qs(url.query)
+
+    try:
+        match parts:
+            case []:
+                body: Any = {"endpoints": ENDPOINTS}
+            case ["elements", name]:
+                body = element_response(name, dataset)
+            case ["isotopes", notation]:
+                body = isotope_response(notation, dataset)
+            case ["compare", factor]:
+                body = compare_response(factor, query.get("order", ["ascending"])[0], dataset)
+            case ["bond", first, second]:
+                body = bond_response(first, second, dataset)
+            case ["decay", notation]:
+                body = decay_response(notation, dataset)
+            case _:
+                raise ApiError(404, f"No endpoint at {url.path}", endpoints=list(ENDPOINTS))
+        status = 200
+    except ApiError as error:
+        status, body = error.status, error.details
+
+    return status, json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def encode_response(status: int, body: bytes, keep_alive: bool) -> bytes:
+    head = (
+        f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + body
+
+class ApiServer():
+    def __init__(self, dataset: Dataset | None = None):
+        if dataset is None:
+            dataset = get_dataset()
+        self.dataset = dataset
+        self.respond = functools.lru_cache(maxsize=RESPONSE_CACHE_SIZE)(functools.partial(route, dataset=self.dataset))
+        self.requests = 0
+
+    async def read_line(self, reader: asyncio.StreamReader) -> bytes:
+        try:
+            return await asyncio.wait_for(reader.readline(), KEEPALIVE_TIMEOUT)
+        except ValueError:
+            # The stream refuses lines longer than its buffer limit
+            raise ApiError(400, "Request line or header too long.")
+
+    async def read_request(self, reader: asyncio.StreamReader) -> tuple[str, str, str, dict[str, str]] | None:
+        line = await self.read_line(reader)
+        if not line:
+            return None
+        if len(line) > MAX_REQUEST_LINE:
+            raise ApiError(400, "Request line too long.")
+
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError:
+            raise ApiError(400, "Malformed request line.")
+
+        headers: dict[str, str] = {}
+        for _ in range(MAX_HEADERS + 1):
+            line = await self.read_line(reader)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise ApiError(400, "Too many headers.")
+
+        # Request bodies mean nothing to this API, but they still have to be read off the connection
+        length = headers.get("content-length", "0")
+        if not length.isdigit():
+            raise ApiError(400, "Malformed Content-Length.")
+        if int(length) > MAX_BODY:
+            raise ApiError(413, f"Request bodies are limited to {MAX_BODY} bytes.")
+        if int(length):
+            await asyncio.wait_for(reader.readexactly(int(length)), KEEPALIVE_TIMEOUT)
+
+        return method, target, version, headers
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await self.read_request(reader)
+                except ApiError as error:
+                    writer.write(encode_response(error.status, json.dumps(error.details).encode("utf-8"), False))
+                    break
+                if request is None:
+                    break
+
+                method, target, version, headers = request
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                if method not in ("GET", "HEAD"):
+                    status, body = 405, json.dumps({"error": f"Method {method} is not allowed."}).encode("utf-8")
+                else:
+                    status, body = self.respond(target)
+
+                response = encode_response(status, body, keep_alive)
+                writer.write(response[:len(response) - len(body)] if method == "HEAD" else response)
+                await writer.drain()
+                self.requests += 1
+
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, *, ready: Any = None) -> None:
+        server = await asyncio.start_server(self.handle, host, port, backlog=1024)
+        logger.info(f"Serving the API on {host}:{port}.")
+        if ready is not None:
+            ready(server)
+        async with server:
+            await server.serve_forever()
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, *, dataset: Dataset | None = None) -> None:
+    asyncio.run(ApiServer(dataset).serve(host, port))
@@ -0,0 +1,265 @@
+import os, sqlite3, tempfile
+from typing import Any, Iterable
+from pathlib import Path
+from periodica.dataset import Dataset, get_dataset
+from periodica.records import ElementRecord, NuclideRecord, DecayBranch, HalfLife
+
+# The dataset compiled into normalized tables, so filters, joins and aggregations can run inside SQLite.
+# Half-lives are stored both as given and converted to seconds, with stable nuclides flagged separately.
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+
+CREATE TABLE elements (
+    atomic_number INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    symbol TEXT NOT NULL UNIQUE,
+    period INTEGER, "group" INTEGER, type TEXT, block TEXT, phase TEXT,
+    radioactive INTEGER, half_life_seconds REAL,
+    protons INTEGER, neutrons INTEGER, electrons INTEGER,
+    electronegativity REAL, electron_affinity REAL, ionization_energy REAL, conductivity_type TEXT,
+    melting_point REAL, boiling_point REAL, atomic_mass REAL,
+    calculated_radius REAL, empirical_radius REAL, covalent_radius REAL, van_der_waals_radius REAL,
+    brinell_hardness REAL, mohs_hardness REAL, vickers_hardness REAL,
+    bulk_modulus REAL, young_modulus REAL, shear_modulus REAL, poissons_ratio REAL,
+    stp_density REAL, liquid_density REAL, sound_transmission_speed REAL
+);
+
+CREATE TABLE nuclides (
+    id INTEGER PRIMARY KEY,
+    atomic_number INTEGER NOT NULL REFERENCES elements(atomic_number),
+    key TEXT NOT NULL,
+    name TEXT,
+    z INTEGER NOT NULL, n INTEGER NOT NULL, a INTEGER NOT NULL,
+    isotope_weight REAL,
+    stable INTEGER NOT NULL,
+    half_life_value REAL, half_life_unit TEXT, half_life_qualifier TEXT, half_life_seconds REAL
+);
+
+CREATE TABLE metastable_states (
+    id INTEGER PRIMARY KEY,
+    nuclide_id INTEGER NOT NULL REFERENCES nuclides(id),
+    label TEXT NOT NULL,
+    energy_kev REAL,
+    half_life_value REAL, half_life_unit TEXT, half_life_qualifier TEXT, half_life_seconds REAL
+);
+
+CREATE TABLE decays (
+    id INTEGER PRIMARY KEY,
+    nuclide_id INTEGER NOT NULL REFERENCES nuclides(id),
+    metastable_id INTEGER REFERENCES metastable_states(id),
+    mode TEXT NOT NULL,
+    chance REAL
+);
+
+CREATE TABLE decay_products (
+    decay_id INTEGER NOT NULL REFERENCES decays(id),
+    product TEXT NOT NULL,
+    unsure INTEGER NOT NULL
+);
+
+CREATE INDEX nuclides_element ON nuclides(atomic_number);
+CREATE INDEX nuclides_z ON nuclides(z);
+CREATE INDEX nuclides_n ON nuclides(n);
+CREATE INDEX nuclides_a ON nuclides(a);
+CREATE INDEX nuclides_half_life ON nuclides(half_life_seconds);
+CREATE INDEX metastable_nuclide ON metastable_states(nuclide_id);
+CREATE INDEX decays_nuclide ON decays(nuclide_id);
+CREATE INDEX decays_mode ON decays(mode);
+CREATE INDEX decay_products_decay ON decay_products(decay_id);
+CREATE INDEX decay_products_product ON decay_products(product);
+"""
+
+# Numeric element properties that get their own index
+INDEXED_PROPERTIES = (
+    "period", "group", "melting_point", "boiling_point", "atomic_mass", "electronegativity", "electron_affinity",
+    "ionization_energy", "covalent_radius", "stp_density",
+)
+
+ELEMENT_COLUMNS = (
+    "atomic_number", "name", "symbol", "period", "group", "type", "block", "phase", "radioactive", "half_life_seconds",
+    "protons", "neutrons", "electrons", "electronegativity", "electron_affinity", "ionization_energy", "conductivity_type",
+    "melting_point", "boiling_point", "atomic_mass", "calculated_radius", "empirical_radius", "covalent_radius",
+    "van_der_waals_radius", "brinell_hardness", "mohs_hardness", "vickers_hardness", "bulk_modulus", "young_modulus",
+    "shear_modulus", "poissons_ratio", "stp_density", "liquid_density", "sound_transmission_speed",
+)
+
+UNIT_SECONDS = {
+    "yoctoseconds": 1e-24,
+    "zeptoseconds": 1e-21,
+    "attoseconds": 1e-18,
+    "femtoseconds": 1e-15,
+    "picoseconds": 1e-12,
+    "nanoseconds": 1e-9,
+    "microseconds": 1e-6,
+    "milliseconds": 1e-3,
+    "seconds": 1.0,
+    "minutes": 60.0,
+    "hours": 3600.0,
+    "days": 86400.0,
+    "years": 31556952.0,
+}
+
+# Name: (parameters, description, SQL). Parameters are bound in order from the command line.
+PREPARED_QUERIES: dict[str, tuple[tuple[str, ...], str, str]] = {
+    "isotopes": (("element",), "All nuclides of an element", """
+        SELECT n.key, n.name, n.z, n.n, n.a, n.isotope_weight, n.stable, n.half_life_seconds
+        FROM nuclides n JOIN elements e USING (atomic_number)
+        WHERE lower(e.name) = lower(:element) OR lower(e.symbol) = lower(:element)
+        ORDER BY n.a
+    """),
+    "isobars": (("a",), "Nuclides with the mass number A", """
+        SELECT n.key, e.name, n.z, n.n, n.half_life_seconds FROM nuclides n JOIN elements e USING (atomic_number)
+        WHERE n.a = :a ORDER BY n.z
+    """),
+    "isotones": (("n",), "Nuclides with N neutrons", """
+        SELECT n.key, e.name, n.z, n.a, n.half_life_seconds FROM nuclides n JOIN elements e USING (atomic_number)
+        WHERE n.n = :n ORDER BY n.z
+    """),
+    "stable-counts": ((), "Stable and radioactive nuclide counts per element", """
+        SELECT e.name, sum(n.stable) AS stable, count(*) - sum(n.stable) AS radioactive, count(*) AS total
+        FROM elements e JOIN nuclides n USING (atomic_number)
+        GROUP BY e.atomic_number ORDER BY e.atomic_number
+    """),
+    "decay-modes": ((), "How often each decay mode occurs, and its average branching chance", """
+        SELECT mode, count(*) AS branches, round(avg(chance), 3) AS average_chance
+        FROM decays GROUP BY mode ORDER BY branches DESC
+    """),
+    "decays-into": (("product",), "Nuclides with a decay branch producing a nuclide (e.g. 14N)", """
+        SELECT DISTINCT n.key, e.name, d.mode, d.chance, m.label AS metastable
+        FROM decay_products p
+        JOIN decays d ON d.id = p.decay_id
+        JOIN nuclides n ON n.id = d.nuclide_id
+        JOIN elements e USING (atomic_number)
+        LEFT JOIN metastable_states m ON m.id = d.metastable_id
+        WHERE p.product = :product ORDER BY n.z, n.a
+    """),
+    "longest-lived": (("limit",), "Radioactive nuclides with the longest known half-lives", """
+        SELECT n.key, e.name, n.half_life_value, n.half_life_unit, n.half_life_seconds
+        FROM nuclides n JOIN elements e USING (atomic_number)
+        WHERE n.half_life_seconds IS NOT NULL ORDER BY n.half_life_seconds DESC LIMIT :limit
+    """),
+    "electronegativity-range": (("low", "high"), "Elements with an electronegativity between two values", """
+        SELECT name, symbol, electronegativity FROM elements
+        WHERE electronegativity BETWEEN :low AND :high ORDER BY electronegativity
+    """),
+}
+
+def half_life_columns(half_life: HalfLife) -> tuple[Any, Any, Any, Any]:
+    if not isinstance(half_life, tuple) or len(half_life) < 2:
+        return None, half_life if isinstance(half_life, str) else None, None, None
+
+    value, unit = half_life[0], half_life[1]
+    qualifier = half_life[2] if len(half_life) > 2 else None
+    try:
+        seconds = float(value) * UNIT_SECONDS[unit] if qualifier is None else None
+    except (KeyError, TypeError, ValueError):
+        seconds = None
+    return value, unit, qualifier, seconds
+
+def element_row(record: ElementRecord) -> tuple[Any, ...]:
+    values = {column: getattr(record, column, None) for column in ELEMENT_COLUMNS}
+    values["half_life_seconds"] = half_life_columns(record.half_life)[3]
+    return tuple(values[column] for column in ELEMENT_COLUMNS)
+
+def insert_decays(cursor: sqlite3.Cursor, decays: Iterable[DecayBranch], nuclide_id: int, metastable_id: int | None) -> None:
+    for branch in decays:
+        cursor.execute("INSERT INTO decays (nuclide_id, metastable_id, mode, chance) VALUES (?, ?, ?, ?)", (nuclide_id, metastable_id, branch.mode, branch.chance))
+        decay_id = cursor.lastrowid
+        cursor.executemany(
+            "INSERT INTO decay_products (decay_id, product, unsure) VALUES (?, ?, ?)",
+            [(decay_id, product.rstrip("?"), product.endswith("?")) for product in branch.products]
+        )
+
+def insert_nuclide(cursor: sqlite3.Cursor, atomic_number: int, nuclide: NuclideRecord) -> None:
+    cursor.execute(
+        "INSERT INTO nuclides (atomic_number, key, name, z, n, a, isotope_weight, stable, half_life_value, half_life_unit, half_life_qualifier, half_life_seconds) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (atomic_number, nuclide.key, nuclide.name, nuclide.protons, nuclide.neutrons, nuclide.mass_number, nuclide.isotope_weight,
+         nuclide.half_life is None, *half_life_columns(nuclide.half_life))
+    )
+    nuclide_id = cursor.lastrowid
+    insert_decays(cursor, nuclide.decays, nuclide_id, None) # type: ignore
+
+    for state in nuclide.metastable:
+        cursor.execute(
+            "INSERT INTO metastable_states (nuclide_id, label, energy_kev, half_life_value, half_life_unit, half_life_qualifier, half_life_seconds) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (nuclide_id, state.label, state.energy, *half_life_columns(state.half_life))
+        )
+        insert_decays(cursor, state.decays, nuclide_id, cursor.lastrowid) # type: ignore
+
+def compile_database(path: Path, *, dataset: Dataset | None = None, data_hash: str = "") -> Path:
+    # Written to a temporary file first, so a reader never sees a half-built database
+    if dataset is None:
+        dataset = get_dataset()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".part", dir=path.parent)
+    os.close(descriptor)
+
+    try:
+        connection = sqlite3.connect(temporary)
+        with connection:
+            cursor = connection.cursor()
+            cursor.executescript(SCHEMA)
+            for column in INDEXED_PROPERTIES:
+                cursor.execute(f'CREATE INDEX elements_{column} ON elements("{column}")')
+
+            placeholders = ", ".join("?" for _ in ELEMENT_COLUMNS)
+            columns = ", ".join(f'"{column}"' for column in ELEMENT_COLUMNS)
+            for record in dataset.records.values():
+                cursor.execute(f"INSERT INTO elements ({columns}) VALUES ({placeholders})", element_row(record))
+                for nuclide in record.isotopes:
+                    insert_nuclide(cursor, record.atomic_number, nuclide)
+
+            cursor.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", [("schema_version", str(SCHEMA_VERSION)), ("data_hash", data_hash)])
+        connection.execute("ANALYZE")
+        connection.close()
+        os.replace(temporary, path)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+    return path
+
+def database_hash(path: Path) -> str | None:
+    # The data hash a compiled database was built from, or None if it is missing, outdated or unreadable
+    try:
+        connection = connect(path)
+        try:
+            meta = dict(connection.execute("SELECT key, value FROM meta").fetchall())
+        finally:
+            connection.close()
+    except sqlite3.Error:
+        return None
+
+    if meta.get("schema_version") != str(SCHEMA_VERSION):
+        return None
+    return meta.get("data_hash")
+
+def connect(path: Path) -> sqlite3.Connection:
+    # Read-only, so ad hoc queries can't modify the compiled dataset
+    if not path.is_file():
+        raise sqlite3.OperationalError(f"No database at {path}")
+    return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+
+def run_query(connection: sqlite3.Connection, sql: str, parameters: dict[str, Any] | tuple[Any, ...] = ()) -> tuple[list[str], list[tuple[Any, ...]]]:
+    cursor = connection.execute(sql, parameters)
+    columns = [column[0] for column in cursor.description or ()]
+    return columns, cursor.fetchall()
+
+def coerce(argument: str) -> int | float | str:
+    for cast in (int, float):
+        try:
+            return cast(argument)
+        except ValueError:
+            pass
+    return argument
+
+def run_prepared(connection: sqlite3.Connection, name: str, arguments: list[str]) -> tuple[list[str], list[tuple[Any, ...]]]:
+    parameters, _, sql = PREPARED_QUERIES[name]
+    if len(arguments) != len(parameters):
+        raise ValueError(f"{name} takes {len(parameters)} argument(s): {', '.join(parameters) or 'none'}")
+    return run_query(connection, sql, {parameter: coerce(argument) for parameter, argument in zip(parameters, arguments)})
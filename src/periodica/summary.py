@@ -0,0 +1,158 @@
+import math
+from typing import Any, Collection
+from periodica.dataset import Dataset, Element, get_dataset
+from periodica.lookup import IsotopeMatch
+from periodica.compare import Comparison
+from periodica.electrons import SUBSHELL_AZIMUTHALS, SUBSHELL_PATTERN, shielding_constant, calculate_ionization_series
+
+# Plain JSON-ready views of the data, with the values the element card derives (quarks, shells, unpaired electrons,
+# Z_eff, lifetimes) computed the same way, but without any of the formatting.
+
+SHELL_NAMES = "klmnopqrstuvwxyz"
+SUBSHELL_CAPACITIES = {"s": 2, "p": 6, "d": 10, "f": 14}
+
+# The sections of the element card, in order, and the parts of an element that each of them shows
+CARD_SECTIONS = ("general", "nuclear", "physical", "electronic", "measurements")
+SECTION_CATEGORIES = {
+    "general": ("general", "historical"),
+    "nuclear": ("nuclear",),
+    "physical": ("physical",),
+    "electronic": ("electronic",),
+    "measurements": ("measurements",),
+}
+
+def quarks(protons: int, neutrons: int) -> dict[str, int]:
+    return {"up": protons * 2 + neutrons, "down": protons + neutrons * 2}
+
+def lifetime(half_life: Any) -> dict[str, Any] | None:
+    # Only numeric half-lives have a decay constant; stable and unknown ones give None
+    if not isinstance(half_life, list) or not half_life or half_life[0] <= 0:
+        return None
+
+    decay_constant = math.log(2) / half_life[0]
+    return {"unit": str(half_life[1]), "decay_constant": decay_constant, "mean_lifetime": 1 / decay_constant}
+
+def fill_orbitals(subshell_type: str, electron_count: int) -> list[int]:
+    # Hund's rule: every orbital gets one electron before any of them gets a second
+    orbitals = SUBSHELL_CAPACITIES[subshell_type] // 2
+    return [min(2, electron_count // orbitals + (1 if index < electron_count % orbitals else 0)) for index in range(orbitals)]
+
+def subshell_summary(subshells: list[str]) -> list[dict[str, Any]]:
+    summary: list[dict[str, Any]] = []
+    for subshell in subshells:
+        match = SUBSHELL_PATTERN.fullmatch(subshell)
+        if not match:
+            continue
+        principal, subshell_type, count = match.groups()
+        summary.append({
+            "subshell": principal + subshell_type,
+            "electrons": int(count),
+            "capacity": SUBSHELL_CAPACITIES[subshell_type],
+            "orbitals": fill_orbitals(subshell_type, int(count)),
+        })
+    return summary
+
+def valence_subshell(subshells: list[str], atomic_number: int, unpaired_electrons: int) -> dict[str, Any] | None:
+    match = SUBSHELL_PATTERN.fullmatch(subshells[-1]) if subshells else None
+    if not match:
+        return None
+
+    principal, subshell_type, _ = match.groups()
+    constant = shielding_constant(subshells, principal + subshell_type)
+    return {
+        "subshell": principal + subshell_type,
+        "principal": int(principal),
+        "azimuthal": SUBSHELL_AZIMUTHALS[subshell_type],
+        # Approximated, like on the card
+        "magnetic": 0,
+        "spin": "+1/2" if unpaired_electrons % 2 == 1 else "-1/2",
+        "shielding_constant": constant,
+        "effective_nuclear_charge": atomic_number - constant,
+    }
+
+def nuclide_summary(key: str, nuclide: dict[str, Any]) -> dict[str, Any]:
+    summary = {
+        "nuclide": key,
+        **nuclide,
+        "mass_number": nuclide["protons"] + nuclide["neutrons"],
+        "quarks": quarks(nuclide["protons"], nuclide["neutrons"]),
+        "lifetime": lifetime(nuclide.get("half_life")),
+    }
+    if isinstance(nuclide.get("metastable"), dict):
+        summary["metastable"] = {
+            label: {**state, "lifetime": lifetime(state.get("half_life"))}
+            for label, state in nuclide["metastable"].items()
+        }
+    return summary
+
+def element_summary(
+    element: Element, *, dataset: Dataset | None = None, isotopes: bool = True, sections: Collection[str] = CARD_SECTIONS
+) -> dict[str, Any]:
+    # Derived values are only computed for the sections asked for; like on the card, shells and subshells are nuclear
+    if dataset is None:
+        dataset = get_dataset()
+    general, nuclear, electronic = element["general"], element["nuclear"], element["electronic"]
+    derived: dict[str, Any] = {}
+
+    if "nuclear" in sections or "physical" in sections:
+        derived["mass_number"] = nuclear["protons"] + nuclear["neutrons"]
+
+    if "nuclear" in sections:
+        shells = electronic["shells"]
+        subshells = subshell_summary(electronic["subshells"])
+        unpaired_electrons = sum(1 for subshell in subshells for orbital in subshell["orbitals"] if orbital == 1)
+        derived.update({
+            "quarks": quarks(nuclear["protons"], nuclear["neutrons"]),
+            "shells": [
+                {"shell": SHELL_NAMES[index], "electrons": count, "capacity": 2 * (index + 1) ** 2}
+                for index, count in enumerate(shells)
+            ],
+            "valence_electrons": shells[-1] if shells else 0,
+            "subshells": subshells,
+            "unpaired_electrons": unpaired_electrons,
+            "magnetism": "diamagnetic" if unpaired_electrons == 0 else "paramagnetic",
+            "valence_subshell": valence_subshell(electronic["subshells"], general["atomic_number"], unpaired_electrons),
+        })
+
+    if "physical" in sections:
+        derived["lifetime"] = lifetime(general["half_life"])
+
+    if "electronic" in sections:
+        derived["ionization_series"] = [
+            step._asdict()
+            for step in calculate_ionization_series(electronic["subshells"], general["atomic_number"], electronic["ionization_energy"])
+        ]
+
+    categories = {category for section in sections for category in SECTION_CATEGORIES[section]}
+    summary = {**{key: value for key, value in element.items() if key in categories}, "derived": derived}
+    if isotopes and "nuclear" in sections:
+        summary["isotopes"] = [nuclide_summary(key, nuclide) for key, nuclide in dataset.isotopes_of(element).items()]
+    return summary
+
+def isotope_summary(match: IsotopeMatch, *, dataset: Dataset | None = None) -> dict[str, Any]:
+    # Metastable matches carry the whole ground state nuclide too, since that is where the isomer is listed
+    if dataset is None:
+        dataset = get_dataset()
+    ground = dataset.isotopes[match.fullname][match.nuclide]
+    return {
+        "isotope": match.isotope,
+        "element": match.fullname,
+        "symbol": match.symbol,
+        "isomer": match.isotope[len(match.nuclide):] or None,
+        **nuclide_summary(match.nuclide, ground),
+    }
+
+def comparison_summary(comparison: Comparison) -> dict[str, Any]:
+    present = [(name, value) for name, value in comparison.values if value is not None]
+    highest = max(present, key=lambda item: item[1]) if present else None
+    lowest = min(present, key=lambda item: item[1]) if present else None
+    return {
+        "factor": comparison.factor,
+        "unit": comparison.unit,
+        "order": comparison.order,
+        "values": [{"name": name, "value": value} for name, value in comparison.values],
+        "average": sum(value for _, value in present) / len(present) if present else None,
+        "highest": {"name": highest[0], "value": highest[1]} if highest else None,
+        "lowest": {"name": lowest[0], "value": lowest[1]} if lowest else None,
+        "missing": [name for name, value in comparison.values if value is None],
+    }
@@ -1,7 +1,7 @@
-import tomllib, sys, subprocess, time, platform
-from lib.terminal import bold, fore, RED, BLUE
+import tomllib, sys, subprocess, time, platform, json, os, functools
+from lib.terminal import bold, fore, dim, RED, BLUE
 from lib.loader import Logger, get_response, import_failsafe
-from lib.directories import PERIODICA_DIR, PYPROJECT_FILE, BUILD_SCRIPT
+from lib.directories import PERIODICA_DIR, PYPROJECT_FILE, BUILD_SCRIPT, VERSION_CHECK_FILE
 
 logger = Logger(enable_debugging=False)
 
@@ -20,7 +20,22 @@ try:
 except ImportError:
     import_failsafe()
 
+LATEST_PYPROJECT_URL = "https://raw.githubusercontent.com/Lanzoor/periodictable/main/pyproject.toml"
+
+# How long (in seconds) a remote version check stays fresh; override with PERIODICA_VERSION_TTL
+DEFAULT_VERSION_TTL = 6 * 60 * 60
+
+@functools.cache
 def fetch_toml():
+    # build.py embeds the version into lib/version.py for frozen builds, which ship without a pyproject.toml. A source
+    # checkout reads pyproject.toml instead, since a lib/version.py left by an earlier build goes stale on a version bump.
+    if getattr(sys, "frozen", False) or not PYPROJECT_FILE.is_file():
+        try:
+            from lib.version import VERSION # type: ignore
+            return VERSION
+        except ImportError:
+            pass
+
     try:
         with open(PYPROJECT_FILE, "rb") as f:
             toml_data = tomllib.load(f)
@@ -38,14 +53,42 @@ def fetch_toml():
 
     return local_version
 
-def update_main():
-    logger.info("Update program initialized.")
-
-    local_version = fetch_toml()
-    url = "https://raw.githubusercontent.com/Lanzoor/periodictable/main/pyproject.toml"
-    print(f"Getting content from {url}...")
+def get_version_ttl() -> int:
+    try:
+        return int(os.environ.get("PERIODICA_VERSION_TTL", DEFAULT_VERSION_TTL))
+    except ValueError:
+        logger.warn("PERIODICA_VERSION_TTL is not a whole number of seconds; using the default.")
+        return DEFAULT_VERSION_TTL
 
-    response = get_response(url)
+def load_version_check(ttl: int | None = None) -> str | None:
+    ttl = get_version_ttl() if ttl is None else ttl
+    try:
+        with open(VERSION_CHECK_FILE, "r", encoding="utf-8") as file:
+            record = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+    if not isinstance(record, dict) or not isinstance(record.get("latest"), str):
+        return None
+    if not isinstance(record.get("checked_at"), (int, float)) or isinstance(record["checked_at"], bool):
+        return None
+    if time.time() - record["checked_at"] > ttl:
+        return None
+    return record["latest"]
+
+def save_version_check(latest_version: str) -> None:
+    with open(VERSION_CHECK_FILE, "w", encoding="utf-8") as file:
+        json.dump({"latest": latest_version, "checked_at": time.time()}, file)
+
+def fetch_latest_version() -> str:
+    cached_version = load_version_check()
+    if cached_version:
+        print(dim(f"Using the result of the last version check (it is refreshed every {get_version_ttl()} seconds)."))
+        logger.info(f"Remote version check served from cache: {cached_version}")
+        return cached_version
+
+    print(f"Getting content from {LATEST_PYPROJECT_URL}...")
+    response = get_response(LATEST_PYPROJECT_URL, cache=True)
     lts_toml = tomllib.loads(response.text) # type: ignore
     lts_version = lts_toml.get("project", {}).get("version")
 
@@ -53,6 +96,15 @@ def update_main():
         print("Failed to get latest version info.")
         logger.abort("Failed to get latest version info.")
 
+    save_version_check(lts_version)
+    return lts_version
+
+def update_main():
+    logger.info("Update program initialized.")
+
+    local_version = fetch_toml()
+    lts_version = fetch_latest_version()
+
     print(f"Local version: {local_version}")
     print(f"Latest version: {lts_version}")
     logger.info(f"Local: {local_version}, latest: {lts_version}")
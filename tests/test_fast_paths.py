@@ -0,0 +1,40 @@
+import sys, subprocess
+from pathlib import Path
+
+import pytest
+
+SOURCE_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SOURCE_DIR))
+
+from lib.directories import MAIN_SCRIPT, ELEMENT_DATA_FILE, ISOTOPE_DATA_FILE
+
+# Commands that never show element data must not touch the data files at all
+FAST_PATH_COMMANDS = [["--version"], ["--info"]]
+
+# Runs main.py with an audit hook that reports every file it opens
+PROBE = (
+    "import sys, runpy, atexit\n"
+    "opened = []\n"
+    "sys.addaudithook(lambda event, args: opened.append(str(args[0])) if event == 'open' and not isinstance(args[0], int) else None)\n"
+    "atexit.register(lambda: sys.stderr.write(''.join(f'\\nOPENED {path}' for path in opened)))\n"
+    "sys.path.insert(0, sys.argv[1])\n"
+    "sys.argv = sys.argv[2:]\n"
+    "runpy.run_path(sys.argv[0], run_name='__main__')\n"
+)
+
+def opened_files(arguments: list[str]) -> list[str]:
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE, str(MAIN_SCRIPT.parent), str(MAIN_SCRIPT), *arguments],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, stdin=subprocess.DEVNULL, text=True, check=False, timeout=60
+    )
+    return [line[len("OPENED "):] for line in completed.stderr.splitlines() if line.startswith("OPENED ")]
+
+@pytest.mark.parametrize("command", FAST_PATH_COMMANDS, ids=lambda command: " ".join(command))
+def test_fast_path_opens_no_data_files(command: list[str]):
+    opened = opened_files(command)
+    assert opened, "the audit hook saw no files at all, so the probe itself is broken"
+    assert not {str(ELEMENT_DATA_FILE), str(ISOTOPE_DATA_FILE)} & set(opened)
+
+def test_element_lookup_opens_data_files():
+    # Makes sure the probe actually catches the data files being read
+    assert str(ELEMENT_DATA_FILE) in opened_files(["--raw", "hydrogen"])
@@ -0,0 +1,71 @@
+import sys, time, threading, http.server
+from pathlib import Path
+
+import pytest
+
+SOURCE_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SOURCE_DIR))
+
+import lib.loader as loader
+
+class MockHandler(http.server.BaseHTTPRequestHandler):
+    # Each request pops the next (status, headers, body, delay) off the server's script
+    def do_GET(self):
+        status, headers, body, delay = self.server.script.pop(0) # type: ignore
+        self.server.seen.append(dict(self.headers)) # type: ignore
+        time.sleep(delay)
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *arguments):
+        pass
+
+class MockServer(http.server.ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        # Clients that time out close the connection mid-response; that is expected here
+        pass
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(loader, "HTTP_CACHE_DIR", tmp_path / "http_cache")
+    monkeypatch.setattr(loader, "ensure_runtime_dir", lambda: tmp_path)
+    monkeypatch.setattr(loader, "RETRY_BACKOFF", 0.01)
+    monkeypatch.setattr(loader, "RETRY_JITTER", 0)
+    monkeypatch.setattr(loader, "http_session", None)
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+
+    mock = MockServer(("127.0.0.1", 0), MockHandler)
+    mock.script, mock.seen = [], [] # type: ignore
+    mock.url = f"http://127.0.0.1:{mock.server_address[1]}/data" # type: ignore
+    threading.Thread(target=mock.serve_forever, daemon=True).start()
+    yield mock
+    mock.shutdown()
+    mock.server_close()
+
+def test_retries_unavailable_responses(server):
+    server.script[:] = [(503, {}, b"", 0), (503, {}, b"", 0), (200, {}, b"ok", 0)]
+    assert loader.get_response(server.url).text == "ok"
+    assert len(server.seen) == 3
+
+def test_revalidates_and_serves_the_cached_body(server):
+    server.script[:] = [(200, {"ETag": '"v1"'}, b"first", 0), (304, {"ETag": '"v1"'}, b"", 0)]
+    assert loader.get_response(server.url, cache=True).text == "first"
+
+    response = loader.get_response(server.url, cache=True)
+    assert response.status_code == 304
+    assert response.text == "first"
+    assert server.seen[1].get("If-None-Match") == '"v1"'
+
+def test_not_modified_without_a_cache_entry_fails(server):
+    server.script[:] = [(304, {}, b"", 0)]
+    with pytest.raises(SystemExit):
+        loader.get_response(server.url, cache=True)
+
+def test_slow_responses_time_out(server):
+    server.script[:] = [(200, {}, b"late", 0.5)] * (loader.MAX_RETRIES + 1)
+    with pytest.raises(SystemExit):
+        loader.get_response(server.url, timeout=(1, 0.1))
@@ -0,0 +1,23 @@
+import sys, json, subprocess
+from pathlib import Path
+
+SOURCE_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SOURCE_DIR))
+
+from lib.directories import MAIN_SCRIPT
+
+def run(*arguments: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(MAIN_SCRIPT), *arguments],
+        capture_output=True, stdin=subprocess.DEVNULL, text=True, check=False, timeout=60
+    )
+
+def test_profile_report_keeps_json_output_parseable():
+    completed = run("--json", "--profile", "lithium")
+    assert json.loads(completed.stdout)
+    assert "Total" in completed.stderr
+
+def test_profile_report_is_plain_under_raw():
+    completed = run("--raw", "--profile", "lithium")
+    assert "Total" in completed.stderr
+    assert "\033[" not in completed.stderr
@@ -0,0 +1,87 @@
+import sys, threading, functools, http.server
+from pathlib import Path
+
+import pytest
+
+SOURCE_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SOURCE_DIR))
+
+import lib.refresh as refresh
+from lib.directories import ELEMENT_DATA_FILE, ISOTOPE_DATA_FILE
+
+class TruncatingHandler(http.server.BaseHTTPRequestHandler):
+    # Promises more bytes than it sends, so the stream breaks partway through the body
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "1000000")
+        self.end_headers()
+        self.wfile.write(b"{" * 1000)
+        self.wfile.flush()
+        self.close_connection = True
+
+    def log_message(self, *arguments):
+        pass
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *arguments):
+        pass
+
+@pytest.fixture
+def serve():
+    servers: list[http.server.ThreadingHTTPServer] = []
+
+    def start(handler) -> str:
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+@pytest.fixture
+def local(tmp_path, monkeypatch):
+    targets = {"elements.json": tmp_path / "elements.json", "isotopes.json": tmp_path / "isotopes.json"}
+    monkeypatch.setattr(refresh, "data_targets", lambda: targets)
+    monkeypatch.setattr(refresh, "REFRESH_STATE_FILE", tmp_path / "refresh.json")
+    monkeypatch.setattr(refresh, "remember_valid", lambda data_hash: None)
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    return tmp_path
+
+@pytest.fixture
+def mirror(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("mirror")
+    for source in (ELEMENT_DATA_FILE, ISOTOPE_DATA_FILE):
+        (directory / source.name).write_bytes(source.read_bytes())
+    return directory
+
+def part_files(directory: Path) -> list[Path]:
+    return list(directory.glob("*.part"))
+
+def test_downloads_then_skips_unchanged_files(local, mirror, serve):
+    url = serve(functools.partial(QuietHandler, directory=str(mirror)))
+
+    *_, statuses = refresh.refresh_data(url)
+    assert statuses == {"elements.json": "updated", "isotopes.json": "updated"}
+    assert (local / "elements.json").read_bytes() == (mirror / "elements.json").read_bytes()
+
+    *_, statuses = refresh.refresh_data(url)
+    assert statuses == {"elements.json": "unchanged", "isotopes.json": "unchanged"}
+    assert not part_files(local)
+
+def test_broken_stream_leaves_no_partial_files(local, serve):
+    url = serve(TruncatingHandler)
+
+    with pytest.raises(refresh.RefreshError):
+        refresh.refresh_data(url)
+    assert not part_files(local)
+    assert not (local / "elements.json").exists()
+
+def test_missing_files_are_reported(local, tmp_path_factory, serve):
+    url = serve(functools.partial(QuietHandler, directory=str(tmp_path_factory.mktemp("empty"))))
+
+    with pytest.raises(refresh.RefreshError, match="404"):
+        refresh.refresh_data(url)
+    assert not part_files(local)
@@ -0,0 +1,34 @@
+import sys, json, asyncio
+from pathlib import Path
+
+SOURCE_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SOURCE_DIR))
+
+from periodica.server import ApiServer, MAX_BODY
+
+async def exchange(request: bytes) -> tuple[int, dict]:
+    api = ApiServer()
+    server = await asyncio.start_server(api.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+def test_element_lookup():
+    status, body = asyncio.run(exchange(b"GET /elements/h HTTP/1.1\r\nConnection: close\r\n\r\n"))
+    assert status == 200
+    assert body["general"]["symbol"] == "H"
+
+def test_oversized_header_gets_a_bad_request():
+    status, body = asyncio.run(exchange(b"GET /elements/h HTTP/1.1\r\nX-Padding: " + b"a" * 100_000 + b"\r\n\r\n"))
+    assert status == 400
+
+def test_oversized_body_is_refused_unread():
+    status, _ = asyncio.run(exchange(f"GET /elements/h HTTP/1.1\r\nContent-Length: {MAX_BODY + 1}\r\n\r\n".encode("latin-1")))
+    assert status == 413